@@ -0,0 +1,40 @@
+"""add push_dead_letters table
+
+Revision ID: 4e8a1d2b7c90
+Revises: c6dea675742f
+Create Date: 2026-10-19 10:12:31.480122
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e8a1d2b7c90'
+down_revision: Union[str, Sequence[str], None] = 'c6dea675742f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('push_dead_letters',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('subscription_id', sa.Integer(), nullable=True),
+    sa.Column('endpoint', sa.String(), nullable=False),
+    sa.Column('payload', sa.Text(), nullable=False),
+    sa.Column('last_status', sa.Integer(), nullable=True),
+    sa.Column('error', sa.String(), nullable=True),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_push_dead_letters_id'), 'push_dead_letters', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_push_dead_letters_id'), table_name='push_dead_letters')
+    op.drop_table('push_dead_letters')
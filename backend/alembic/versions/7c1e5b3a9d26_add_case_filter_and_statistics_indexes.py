@@ -0,0 +1,53 @@
+"""add case filter / statistics indexes
+
+Revision ID: 7c1e5b3a9d26
+Revises: d2a7c4e9f013
+Create Date: 2026-10-19 16:40:31.207815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e5b3a9d26'
+down_revision: Union[str, Sequence[str], None] = 'd2a7c4e9f013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_cs_cases_created_at', 'cs_cases', [sa.text('created_at DESC')], unique=False)
+    op.create_index('ix_cs_cases_status_created', 'cs_cases', ['status', sa.text('created_at DESC')], unique=False)
+    op.create_index('ix_cs_cases_product_created', 'cs_cases', ['product_id', sa.text('created_at DESC')], unique=False)
+    op.create_index('ix_cs_cases_requester_created', 'cs_cases', ['requester', sa.text('created_at DESC')], unique=False)
+    op.create_index(
+        'ix_cs_cases_pending_created',
+        'cs_cases',
+        ['created_at'],
+        unique=False,
+        postgresql_where=sa.text("status <> 'DONE'"),
+    )
+    op.create_index('ix_case_assignees_user_case', 'case_assignees', ['user_id', 'case_id'], unique=False)
+    op.create_index(
+        'ix_notifications_case_type_created',
+        'notifications',
+        ['case_id', 'type', 'created_at'],
+        unique=False,
+    )
+    op.create_index('ix_case_stat_daily_assignee_day', 'case_stat_daily', ['assignee_id', 'day'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_case_stat_daily_assignee_day', table_name='case_stat_daily')
+    op.drop_index('ix_notifications_case_type_created', table_name='notifications')
+    op.drop_index('ix_case_assignees_user_case', table_name='case_assignees')
+    op.drop_index('ix_cs_cases_pending_created', table_name='cs_cases')
+    op.drop_index('ix_cs_cases_requester_created', table_name='cs_cases')
+    op.drop_index('ix_cs_cases_product_created', table_name='cs_cases')
+    op.drop_index('ix_cs_cases_status_created', table_name='cs_cases')
+    op.drop_index('ix_cs_cases_created_at', table_name='cs_cases')
@@ -0,0 +1,33 @@
+"""add notifications (user_id, is_read, created_at desc) index
+
+Revision ID: 9b3f6e21c4d7
+Revises: 4e8a1d2b7c90
+Create Date: 2026-10-19 11:04:52.913377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b3f6e21c4d7'
+down_revision: Union[str, Sequence[str], None] = '4e8a1d2b7c90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_notifications_user_read_created',
+        'notifications',
+        ['user_id', 'is_read', sa.text('created_at DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_notifications_user_read_created', table_name='notifications')
@@ -0,0 +1,73 @@
+"""add case_stat_daily rollup table
+
+Revision ID: d2a7c4e9f013
+Revises: 9b3f6e21c4d7
+Create Date: 2026-10-19 14:22:07.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a7c4e9f013'
+down_revision: Union[str, Sequence[str], None] = '9b3f6e21c4d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_AGGREGATES = """
+    sum(CASE WHEN cs_cases.status = 'OPEN' THEN 1 ELSE 0 END),
+    sum(CASE WHEN cs_cases.status = 'IN_PROGRESS' THEN 1 ELSE 0 END),
+    sum(CASE WHEN cs_cases.status = 'DONE' THEN 1 ELSE 0 END),
+    sum(CASE WHEN cs_cases.status = 'CANCEL' THEN 1 ELSE 0 END),
+    coalesce(sum(CASE WHEN cs_cases.status = 'DONE' AND cs_cases.completed_at IS NOT NULL
+        THEN EXTRACT(epoch FROM cs_cases.completed_at) - EXTRACT(epoch FROM cs_cases.created_at)
+        ELSE 0 END), 0),
+    sum(CASE WHEN cs_cases.status = 'DONE' AND cs_cases.completed_at IS NOT NULL THEN 1 ELSE 0 END)
+"""
+
+# Mirrors services.stat_rollups.rebuild(); ALL_ASSIGNEES rows use assignee_id 0
+_BACKFILL = f"""
+INSERT INTO case_stat_daily (
+    day, assignee_id, open_count, in_progress_count, done_count, cancel_count,
+    resolution_seconds, resolved_count
+)
+SELECT CAST(cs_cases.created_at AS DATE), 0, {_AGGREGATES}
+FROM cs_cases
+WHERE cs_cases.created_at IS NOT NULL
+GROUP BY CAST(cs_cases.created_at AS DATE)
+UNION ALL
+SELECT CAST(cs_cases.created_at AS DATE), case_assignees.user_id, {_AGGREGATES}
+FROM cs_cases JOIN case_assignees ON case_assignees.case_id = cs_cases.id
+WHERE cs_cases.created_at IS NOT NULL
+GROUP BY CAST(cs_cases.created_at AS DATE), case_assignees.user_id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Backfills from cs_cases with the same INSERT .. SELECT as
+    stat_rollups.rebuild(), so deltas recorded after the upgrade land on
+    complete rows.
+    """
+    op.create_table('case_stat_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('assignee_id', sa.Integer(), nullable=False),
+    sa.Column('open_count', sa.Integer(), nullable=False),
+    sa.Column('in_progress_count', sa.Integer(), nullable=False),
+    sa.Column('done_count', sa.Integer(), nullable=False),
+    sa.Column('cancel_count', sa.Integer(), nullable=False),
+    sa.Column('resolution_seconds', sa.Float(), nullable=False),
+    sa.Column('resolved_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'assignee_id')
+    )
+    op.execute(_BACKFILL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('case_stat_daily')
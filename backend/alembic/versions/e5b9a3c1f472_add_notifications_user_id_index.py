@@ -0,0 +1,33 @@
+"""add notifications (user_id, id desc) index
+
+Revision ID: e5b9a3c1f472
+Revises: 7c1e5b3a9d26
+Create Date: 2026-10-19 18:12:07.540219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b9a3c1f472'
+down_revision: Union[str, Sequence[str], None] = '7c1e5b3a9d26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_notifications_user_id',
+        'notifications',
+        ['user_id', sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_notifications_user_id', table_name='notifications')
@@ -22,6 +22,12 @@ celery = Celery(
 celery.conf.update(
     result_expires=3600,
     timezone="Asia/Seoul",
+    # Web Push 전송은 별도 큐 — 느린 push 서비스가 알림/유사도 태스크를 막지 않도록
+    task_routes={
+        "tasks.deliver_push_batch": {"queue": "push"},
+        "tasks.retry_push_jobs": {"queue": "push"},
+        "tasks.flush_push_digest": {"queue": "push"},
+    },
     beat_schedule={
         "check-pending-cases-every-hour": {
             "task": "tasks.check_pending_cases",
@@ -35,5 +41,13 @@ celery.conf.update(
             "task": "tasks.cleanup_tag_keywords",
             "schedule": crontab(hour=4, minute=0, day_of_week=0),
         },
+        "purge-read-notifications-daily": {
+            "task": "tasks.purge_read_notifications",
+            "schedule": crontab(hour=4, minute=30),
+        },
+        "rebuild-case-stat-rollups-daily": {
+            "task": "tasks.rebuild_case_stat_rollups",
+            "schedule": crontab(hour=4, minute=45),
+        },
     },
 )
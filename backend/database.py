@@ -1,22 +1,201 @@
 import os
+import threading
+import time
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
 
 load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+# Optional read replica; read sessions fall back to the primary when unset
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+# After a write, that user's reads stay on the primary this long (replica lag cover)
+READ_AFTER_WRITE_SECONDS = int(os.getenv("READ_AFTER_WRITE_SECONDS", "5"))
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long checkouts wait for a free connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except sa_exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self.checkouts += 1
+                self.wait_seconds_total += waited
+                self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "size": self.size(),
+                "checked_out": self.checkedout(),
+                "checked_in": self.checkedin(),
+                "overflow": self.overflow(),
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_avg": round(self.wait_seconds_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "wait_ms_max": round(self.wait_seconds_max * 1000, 3),
+            }
+
+
+class InstrumentedAsyncQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """InstrumentedQueuePool for asyncio engines."""
+
+
+def _setting(role: str, name: str, default: str) -> str:
+    """DB_<ROLE>_<NAME> overrides DB_<NAME>, which overrides the default."""
+    return os.getenv(f"DB_{role}_{name}", os.getenv(f"DB_{name}", default))
+
+
+def _pool_options(role: str, pool_size: int, max_overflow: int) -> dict:
+    return {
+        "pool_size": int(_setting(role, "POOL_SIZE", str(pool_size))),
+        "max_overflow": int(_setting(role, "MAX_OVERFLOW", str(max_overflow))),
+        "pool_timeout": float(_setting(role, "POOL_TIMEOUT", "30")),
+        "pool_recycle": int(_setting(role, "POOL_RECYCLE", "1800")),
+        "pool_pre_ping": _setting(role, "POOL_PRE_PING", "true").lower() in ("1", "true", "yes"),
+    }
+
+
+def make_engine(url: str, role: str, pool_size: int = 5, max_overflow: int = 10) -> Engine:
+    """Build an engine whose pool/timeouts come from the environment for role (API/CELERY/READ)."""
+    connect_args = {}
+    statement_timeout_ms = int(_setting(role, "STATEMENT_TIMEOUT_MS", "0"))
+    if statement_timeout_ms and make_url(url).get_backend_name() == "postgresql":
+        connect_args["options"] = f"-c statement_timeout={statement_timeout_ms}"
+
+    return create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        connect_args=connect_args,
+        **_pool_options(role, pool_size, max_overflow),
+    )
+
+
+def async_url(url: str):
+    """Same database as url, through the asyncpg driver for PostgreSQL."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "postgresql":
+        parsed = parsed.set(drivername="postgresql+asyncpg")
+    return parsed
+
+
+def make_async_engine(url: str, role: str, pool_size: int = 5, max_overflow: int = 10) -> AsyncEngine:
+    """make_engine for async def endpoints (asyncpg); same DB_* settings per role."""
+    url = async_url(url)
+    connect_args = {}
+    statement_timeout_ms = int(_setting(role, "STATEMENT_TIMEOUT_MS", "0"))
+    if statement_timeout_ms and url.get_backend_name() == "postgresql":
+        connect_args["server_settings"] = {"statement_timeout": str(statement_timeout_ms)}
+
+    return create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncQueuePool,
+        connect_args=connect_args,
+        **_pool_options(role, pool_size, max_overflow),
+    )
+
+
+# API workers, Celery workers and replica reads get separate pools so they
+# don't contend for the same connections. Pools open connections lazily, so
+# unused engines (e.g. the Celery one inside an API worker) cost nothing.
+engine = make_engine(DATABASE_URL, "API")
+celery_engine = make_engine(DATABASE_URL, "CELERY", pool_size=2, max_overflow=3)
+read_engine = make_engine(DATABASE_READ_URL, "READ") if DATABASE_READ_URL else engine
+# async def endpoints wait on the event loop instead of holding a threadpool slot
+async_engine = make_async_engine(DATABASE_URL, "ASYNC")
+async_read_engine = make_async_engine(DATABASE_READ_URL, "ASYNC_READ") if DATABASE_READ_URL else async_engine
 
-engine = create_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+CelerySessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=celery_engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
 
+def pool_stats() -> dict:
+    """Connection pool metrics of this process's engines.
+
+    The Celery engine is left out: workers run in their own processes, so this
+    process's copy of it is never checked out.
+    """
+    engines = {"api": engine, "async": async_engine.sync_engine}
+    if read_engine is not engine:
+        engines["read"] = read_engine
+        engines["async_read"] = async_read_engine.sync_engine
+    return {role: eng.pool.stats() for role, eng in engines.items()}
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def replica_enabled() -> bool:
+    return read_engine is not engine
+
+
+def _wrote_recently(request) -> bool:
+    from routers.auth import user_id_from_request
+    from services.cache import has_recent_write
+
+    user_id = user_id_from_request(request)
+    return user_id is not None and has_recent_write(user_id)
+
+
+def get_read_db(request: Request):
+    """Session for read-only endpoints.
+
+    Uses the replica, except for a user who wrote within READ_AFTER_WRITE_SECONDS
+    (see main.track_writes), who keeps reading from the primary.
+    """
+    factory = ReadSessionLocal
+    if replica_enabled() and _wrote_recently(request):
+        factory = SessionLocal
+    db = factory()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request):
+    """get_read_db for async def endpoints (the Redis lookup runs off the event loop)."""
+    factory = AsyncReadSessionLocal
+    if replica_enabled() and await run_in_threadpool(_wrote_recently, request):
+        factory = AsyncSessionLocal
+    async with factory() as db:
+        yield db
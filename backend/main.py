@@ -2,10 +2,14 @@
 FastAPI 앱 엔트리포인트.
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
+from database import READ_AFTER_WRITE_SECONDS, replica_enabled
 from routers import admin, auth, cases, checklists, comments, licenses, memos, notifications, products, push, quote_requests, tags
+from routers.auth import user_id_from_request
+from services.cache import mark_recent_write
 
 app = FastAPI(title="CS Dashboard API", version="1.0.4")
 
@@ -21,6 +25,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+def _mark_write(request: Request):
+    user_id = user_id_from_request(request)
+    if user_id is not None:
+        mark_recent_write(user_id, READ_AFTER_WRITE_SECONDS)
+
+
+# Read-your-writes: after a successful mutation, pin the user's reads to the primary
+# for READ_AFTER_WRITE_SECONDS so replica lag never hides their own change.
+# JWT decoding and the (sync) Redis call run in the threadpool, off the event loop.
+@app.middleware("http")
+async def track_writes(request: Request, call_next):
+    response = await call_next(request)
+    if (
+        replica_enabled()
+        and request.method not in ("GET", "HEAD", "OPTIONS")
+        and response.status_code < 400
+    ):
+        await run_in_threadpool(_mark_write, request)
+    return response
+
+
 # 라우터 등록
 app.include_router(auth.router)
 app.include_router(admin.router)
@@ -5,15 +5,19 @@ from sqlalchemy import (
     ARRAY,
     Boolean,
     Column,
+    Date,
     DateTime,
     Enum as SQLEnum,
+    Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
@@ -144,6 +148,8 @@ case_assignees = Table(
     Base.metadata,
     Column("case_id", Integer, ForeignKey("cs_cases.id", ondelete="CASCADE"), primary_key=True),
     Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    # PK leads with case_id; "cases assigned to user X" needs user_id first
+    Index("ix_case_assignees_user_case", "user_id", "case_id"),
 )
 
 
@@ -167,6 +173,16 @@ class CSCase(Base):
     completed_at = Column(DateTime, nullable=True)
     canceled_at = Column(DateTime, nullable=True)
 
+    __table_args__ = (
+        # list_cases: newest first, optionally filtered by status / product / requester
+        Index("ix_cs_cases_created_at", created_at.desc()),
+        Index("ix_cs_cases_status_created", status, created_at.desc()),
+        Index("ix_cs_cases_product_created", product_id, created_at.desc()),
+        Index("ix_cs_cases_requester_created", requester, created_at.desc()),
+        # check_pending_cases: not-DONE cases older than the reminder threshold
+        Index("ix_cs_cases_pending_created", created_at, postgresql_where=text("status <> 'DONE'")),
+    )
+
     assignee = relationship("User", back_populates="assigned_cases")
     assignees = relationship("User", secondary=case_assignees, backref="multi_assigned_cases")
     product = relationship("Product")
@@ -184,6 +200,29 @@ class CSCase(Base):
         return [u.name for u in self.assignees] if self.assignees else []
 
 
+class CaseStatDaily(Base):
+    """Daily case rollup by created_at date, maintained by services.stat_rollups.
+
+    assignee_id 0 is the all-cases row (unassigned cases included).
+    """
+
+    __tablename__ = "case_stat_daily"
+
+    day = Column(Date, primary_key=True)
+    assignee_id = Column(Integer, primary_key=True)
+    open_count = Column(Integer, nullable=False, default=0)
+    in_progress_count = Column(Integer, nullable=False, default=0)
+    done_count = Column(Integer, nullable=False, default=0)
+    cancel_count = Column(Integer, nullable=False, default=0)
+    resolution_seconds = Column(Float, nullable=False, default=0)  # DONE cases: completed_at - created_at
+    resolved_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # stat_by_status for one assignee over a day range (PK leads with day)
+        Index("ix_case_stat_daily_assignee_day", assignee_id, day),
+    )
+
+
 class Comment(Base):
     __tablename__ = "comments"
 
@@ -230,6 +269,15 @@ class Notification(Base):
     type = Column(SQLEnum(NotificationType), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Per-user listing (id-keyset pagination)
+        Index("ix_notifications_user_id", user_id, id.desc()),
+        # Unread count; retention purge
+        Index("ix_notifications_user_read_created", user_id, is_read, created_at.desc()),
+        # check_pending_cases "reminded recently" anti-join; case delete cascade
+        Index("ix_notifications_case_type_created", case_id, type, created_at),
+    )
+
     user = relationship("User", back_populates="notifications")
     case = relationship("CSCase", back_populates="notifications")
     quote_request = relationship("QuoteRequest")
@@ -250,6 +298,21 @@ class PushSubscription(Base):
     user = relationship("User", back_populates="push_subscriptions")
 
 
+class PushDeadLetter(Base):
+    """Push that still failed after all retries (kept for inspection/replay)."""
+
+    __tablename__ = "push_dead_letters"
+
+    id = Column(Integer, primary_key=True, index=True)
+    subscription_id = Column(Integer, nullable=True)  # subscription may be gone by now
+    endpoint = Column(String, nullable=False)
+    payload = Column(Text, nullable=False)
+    last_status = Column(Integer, nullable=True)
+    error = Column(String, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
 class TagMaster(Base):
     """Tag registry for auto-complete, suggestions, and keyword learning."""
 
@@ -7,9 +7,11 @@ from math import ceil
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
-from database import get_db
+from database import get_db, pool_stats
 from models import User, UserRole
 from routers.auth import get_current_user, pwd_context, require_role
+from services import user_cache
+from services.cache import bump_stats_version
 from validators import validate_password
 from schemas import (
     PasswordReset,
@@ -141,6 +143,7 @@ def update_user(
             )
 
     # Update fields
+    renamed = data.name is not None and data.name != user.name
     if data.name is not None:
         user.name = data.name
     if data.email is not None:
@@ -154,6 +157,9 @@ def update_user(
 
     db.commit()
     db.refresh(user)
+    user_cache.invalidate_user(user.id)
+    if renamed:
+        bump_stats_version()  # assignee names / my-progress requester match
 
     return user
 
@@ -181,6 +187,7 @@ def delete_user(
 
     user.is_active = False
     db.commit()
+    user_cache.invalidate_user(user.id)
 
 
 @router.post("/users/{user_id}/reset-password", status_code=status.HTTP_204_NO_CONTENT)
@@ -203,3 +210,10 @@ def reset_password(
 
     user.password_hash = pwd_context.hash(data.new_password)
     db.commit()
+    user_cache.invalidate_user(user.id)
+
+
+@router.get("/db-pool")
+def get_db_pool_stats(_: User = Depends(require_role(UserRole.ADMIN))):
+    """Connection pool metrics (checked-out, overflow, checkout wait) per engine."""
+    return pool_stats()
@@ -6,15 +6,19 @@ import os
 from datetime import datetime, timedelta
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from passlib.context import CryptContext
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from database import get_db
+from database import get_async_db, get_db
 from models import User
 from schemas import LoginRequest, PasswordChange, TokenResponse, UserRead
+from services import passwords, user_cache
+from services.passwords import pwd_context  # noqa: F401 — re-exported for admin/tests
 from validators import validate_password
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
@@ -23,7 +27,6 @@ SECRET_KEY = os.getenv("SECRET_KEY", "change-this-to-a-random-secret-key")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 480  # 8시간
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
@@ -34,30 +37,72 @@ def create_access_token(data: dict) -> str:
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-) -> User:
-    credentials_exception = HTTPException(
+def user_id_from_request(request: Request) -> int | None:
+    """User id from the bearer token without touching the DB (None if absent/invalid)."""
+    auth = request.headers.get("Authorization", "")
+    scheme, _, token = auth.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return int(jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM]).get("sub"))
+    except (JWTError, TypeError, ValueError):
+        return None
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _decode_user_id(token: str) -> int:
+    """User id (sub) of a valid JWT access token, raising 401 otherwise."""
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         sub = payload.get("sub")
         if sub is None:
-            raise credentials_exception
+            raise _credentials_exception()
         try:
-            user_id = int(sub)
+            return int(sub)
         except (ValueError, TypeError):
-            raise credentials_exception
+            raise _credentials_exception()
     except JWTError:
-        raise credentials_exception
+        raise _credentials_exception()
 
-    user = db.query(User).filter(User.id == user_id).first()
+
+def get_user_from_token(token: str, db: Session) -> User:
+    """Resolve a JWT access token to its User, raising 401 if invalid."""
+    user_id = _decode_user_id(token)
+    user = user_cache.get_cached_user(db, user_id)
     if user is None:
-        raise credentials_exception
+        user = db.query(User).filter(User.id == user_id).first()
+        if user is None:
+            raise _credentials_exception()
+        user_cache.remember_user(user)
+    return user
+
+
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> User:
+    return get_user_from_token(token, db)
+
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """get_current_user for async def endpoints (AsyncSession, no threadpool hop)."""
+    user_id = _decode_user_id(token)
+    user = await user_cache.get_cached_user_async(db, user_id)
+    if user is None:
+        user = await db.scalar(select(User).where(User.id == user_id))
+        if user is None:
+            raise _credentials_exception()
+        user_cache.remember_user(user)
     return user
 
 
@@ -73,34 +118,49 @@ def require_role(*roles):
     return role_checker
 
 
+def _save_password_hash(db: Session, user: User, password_hash: str):
+    user.password_hash = password_hash
+    db.commit()
+
+
 @router.post("/login", response_model=TokenResponse)
-def login(data: LoginRequest, db: Session = Depends(get_db)):
-    """Authenticate user and return JWT access token."""
-    user = db.query(User).filter(User.email == data.email).first()
-    if not user or not pwd_context.verify(data.password, user.password_hash):
+async def login(data: LoginRequest, db: Session = Depends(get_db)):
+    """Authenticate user and return JWT access token.
+
+    bcrypt runs on the password executor; DB work stays on the threadpool.
+    """
+    user = await run_in_threadpool(lambda: db.query(User).filter(User.email == data.email).first())
+    valid, new_hash = (
+        await passwords.verify_and_update(data.password, user.password_hash) if user else (False, None)
+    )
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
         )
+    if new_hash:
+        # Stored hash used another BCRYPT_ROUNDS — upgrade it transparently
+        await run_in_threadpool(_save_password_hash, db, user, new_hash)
     access_token = create_access_token(data={"sub": str(user.id)})
     return TokenResponse(access_token=access_token)
 
 
 @router.get("/me", response_model=UserRead)
-def get_me(current_user: User = Depends(get_current_user)):
+async def get_me(current_user: User = Depends(get_current_user_async)):
     """Get current authenticated user's profile."""
     return current_user
 
 
 @router.post("/change-password", status_code=status.HTTP_204_NO_CONTENT)
-def change_password(
+async def change_password(
     data: PasswordChange,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Change current user's password."""
-    # Verify current password
-    if not pwd_context.verify(data.current_password, current_user.password_hash):
+    # Verify current password (password_hash may lazy-load for a cached user)
+    stored_hash = await run_in_threadpool(lambda: current_user.password_hash)
+    if not await passwords.verify(data.current_password, stored_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
@@ -110,8 +170,9 @@ def change_password(
     validate_password(data.new_password)
 
     # Update password
-    current_user.password_hash = pwd_context.hash(data.new_password)
-    db.commit()
+    new_hash = await passwords.hash_password(data.new_password)
+    await run_in_threadpool(_save_password_hash, db, current_user, new_hash)
+    user_cache.invalidate_user(current_user.id)
 
 
 @router.get("/users/assignees", response_model=List[UserRead])
@@ -2,33 +2,73 @@
 CS Case CRUD 라우터.
 """
 
+from collections import defaultdict
 from datetime import date, datetime
 from math import ceil
 from typing import List, Optional, Union
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import or_
-from sqlalchemy.orm import Session, joinedload
-
-from database import get_db
-from models import CaseStatus, CSCase, User, UserRole
-from routers.auth import get_current_user
+from fastapi.responses import StreamingResponse
+from sqlalchemy import String, all_, cast, delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, array
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from database import get_async_db, get_async_read_db, get_db, get_read_db
+from models import CaseStatus, CSCase, User, UserRole, case_assignees
+from routers.auth import get_current_user, get_current_user_async
 from schemas import (
-    CaseCreate, CaseRead, CaseListResponse, CaseStatusUpdate, CaseSimilarRead, CaseUpdate,
-    MyProgress, StatByAssignee, StatByStatus, StatByTime,
+    CaseBulkResult, CaseBulkUpdate, CaseCreate, CaseRead, CaseListResponse, CaseStatusUpdate, CaseSimilarRead,
+    CaseUpdate,
+    MyProgress, StatByAssignee, StatByStatus, StatByTime, StatResolutionPercentiles, StatSeriesPoint,
+)
+from services.cache import bump_stats_version
+from services.export import EXPORT_FORMATS, stream_export
+from services.case_filters import case_filters
+from services.stat_rollups import case_snapshot, record_case_change, record_case_changes
+from services.statistics import (
+    MAX_SERIES_BUCKETS, PERCENTILE_GROUPS, SERIES_BUCKETS, my_progress, series_bucket_count, stat_by_assignee,
+    stat_by_status, stat_by_time, stat_resolution_percentiles, stat_series,
+)
+from tasks import (
+    learn_tags_from_case, learn_tags_from_cases, notify_case_assigned, notify_cases_assigned, schedule_case_similarity,
+    schedule_neighbour_refresh,
 )
-from services.statistics import stat_by_assignee, stat_by_status, stat_by_time
-from tasks import compute_case_similarity, learn_tags_from_case, notify_case_assigned
 
 router = APIRouter(prefix="/cases", tags=["CS Cases"])
 
+MAX_BULK_CASES = 500
+
+
+def _content_snapshot(case: CSCase) -> dict:
+    """Fields that feed tag learning and similarity (JSON-serializable for Celery)."""
+    return {"title": case.title, "content": case.content, "tags": list(case.tags or [])}
+
+
+def _content_changed(before: dict, after: dict) -> bool:
+    return (
+        before["title"] != after["title"]
+        or before["content"] != after["content"]
+        or sorted(before["tags"]) != sorted(after["tags"])
+    )
+
+
+def _refresh_reverse_neighbours(case_id: int, deleted: bool = False):
+    """Recompute (async, batched, debounced) the cached similar lists that reference case_id."""
+    from services.cache import get_reverse_neighbours, invalidate_similar_cache
+
+    neighbour_ids = [cid for cid in get_reverse_neighbours(case_id) if cid != case_id]
+    if deleted:
+        invalidate_similar_cache(case_id)
+    schedule_neighbour_refresh(neighbour_ids)
+
 
 @router.get("/similar", response_model=List[CaseSimilarRead])
 def get_similar_cases(
     title: str = Query("", description="Case title"),
     content: str = Query("", description="Case content"),
     tags: List[str] = Query([], description="Tag list"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     _: User = Depends(get_current_user),
 ):
     """Find similar cases using TF-IDF similarity with tag/title/content weighting."""
@@ -54,40 +94,32 @@ def get_similar_cases(
 
 
 @router.get("/", response_model=CaseListResponse)
-def list_cases(
+async def list_cases(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     status: Optional[CaseStatus] = None,
     assignee_id: Optional[int] = None,
     product_id: Optional[int] = None,
     requester: Optional[str] = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async),
 ):
     """List cases with pagination and optional filters (status, assignee, product, requester).
     Non-admin users only see cases they created or are assigned to."""
-    q = db.query(CSCase).options(joinedload(CSCase.assignee), joinedload(CSCase.assignees))
-
-    # Non-admin: only own cases (created or assigned)
-    if current_user.role != UserRole.ADMIN:
-        q = q.filter(
-            (CSCase.requester == current_user.name)
-            | (CSCase.assignees.any(User.id == current_user.id))
-        )
-
-    if status:
-        q = q.filter(CSCase.status == status)
-    if assignee_id:
-        q = q.filter(CSCase.assignees.any(User.id == assignee_id))
-    if product_id:
-        q = q.filter(CSCase.product_id == product_id)
-    if requester:
-        q = q.filter(CSCase.requester == requester)
+    filters = case_filters(current_user, status, assignee_id, product_id, requester)
 
-    total = q.count()
+    total = await db.scalar(select(func.count(CSCase.id)).where(*filters))
     total_pages = ceil(total / page_size) if total > 0 else 1
     offset = (page - 1) * page_size
-    items = q.order_by(CSCase.created_at.desc()).offset(offset).limit(page_size).all()
+    result = await db.execute(
+        select(CSCase)
+        .options(joinedload(CSCase.assignee), joinedload(CSCase.assignees))
+        .where(*filters)
+        .order_by(CSCase.created_at.desc())
+        .offset(offset)
+        .limit(page_size)
+    )
+    items = result.unique().scalars().all()
 
     return CaseListResponse(
         items=items,
@@ -98,6 +130,56 @@ def list_cases(
     )
 
 
+_EXPORT_COLUMNS = [
+    ("id", lambda c: c.id),
+    ("title", lambda c: c.title),
+    ("content", lambda c: c.content),
+    ("status", lambda c: c.status),
+    ("priority", lambda c: c.priority),
+    ("requester", lambda c: c.requester),
+    ("organization", lambda c: c.organization),
+    ("product_id", lambda c: c.product_id),
+    ("license_id", lambda c: c.license_id),
+    ("assignee_ids", lambda c: c.assignee_ids),
+    ("assignee_names", lambda c: c.assignee_names),
+    ("tags", lambda c: c.tags or []),
+    ("created_at", lambda c: c.created_at),
+    ("completed_at", lambda c: c.completed_at),
+    ("canceled_at", lambda c: c.canceled_at),
+]
+
+
+@router.get("/export")
+def export_cases(
+    format: str = Query("csv", description="csv | ndjson"),
+    status: Optional[CaseStatus] = None,
+    assignee_id: Optional[int] = None,
+    product_id: Optional[int] = None,
+    requester: Optional[str] = None,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Stream every case matching the list_cases filters as CSV or NDJSON.
+
+    The session stays open until the body has been sent: request-scoped
+    dependencies exit after the response.
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="'format' must be one of: csv, ndjson")
+    stmt = (
+        select(CSCase)
+        .options(selectinload(CSCase.assignees))
+        .where(*case_filters(current_user, status, assignee_id, product_id, requester))
+        .order_by(CSCase.created_at.desc(), CSCase.id.desc())
+    )
+    filename = f"cases-{date.today():%Y%m%d}.{format}"
+    return StreamingResponse(
+        stream_export(db, stmt, _EXPORT_COLUMNS, format),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.post("/", response_model=CaseRead, status_code=201)
 def create_case(
     data: CaseCreate,
@@ -121,7 +203,9 @@ def create_case(
         users = db.query(User).filter(User.id.in_(assignee_ids)).all()
         case.assignees = users
 
+    record_case_change(db, None, case_snapshot(case))
     db.commit()
+    bump_stats_version()
     db.refresh(case)
 
     # Send notifications to ALL assignees (async)
@@ -130,15 +214,136 @@ def create_case(
 
     # Learn tag keyword associations (async)
     if case.tags:
-        learn_tags_from_case.delay(case.id)
+        learn_tags_from_case.delay(case.id, None, _content_snapshot(case))
 
-    # Compute similar cases (async)
-    compute_case_similarity.delay(case.id)
+    # Compute similar cases (async, debounced per case)
+    schedule_case_similarity(case.id)
 
     return case
 
 
+def _bulk_cases(db: Session, case_ids: List[int]) -> List[CSCase]:
+    return (
+        db.query(CSCase)
+        .options(selectinload(CSCase.assignees))
+        .filter(CSCase.id.in_(case_ids))
+        .populate_existing()
+        .all()
+    )
+
+
+def _bulk_tags(add_tags: List[str], remove_tags: List[str]):
+    """SET expression: current tags minus remove_tags, then add_tags not yet present (order kept)."""
+    tags = func.coalesce(CSCase.tags, array([], type_=String))
+    for tag in dict.fromkeys(remove_tags):
+        tags = func.array_remove(tags, tag)
+    add = [t for t in dict.fromkeys(add_tags) if t not in remove_tags]
+    if not add:
+        return tags
+    added = func.unnest(cast(array(add), ARRAY(String))).table_valued("tag", with_ordinality="n").render_derived(name="added")
+    new_tags = select(added.c.tag).where(added.c.tag != all_(tags)).order_by(added.c.n)
+    return func.array_cat(tags, func.array(new_tags.scalar_subquery()))
+
+
+@router.post("/bulk", response_model=CaseBulkResult)
+def bulk_update_cases(
+    data: CaseBulkUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Apply status / assignee / tag changes to many cases in one transaction.
+
+    Each field is one set-based UPDATE over all case_ids. A status change needs
+    the same permission as PATCH /{case_id}/status on every case. Newly added
+    assignees get one notification per user; tag changes are re-learned in one
+    task and re-scored through the debounced, chunked neighbour refresh.
+    """
+    case_ids = list(dict.fromkeys(data.case_ids))
+    if not case_ids:
+        raise HTTPException(status_code=400, detail="'case_ids' must not be empty")
+    if len(case_ids) > MAX_BULK_CASES:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_CASES} cases per request")
+    if data.status is None and data.assignee_ids is None and not data.add_tags and not data.remove_tags:
+        raise HTTPException(status_code=400, detail="Nothing to update")
+
+    cases = _bulk_cases(db, case_ids)
+    missing = sorted(set(case_ids) - {c.id for c in cases})
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Cases not found: {missing}")
+    if data.status is not None and current_user.role != UserRole.ADMIN:
+        if any(current_user.id not in c.assignee_ids for c in cases):
+            raise HTTPException(status_code=403, detail="Permission denied")
+
+    stats_before = {c.id: case_snapshot(c) for c in cases}
+    content_before = {c.id: _content_snapshot(c) for c in cases}
+    old_assignee_ids = {c.id: set(c.assignee_ids) for c in cases}
+
+    values = {}
+    if data.status is not None:
+        values[CSCase.status] = data.status
+        if data.status == CaseStatus.DONE:
+            values[CSCase.completed_at] = datetime.utcnow()
+        elif data.status == CaseStatus.CANCEL:
+            values[CSCase.canceled_at] = datetime.utcnow()
+    if data.assignee_ids is not None:
+        known = set(db.scalars(select(User.id).where(User.id.in_(data.assignee_ids))))
+        assignee_ids = [uid for uid in dict.fromkeys(data.assignee_ids) if uid in known]
+        # assignee_id mirrors the first assignee for backward compat
+        values[CSCase.assignee_id] = assignee_ids[0] if assignee_ids else None
+        db.execute(delete(case_assignees).where(case_assignees.c.case_id.in_(case_ids)))
+        if assignee_ids:
+            db.execute(
+                insert(case_assignees),
+                [{"case_id": cid, "user_id": uid} for cid in case_ids for uid in assignee_ids],
+            )
+    if data.add_tags or data.remove_tags:
+        values[CSCase.tags] = _bulk_tags(data.add_tags, data.remove_tags)
+    if values:
+        db.execute(
+            update(CSCase).where(CSCase.id.in_(case_ids)).values(values),
+            execution_options={"synchronize_session": False},
+        )
+
+    cases = _bulk_cases(db, case_ids)
+    record_case_changes(db, [(stats_before[c.id], case_snapshot(c)) for c in cases])
+    content_after = {c.id: _content_snapshot(c) for c in cases}
+    db.commit()
+    bump_stats_version()
+
+    # One assignment notification per newly added user, covering all their cases (async)
+    if data.assignee_ids is not None:
+        added = defaultdict(list)
+        for cid in case_ids:
+            for uid in set(assignee_ids) - old_assignee_ids[cid]:
+                added[uid].append(cid)
+        for uid, ids in added.items():
+            notify_cases_assigned.delay(uid, ids)
+
+    # Tags changed: re-learn and refresh similarity for the cases and their reverse neighbours (async)
+    changed = [cid for cid in case_ids if _content_changed(content_before[cid], content_after[cid])]
+    if changed:
+        from services.cache import get_reverse_neighbours
+
+        learn_tags_from_cases.delay([
+            {
+                "case_id": cid,
+                "previous": content_before[cid] if content_before[cid]["tags"] else None,
+                "current": content_after[cid],
+            }
+            for cid in changed
+        ])
+        refresh_ids = list(changed)
+        for cid in changed:
+            refresh_ids.extend(get_reverse_neighbours(cid))
+        schedule_neighbour_refresh(refresh_ids)
+
+    return CaseBulkResult(updated_ids=case_ids)
+
+
 # ======================== Statistics ========================
+# Served from the Redis stats cache; misses are computed on the primary (get_db)
+# because the result is cached under the current stats version, and a lagging
+# replica would pin pre-write numbers there for STATS_CACHE_TTL.
 
 
 @router.get("/statistics", response_model=Union[List[StatByAssignee], List[StatByStatus], StatByTime])
@@ -161,6 +366,39 @@ def get_statistics(
         raise HTTPException(status_code=400, detail="'by' parameter must be one of: assignee, status, time")
 
 
+@router.get("/statistics/series", response_model=List[StatSeriesPoint])
+def get_statistics_series(
+    bucket: str = Query("day", description="day | week | month"),
+    date_from: date = Query(..., alias="from", description="First date (YYYY-MM-DD)"),
+    date_to: date = Query(..., alias="to", description="Last date (YYYY-MM-DD)"),
+    assignee_id: Optional[int] = Query(None, description="Filter by assignee"),
+    db: Session = Depends(get_db),
+    _: User = Depends(get_current_user),
+):
+    """Per-bucket status counts and average resolution hours for a chart, in one query."""
+    if bucket not in SERIES_BUCKETS:
+        raise HTTPException(status_code=400, detail="'bucket' must be one of: day, week, month")
+    if date_to < date_from:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+    if series_bucket_count(bucket, date_from, date_to) > MAX_SERIES_BUCKETS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_SERIES_BUCKETS} buckets per request")
+    return stat_series(db, bucket, date_from, date_to, assignee_id)
+
+
+@router.get("/statistics/resolution", response_model=List[StatResolutionPercentiles])
+def get_statistics_resolution(
+    group: str = Query(..., description="assignee | product | priority"),
+    period: Optional[str] = Query(None, description="daily | weekly | monthly (by completion date)"),
+    target_date: Optional[date] = Query(None, description="Target date (YYYY-MM-DD)"),
+    db: Session = Depends(get_db),
+    _: User = Depends(get_current_user),
+):
+    """p50/p90/p99 resolution hours of completed cases per assignee, product or priority."""
+    if group not in PERCENTILE_GROUPS:
+        raise HTTPException(status_code=400, detail="'group' must be one of: assignee, product, priority")
+    return stat_resolution_percentiles(db, group, period=period, target_date=target_date)
+
+
 @router.get("/my-progress", response_model=MyProgress)
 def get_my_progress(
     target_date: Optional[date] = Query(None, description="Target date (YYYY-MM-DD), defaults to today"),
@@ -168,50 +406,22 @@ def get_my_progress(
     current_user: User = Depends(get_current_user),
 ):
     """Get current user's case counts by status (created or assigned). No date = all-time."""
-    from sqlalchemy import case as sa_case, func
-
-    from services.statistics import _compute_date_range
-
-    q = db.query(
-        func.sum(sa_case((CSCase.status == CaseStatus.OPEN, 1), else_=0)).label("open_count"),
-        func.sum(sa_case((CSCase.status == CaseStatus.IN_PROGRESS, 1), else_=0)).label("in_progress_count"),
-        func.sum(sa_case((CSCase.status == CaseStatus.DONE, 1), else_=0)).label("done_count"),
-        func.sum(sa_case((CSCase.status == CaseStatus.CANCEL, 1), else_=0)).label("cancel_count"),
-    ).filter(
-        or_(
-            CSCase.requester == current_user.name,
-            CSCase.assignees.any(User.id == current_user.id),
-        )
-    )
-
-    if target_date:
-        start, end = _compute_date_range("daily", target_date)
-        if start and end:
-            q = q.filter(CSCase.created_at >= start, CSCase.created_at <= end)
-
-    row = q.one()
-
-    return MyProgress(
-        open_count=row.open_count or 0,
-        in_progress_count=row.in_progress_count or 0,
-        done_count=row.done_count or 0,
-        cancel_count=row.cancel_count or 0,
-    )
+    return my_progress(db, current_user, target_date)
 
 
 @router.get("/{case_id}", response_model=CaseRead)
-def get_case(
+async def get_case(
     case_id: int,
-    db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    _: User = Depends(get_current_user_async),
 ):
     """Get a single case by ID with assignee details."""
-    case = (
-        db.query(CSCase)
+    result = await db.execute(
+        select(CSCase)
         .options(joinedload(CSCase.assignee), joinedload(CSCase.assignees))
-        .filter(CSCase.id == case_id)
-        .first()
+        .where(CSCase.id == case_id)
     )
+    case = result.unique().scalar_one_or_none()
     if not case:
         raise HTTPException(status_code=404, detail="Case not found")
     return case
@@ -284,6 +494,8 @@ def update_case(
         raise HTTPException(status_code=404, detail="Case not found")
 
     old_assignee_ids = set(u.id for u in case.assignees)
+    before = _content_snapshot(case)
+    stats_before = case_snapshot(case)
     update_data = data.model_dump(exclude_unset=True)
 
     # Handle assignee_ids separately from other fields
@@ -299,7 +511,9 @@ def update_case(
         # Set assignee_id to first assignee for backward compat
         case.assignee_id = new_assignee_ids[0] if new_assignee_ids else None
 
+    record_case_change(db, stats_before, case_snapshot(case))
     db.commit()
+    bump_stats_version()
     db.refresh(case)
 
     # Send notifications to newly added assignees (async)
@@ -308,12 +522,18 @@ def update_case(
         if added_ids:
             notify_case_assigned.delay(case.id, list(added_ids))
 
-    # Learn tag keyword associations (async)
-    if case.tags:
-        learn_tags_from_case.delay(case.id)
+    # Learning/similarity only depend on title, content and tags
+    after = _content_snapshot(case)
+    if _content_changed(before, after):
+        # Re-learn tag keyword associations, replacing the old contribution (async)
+        if after["tags"] or before["tags"]:
+            learn_tags_from_case.delay(case.id, before if before["tags"] else None, after)
 
-    # Compute similar cases (async)
-    compute_case_similarity.delay(case.id)
+        # Compute similar cases (async, debounced per case)
+        schedule_case_similarity(case.id)
+
+        # Refresh other cases' cached lists that point at this case (async)
+        _refresh_reverse_neighbours(case.id)
 
     return case
 
@@ -341,12 +561,15 @@ def update_case_status(
     if not (is_assignee or is_admin):
         raise HTTPException(status_code=403, detail="Permission denied")
 
+    stats_before = case_snapshot(case)
     case.status = data.status
     if data.status == CaseStatus.DONE:
         case.completed_at = datetime.utcnow()
     elif data.status == CaseStatus.CANCEL:
         case.canceled_at = datetime.utcnow()
+    record_case_change(db, stats_before, case_snapshot(case))
     db.commit()
+    bump_stats_version()
     db.refresh(case)
     return case
 
@@ -373,5 +596,9 @@ def delete_case(
     if not (is_assignee or is_admin):
         raise HTTPException(status_code=403, detail="Permission denied")
 
+    record_case_change(db, case_snapshot(case), None)
     db.delete(case)
     db.commit()
+    bump_stats_version()
+
+    _refresh_reverse_neighbours(case_id, deleted=True)
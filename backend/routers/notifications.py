@@ -4,30 +4,125 @@ Notification API 라우터.
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from database import get_db
+from database import get_async_db, get_db
 from models import Notification, User, UserRole
-from routers.auth import get_current_user
-from schemas import NotificationRead
+from routers.auth import get_current_user, get_current_user_async
+from schemas import NotificationBulkRead, NotificationRead, StreamTicketResponse, UnreadCountResponse
+from services.cache import (
+    STREAM_TICKET_TTL, adjust_unread_count, get_unread_count, issue_stream_ticket, redeem_stream_ticket,
+    seed_unread_count,
+)
+from services.notification_stream import hub
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
 
+def _target_user_id(user_id: Optional[int], current_user: User) -> int:
+    """Admin may look at another user's notifications; everyone else sees their own."""
+    return user_id if (user_id and current_user.role == UserRole.ADMIN) else current_user.id
+
+
 @router.get("/", response_model=List[NotificationRead])
-def list_notifications(
+async def list_notifications(
     user_id: Optional[int] = Query(None, description="사용자 ID 필터"),
     unread_only: bool = Query(False, description="미읽음만 조회"),
+    limit: int = Query(50, ge=1, le=200, description="최대 개수"),
+    before_id: Optional[int] = Query(None, description="이 ID보다 오래된 알림 (다음 페이지)"),
+    since_id: Optional[int] = Query(None, description="이 ID 이후 새 알림만"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    """List notifications for current user, newest first. Admin can filter by user_id.
+
+    Ordered by id, the same key the before_id / since_id cursors use: created_at
+    is set client-side and may disagree with id order under concurrent inserts.
+    """
+    q = select(Notification).where(Notification.user_id == _target_user_id(user_id, current_user))
+    if unread_only:
+        q = q.where(Notification.is_read == False)  # noqa: E712
+    if before_id is not None:
+        q = q.where(Notification.id < before_id)
+    if since_id is not None:
+        q = q.where(Notification.id > since_id)
+    result = await db.scalars(q.order_by(Notification.id.desc()).limit(limit))
+    return result.all()
+
+
+@router.get("/unread-count", response_model=UnreadCountResponse)
+async def unread_count(
+    user_id: Optional[int] = Query(None, description="사용자 ID 필터"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    """Unread notification count, served from the Redis counter when cached.
+
+    The Redis helpers are blocking, so they run in the threadpool.
+    """
+    target_id = _target_user_id(user_id, current_user)
+    count = await run_in_threadpool(get_unread_count, target_id)
+    if count is None:
+        count = await db.scalar(
+            select(func.count(Notification.id))
+            .where(Notification.user_id == target_id, Notification.is_read == False)  # noqa: E712
+        )
+        await run_in_threadpool(seed_unread_count, target_id, count)
+    return {"count": count}
+
+
+@router.post("/stream-ticket", response_model=StreamTicketResponse)
+def create_stream_ticket(current_user: User = Depends(get_current_user)):
+    """Single-use ticket for /notifications/stream (keeps the access token out of the URL)."""
+    return {"ticket": issue_stream_ticket(current_user.id), "expires_in": STREAM_TICKET_TTL}
+
+
+@router.get("/stream")
+def stream_notifications(
+    request: Request,
+    ticket: str = Query(..., description="Ticket from POST /notifications/stream-ticket"),
+):
+    """Server-Sent Events stream of the ticket holder's new notifications."""
+    user_id = redeem_stream_ticket(ticket)
+    if user_id is None:
+        raise HTTPException(status_code=401, detail="Invalid or expired stream ticket")
+    return StreamingResponse(
+        hub.stream(user_id, request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.patch("/read")
+def mark_many_as_read(
+    data: NotificationBulkRead,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """List notifications for current user. Admin can filter by user_id."""
-    target_id = user_id if (user_id and current_user.role == UserRole.ADMIN) else current_user.id
-    q = db.query(Notification).filter(Notification.user_id == target_id)
-    if unread_only:
-        q = q.filter(Notification.is_read == False)  # noqa: E712
-    return q.order_by(Notification.created_at.desc()).all()
+    """Mark the current user's notifications read in one UPDATE (ids or up_to_id)."""
+    if (data.ids is None) == (data.up_to_id is None):
+        raise HTTPException(status_code=400, detail="Provide either ids or up_to_id")
+
+    q = db.query(Notification).filter(
+        Notification.user_id == current_user.id,
+        Notification.is_read == False,  # noqa: E712
+    )
+    if data.ids is not None:
+        if not data.ids:
+            return {"status": "ok", "updated": 0}
+        q = q.filter(Notification.id.in_(data.ids))
+    else:
+        q = q.filter(Notification.id <= data.up_to_id)
+
+    updated = q.update({Notification.is_read: True}, synchronize_session=False)
+    db.commit()
+    adjust_unread_count(current_user.id, -updated)
+    return {"status": "ok", "updated": updated}
 
 
 @router.patch("/{notification_id}/read")
@@ -46,6 +141,8 @@ def mark_as_read(
         raise HTTPException(status_code=404, detail="Notification not found")
     if notif.user_id != current_user.id and current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="Permission denied")
-    notif.is_read = True
-    db.commit()
+    if not notif.is_read:
+        notif.is_read = True
+        db.commit()
+        adjust_unread_count(notif.user_id, -1)
     return {"status": "ok"}
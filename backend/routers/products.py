@@ -9,7 +9,7 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 from sqlalchemy.orm import Session
 
-from database import get_db
+from database import get_db, get_read_db
 from models import CSCase, License, Product, ProductMemo, User, UserRole
 from routers.auth import get_current_user
 from schemas import BulkUploadResult, LicenseRead, ProductCreate, ProductListResponse, ProductRead, ProductUpdate
@@ -24,7 +24,7 @@ def list_products(
     page_size: int = Query(25, ge=1, le=100, description="페이지당 항목 수"),
     sort: str = Query("name", description="정렬 기준: name, created_at"),
     order: str = Query("asc", description="정렬 순서: asc, desc"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     _: User = Depends(get_current_user),
 ):
     """List products with pagination, search, and sorting."""
@@ -3,14 +3,16 @@ Quote Request CRUD router (견적 요청 수집/관리).
 """
 
 import os
-from datetime import datetime
+from datetime import date, datetime
 from math import ceil
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload, selectinload
 
-from database import get_db
+from database import get_db, get_read_db
 from models import (
     QuoteRequest,
     QuoteRequestComment,
@@ -19,6 +21,7 @@ from models import (
     UserRole,
 )
 from routers.auth import get_current_user, require_role
+from services.export import EXPORT_FORMATS, stream_export
 from tasks import notify_quote_request_assigned, notify_quote_request_comment
 from schemas import (
     QuoteRequestAssigneeUpdate,
@@ -103,24 +106,15 @@ def list_quote_requests(
     page_size: int = Query(20, ge=1, le=100),
     status: Optional[QuoteRequestStatus] = None,
     search: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     """List quote requests with pagination. Non-admin sees only assigned requests."""
-    q = db.query(QuoteRequest).options(joinedload(QuoteRequest.assignees))
-
-    # Non-admin: only assigned requests
-    if current_user.role != UserRole.ADMIN:
-        q = q.filter(QuoteRequest.assignees.any(User.id == current_user.id))
-
-    if status:
-        q = q.filter(QuoteRequest.status == status)
-    if search:
-        like = f"%{search}%"
-        q = q.filter(
-            QuoteRequest.organization.ilike(like)
-            | QuoteRequest.quote_request.ilike(like)
-        )
+    q = (
+        db.query(QuoteRequest)
+        .options(joinedload(QuoteRequest.assignees))
+        .filter(*_quote_request_filters(current_user, status, search))
+    )
 
     total = q.count()
     total_pages = ceil(total / page_size) if total > 0 else 1
@@ -136,6 +130,50 @@ def list_quote_requests(
     )
 
 
+_EXPORT_COLUMNS = [
+    ("id", lambda qr: qr.id),
+    ("received_at", lambda qr: qr.received_at),
+    ("delivery_date", lambda qr: qr.delivery_date),
+    ("email_id", lambda qr: qr.email_id),
+    ("email", lambda qr: qr.email),
+    ("organization", lambda qr: qr.organization),
+    ("quote_request", lambda qr: qr.quote_request),
+    ("other_request", lambda qr: qr.other_request),
+    ("failed_products", lambda qr: qr.failed_products),
+    ("additional_request", lambda qr: qr.additional_request),
+    ("status", lambda qr: qr.status),
+    ("assignee_ids", lambda qr: qr.assignee_ids),
+    ("assignee_names", lambda qr: qr.assignee_names),
+    ("created_at", lambda qr: qr.created_at),
+    ("completed_at", lambda qr: qr.completed_at),
+]
+
+
+@router.get("/export")
+def export_quote_requests(
+    format: str = Query("csv", description="csv | ndjson"),
+    status: Optional[QuoteRequestStatus] = None,
+    search: Optional[str] = None,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Stream every quote request matching the list filters as CSV or NDJSON."""
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="'format' must be one of: csv, ndjson")
+    stmt = (
+        select(QuoteRequest)
+        .options(selectinload(QuoteRequest.assignees))
+        .where(*_quote_request_filters(current_user, status, search))
+        .order_by(QuoteRequest.created_at.desc(), QuoteRequest.id.desc())
+    )
+    filename = f"quote-requests-{date.today():%Y%m%d}.{format}"
+    return StreamingResponse(
+        stream_export(db, stmt, _EXPORT_COLUMNS, format),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 # ======================== Default Assignees Setting ========================
 
 
@@ -365,6 +403,29 @@ def delete_quote_request_comment(
 # ======================== Helpers ========================
 
 
+def _quote_request_filters(
+    current_user: User,
+    status: Optional[QuoteRequestStatus],
+    search: Optional[str],
+) -> list:
+    """WHERE criteria shared by list_quote_requests and export_quote_requests."""
+    filters = []
+
+    # Non-admin: only assigned requests
+    if current_user.role != UserRole.ADMIN:
+        filters.append(QuoteRequest.assignees.any(User.id == current_user.id))
+
+    if status:
+        filters.append(QuoteRequest.status == status)
+    if search:
+        like = f"%{search}%"
+        filters.append(
+            QuoteRequest.organization.ilike(like)
+            | QuoteRequest.quote_request.ilike(like)
+        )
+    return filters
+
+
 def _to_read(qr: QuoteRequest) -> QuoteRequestRead:
     """Convert QuoteRequest ORM instance to QuoteRequestRead schema."""
     return QuoteRequestRead(
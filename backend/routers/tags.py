@@ -5,25 +5,26 @@ Tag search and suggestion API endpoints.
 from typing import List
 
 from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from database import get_db
+from database import get_async_db, get_db
 from models import User
-from routers.auth import get_current_user
+from routers.auth import get_current_user, get_current_user_async
 from schemas import TagSearchResult, TagSuggestResult
-from services.tag_service import search_tags, suggest_tags
+from services.tag_service import search_tags_async, suggest_tags
 
 router = APIRouter(prefix="/tags", tags=["Tags"])
 
 
 @router.get("/search", response_model=List[TagSearchResult])
-def tag_search(
+async def tag_search(
     q: str = Query(..., min_length=1, description="Tag name prefix to search"),
-    db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    _: User = Depends(get_current_user_async),
 ):
     """Search tags by prefix for auto-complete dropdown."""
-    return search_tags(q, db)
+    return await search_tags_async(q, db)
 
 
 @router.get("/suggest", response_model=List[TagSuggestResult])
@@ -2,7 +2,7 @@
 Pydantic 요청/응답 스키마 정의.
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import List, Optional
 
 from pydantic import BaseModel, EmailStr
@@ -198,6 +198,19 @@ class CaseStatusUpdate(BaseModel):
     status: CaseStatus
 
 
+class CaseBulkUpdate(BaseModel):
+    """POST /cases/bulk: the same changes applied to every case in case_ids."""
+    case_ids: List[int]
+    status: Optional[CaseStatus] = None
+    assignee_ids: Optional[List[int]] = None  # replaces the current assignees
+    add_tags: List[str] = []
+    remove_tags: List[str] = []
+
+
+class CaseBulkResult(BaseModel):
+    updated_ids: List[int]
+
+
 class CaseAssignee(BaseModel):
     """Minimal assignee info for case display."""
     id: int
@@ -314,6 +327,21 @@ class NotificationRead(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class UnreadCountResponse(BaseModel):
+    count: int
+
+
+class StreamTicketResponse(BaseModel):
+    ticket: str
+    expires_in: int
+
+
+class NotificationBulkRead(BaseModel):
+    """Mark several notifications read: explicit ids, or everything up to up_to_id."""
+    ids: Optional[List[int]] = None
+    up_to_id: Optional[int] = None
+
+
 # ======================== PushSubscription ========================
 
 
@@ -374,6 +402,28 @@ class StatByTime(BaseModel):
     total_completed: int
 
 
+class StatResolutionPercentiles(BaseModel):
+    """Resolution time distribution for one assignee / product / priority."""
+    group_id: Optional[int] = None  # assignee or product id (None for priority / no product)
+    group_name: Optional[str] = None
+    count: int
+    avg_hours: float
+    p50_hours: float
+    p90_hours: float
+    p99_hours: float
+
+
+class StatSeriesPoint(BaseModel):
+    """One bucket of /cases/statistics/series (cases created in the bucket)."""
+    bucket: date
+    open_count: int = 0
+    in_progress_count: int = 0
+    done_count: int = 0
+    cancel_count: int = 0
+    total_completed: int = 0
+    avg_hours: Optional[float] = None
+
+
 # ======================== Bulk Upload ========================
 
 
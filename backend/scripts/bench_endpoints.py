@@ -0,0 +1,102 @@
+"""
+Read endpoint throughput benchmark, async vs sync routers.
+
+Logs in once, then fires concurrent GETs at each path and concurrency level
+and prints throughput and latency percentiles per (path, concurrency).
+The default paths mix endpoints on the async stack (get_async_db) with a
+sync reference endpoint (/products/), which is capped by the threadpool
+(40 threads by default). Push --concurrency past 40 to see the difference.
+For a before/after comparison of the same paths, run it against a server
+started from the previous commit as well.
+
+Usage:
+    cd backend
+    .venv/bin/python scripts/bench_endpoints.py --email admin@example.com --password admin1234 \\
+        --url http://localhost:8002 --requests 500 --concurrency 10 50 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import aiohttp
+
+DEFAULT_PATHS = [
+    "/auth/me",
+    "/cases/?page_size=20",
+    "/notifications/",
+    "/notifications/unread-count",
+    "/tags/search?q=a",
+    "/products/",  # sync reference
+]
+
+
+async def _login(session, url, email, password) -> dict:
+    async with session.post(f"{url}/auth/login", json={"email": email, "password": password}) as resp:
+        resp.raise_for_status()
+        token = (await resp.json())["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def _worker(session, target, headers, queue, latencies, failures):
+    while True:
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        started = time.perf_counter()
+        try:
+            async with session.get(target, headers=headers) as resp:
+                await resp.read()
+                if resp.status != 200:
+                    failures.append(resp.status)
+        except aiohttp.ClientError as e:
+            failures.append(type(e).__name__)
+        latencies.append(time.perf_counter() - started)
+
+
+async def _bench(url, path, headers, total, concurrency):
+    queue = asyncio.Queue()
+    for i in range(total):
+        queue.put_nowait(i)
+    latencies, failures = [], []
+
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=concurrency)) as session:
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            _worker(session, f"{url}{path}", headers, queue, latencies, failures) for _ in range(concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    pct = lambda p: latencies[min(int(len(latencies) * p), len(latencies) - 1)] * 1000  # noqa: E731
+    print(f"{path:<32} c={concurrency:<4} {total / elapsed:8.1f} req/s  "
+          f"p50 {pct(0.50):6.0f}  p95 {pct(0.95):6.0f}  p99 {pct(0.99):6.0f}  "
+          f"mean {statistics.mean(latencies) * 1000:6.0f} ms  failures {len(failures)}")
+
+
+async def run(url: str, email: str, password: str, paths: list[str], total: int, levels: list[int]):
+    async with aiohttp.ClientSession() as session:
+        headers = await _login(session, url, email, password)
+    for concurrency in levels:
+        for path in paths:
+            await _bench(url, path, headers, total, concurrency)
+        print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8002")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--path", action="append", dest="paths", help="repeatable; defaults to the hot read paths")
+    parser.add_argument("--requests", type=int, default=500, help="requests per path and concurrency level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 50, 200])
+    args = parser.parse_args()
+    asyncio.run(run(args.url, args.email, args.password, args.paths or DEFAULT_PATHS,
+                    args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Login throughput benchmark under concurrency.
+
+Fires concurrent POST /auth/login requests at a running API and reports
+throughput and latency percentiles. Run it before and after changing
+BCRYPT_ROUNDS / PASSWORD_HASH_WORKERS, or while other traffic is hitting
+the server, to see how bcrypt load affects request handling.
+
+Usage:
+    cd backend
+    .venv/bin/python scripts/bench_login.py --email admin@example.com --password admin1234 \\
+        --url http://localhost:8002 --requests 200 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import aiohttp
+
+
+async def _worker(session, url, payload, queue, latencies, failures):
+    while True:
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        started = time.perf_counter()
+        async with session.post(f"{url}/auth/login", json=payload) as resp:
+            await resp.read()
+            if resp.status != 200:
+                failures.append(resp.status)
+        latencies.append(time.perf_counter() - started)
+
+
+async def run(url: str, email: str, password: str, total: int, concurrency: int):
+    queue = asyncio.Queue()
+    for i in range(total):
+        queue.put_nowait(i)
+    latencies, failures = [], []
+    payload = {"email": email, "password": password}
+
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=concurrency)) as session:
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            _worker(session, url, payload, queue, latencies, failures) for _ in range(concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    pct = lambda p: latencies[min(int(len(latencies) * p), len(latencies) - 1)] * 1000  # noqa: E731
+    print(f"requests:    {total} (concurrency {concurrency}), failures: {len(failures)}")
+    print(f"throughput:  {total / elapsed:.1f} logins/s over {elapsed:.2f}s")
+    print(f"latency ms:  p50 {pct(0.50):.0f}  p95 {pct(0.95):.0f}  p99 {pct(0.99):.0f}  "
+          f"mean {statistics.mean(latencies) * 1000:.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8002")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.url, args.email, args.password, args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,7 @@ from models import (
     User,
     UserRole,
 )
+from services import stat_rollups
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -298,6 +299,10 @@ def seed():
             ),
         ]
         db.add_all(notifications)
+        db.flush()
+
+        # ---------- Statistics rollups ----------
+        stat_rollups.rebuild(db)
 
         db.commit()
         print("시드 데이터 삽입 완료!")
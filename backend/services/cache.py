@@ -1,10 +1,14 @@
 """
-Redis DB 2 cache layer for similarity results and TF-IDF model storage.
+Redis DB 2 cache layer for similarity results, TF-IDF model storage, push digests
+and dashboard statistics.
 """
 
+import hashlib
 import json
 import logging
 import os
+import secrets
+import uuid
 
 import redis
 from dotenv import load_dotenv
@@ -20,23 +24,327 @@ cache_redis = redis.from_url(REDIS_URL.replace("/0", "/2"), decode_responses=Fal
 
 SIMILAR_CACHE_TTL = 86400  # 24 hours
 
+# compute_case_similarity debounce window: only the last dispatch within it runs
+SIMILARITY_DEBOUNCE_SECONDS = int(os.getenv("SIMILARITY_DEBOUNCE_SECONDS", "5"))
+
+# Per-user push coalescing window (0 disables digests)
+PUSH_DIGEST_WINDOW_SECONDS = int(os.getenv("PUSH_DIGEST_WINDOW_SECONDS", "60"))
+
+
+def _similar_key(case_id: int) -> str:
+    return f"similar:{case_id}"
+
+
+def _reverse_key(case_id: int) -> str:
+    """Set of case ids whose cached similar list references case_id."""
+    return f"similar_rev:{case_id}"
+
+
+def _fingerprint_key(case_id: int) -> str:
+    return f"similar_fp:{case_id}"
+
+
+def _pending_key(case_id: int) -> str:
+    return f"similar_pending:{case_id}"
+
+
+def _as_str(value) -> str | None:
+    if isinstance(value, bytes):
+        return value.decode()
+    return value
+
 
 def cache_similar_cases(case_id: int, results: list[dict], ttl: int = SIMILAR_CACHE_TTL):
-    """Cache similar case results as JSON in Redis."""
-    key = f"similar:{case_id}"
-    cache_redis.set(key, json.dumps(results), ex=ttl)
+    """Cache similar case results as JSON in Redis and maintain the reverse-neighbour index."""
+    cache_similar_cases_many({case_id: results}, ttl)
+
+
+def cache_similar_cases_many(entries: dict[int, list[dict]], ttl: int = SIMILAR_CACHE_TTL):
+    """cache_similar_cases for many cases: one MGET of the old lists, one pipeline of writes."""
+    if not entries:
+        return
+    case_ids = list(entries)
+    previous = cache_redis.mget([_similar_key(cid) for cid in case_ids])
+
+    pipe = cache_redis.pipeline(transaction=False)
+    for case_id, old in zip(case_ids, previous):
+        old_ids = {item["case_id"] for item in json.loads(old)} if old is not None else set()
+        new_ids = {item["case_id"] for item in entries[case_id]}
+        for neighbour_id in old_ids - new_ids:
+            pipe.srem(_reverse_key(neighbour_id), case_id)
+        for neighbour_id in new_ids:
+            pipe.sadd(_reverse_key(neighbour_id), case_id)
+            pipe.expire(_reverse_key(neighbour_id), ttl)
+        pipe.set(_similar_key(case_id), json.dumps(entries[case_id]), ex=ttl)
+    pipe.execute()
 
 
 def get_cached_similar_cases(case_id: int) -> list[dict] | None:
     """Get cached similar cases. Returns None if not cached."""
-    key = f"similar:{case_id}"
-    data = cache_redis.get(key)
+    data = cache_redis.get(_similar_key(case_id))
     if data is None:
         return None
     return json.loads(data)
 
 
+def get_reverse_neighbours(case_id: int) -> list[int]:
+    """Return ids of cases whose cached similar list contains case_id."""
+    members = cache_redis.smembers(_reverse_key(case_id)) or set()
+    return sorted(int(m) for m in members)
+
+
 def invalidate_similar_cache(case_id: int):
-    """Remove cached similar cases for a given case."""
-    key = f"similar:{case_id}"
-    cache_redis.delete(key)
+    """Remove cached similar cases for a given case, including its reverse-index entries."""
+    previous = get_cached_similar_cases(case_id) or []
+    for item in previous:
+        cache_redis.srem(_reverse_key(item["case_id"]), case_id)
+    cache_redis.delete(_similar_key(case_id))
+    cache_redis.delete(_reverse_key(case_id))
+    cache_redis.delete(_fingerprint_key(case_id))
+
+
+# ---------- Similarity task coalescing ----------
+
+
+def claim_similarity_token(case_id: int) -> str:
+    """Register a new pending similarity computation; supersedes any earlier one."""
+    return claim_similarity_tokens([case_id])[0]
+
+
+def claim_similarity_tokens(case_ids: list[int]) -> list[str]:
+    """claim_similarity_token for many cases in one pipeline."""
+    tokens = [uuid.uuid4().hex for _ in case_ids]
+    pipe = cache_redis.pipeline(transaction=False)
+    for case_id, token in zip(case_ids, tokens):
+        pipe.set(_pending_key(case_id), token, ex=SIMILARITY_DEBOUNCE_SECONDS * 10)
+    pipe.execute()
+    return tokens
+
+
+def is_latest_similarity_token(case_id: int, token: str) -> bool:
+    """True if token belongs to the most recent dispatch (or the marker already expired)."""
+    current = _as_str(cache_redis.get(_pending_key(case_id)))
+    return current is None or current == token
+
+
+def latest_similarity_ids(case_ids: list[int], tokens: list[str]) -> list[int]:
+    """The case_ids whose token is still the most recent dispatch (one MGET)."""
+    current = cache_redis.mget([_pending_key(cid) for cid in case_ids])
+    return [
+        cid for cid, token, value in zip(case_ids, tokens, current)
+        if value is None or _as_str(value) == token
+    ]
+
+
+def similarity_fingerprint(title: str, content: str, tags: list[str]) -> str:
+    """Hash of the fields that feed the similarity score."""
+    raw = json.dumps([title, content, sorted(t.lower() for t in tags)], ensure_ascii=False)
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def get_similarity_fingerprint(case_id: int) -> str | None:
+    """Fingerprint of the text the cached similar list was computed from."""
+    return _as_str(cache_redis.get(_fingerprint_key(case_id)))
+
+
+def set_similarity_fingerprint(case_id: int, fingerprint: str, ttl: int = SIMILAR_CACHE_TTL):
+    cache_redis.set(_fingerprint_key(case_id), fingerprint, ex=ttl)
+
+
+# ---------- Push digest (per-user coalescing) ----------
+
+
+def _digest_key(user_id: int) -> str:
+    return f"push_digest:{user_id}"
+
+
+def _digest_window_key(user_id: int) -> str:
+    return f"push_digest_window:{user_id}"
+
+
+def _digest_flush_key(user_id: int) -> str:
+    return f"push_digest_flush:{user_id}"
+
+
+def open_push_window(user_id: int) -> bool:
+    """True if user_id got no push within the window; the caller sends immediately."""
+    return bool(cache_redis.set(_digest_window_key(user_id), 1, nx=True, ex=PUSH_DIGEST_WINDOW_SECONDS))
+
+
+def queue_digest_push(user_id: int, push: dict) -> bool:
+    """Hold a push for the user's next digest. True if the caller must schedule the flush."""
+    cache_redis.rpush(_digest_key(user_id), json.dumps(push))
+    cache_redis.expire(_digest_key(user_id), PUSH_DIGEST_WINDOW_SECONDS * 10)
+    return bool(cache_redis.set(_digest_flush_key(user_id), 1, nx=True, ex=PUSH_DIGEST_WINDOW_SECONDS * 2))
+
+
+def pop_digest_pushes(user_id: int) -> list[dict]:
+    """Take every held push for user_id. Pushes queued meanwhile schedule a new flush."""
+    cache_redis.delete(_digest_flush_key(user_id))
+    items = cache_redis.lrange(_digest_key(user_id), 0, -1) or []
+    if items:
+        cache_redis.ltrim(_digest_key(user_id), len(items), -1)
+    return [json.loads(item) for item in items]
+
+
+# ---------- Read-your-writes marker (replica routing) ----------
+
+
+def _recent_write_key(user_id: int) -> str:
+    return f"recent_write:{user_id}"
+
+
+def mark_recent_write(user_id: int, ttl: int):
+    try:
+        cache_redis.set(_recent_write_key(user_id), 1, ex=ttl)
+    except redis.RedisError as e:
+        logger.warning("Failed to mark recent write for user %s: %s", user_id, e)
+
+
+def has_recent_write(user_id: int) -> bool:
+    """True if user_id changed data recently; Redis failure errs toward the primary."""
+    try:
+        return cache_redis.get(_recent_write_key(user_id)) is not None
+    except redis.RedisError:
+        return True
+
+
+# ---------- Dashboard statistics ----------
+
+
+STATS_CACHE_TTL = int(os.getenv("STATS_CACHE_TTL", "600"))
+_STATS_VERSION_KEY = "stats_version"
+
+
+def _stats_key(params: tuple) -> str:
+    return "stats:" + ":".join("-" if p is None else str(p) for p in params)
+
+
+def get_cached_stats(params: tuple) -> tuple[int, object | None]:
+    """(current stats version, cached result or None) in one MGET.
+
+    An entry only counts if it was computed under the current version, so
+    bump_stats_version() invalidates every cached statistic at once.
+    """
+    try:
+        version, entry = cache_redis.mget(_STATS_VERSION_KEY, _stats_key(params))
+    except redis.RedisError as e:
+        logger.warning("Stats cache read failed: %s", e)
+        return 0, None
+    version = int(version or 0)
+    if entry is not None:
+        entry = json.loads(entry)
+        if entry["v"] == version:
+            return version, entry["data"]
+    return version, None
+
+
+def cache_stats(params: tuple, version: int, data):
+    try:
+        cache_redis.set(_stats_key(params), json.dumps({"v": version, "data": data}), ex=STATS_CACHE_TTL)
+    except redis.RedisError as e:
+        logger.warning("Stats cache write failed: %s", e)
+
+
+def bump_stats_version():
+    """Call after any change that can move a statistic (case writes, user renames)."""
+    try:
+        cache_redis.incr(_STATS_VERSION_KEY)
+    except redis.RedisError as e:
+        logger.warning("Failed to bump stats version: %s", e)
+
+
+# ---------- Unread notification counter ----------
+
+
+UNREAD_COUNT_TTL = 86400  # re-derived from the DB at least daily
+
+# Adjust only an existing counter (a missing one is recomputed from the DB), never below 0
+_ADJUST_IF_EXISTS = """
+if redis.call('EXISTS', KEYS[1]) == 0 then return nil end
+local n = redis.call('INCRBY', KEYS[1], ARGV[1])
+if n < 0 then redis.call('SET', KEYS[1], 0, 'KEEPTTL') return 0 end
+return n
+"""
+
+
+def _unread_key(user_id: int) -> str:
+    return f"notif_unread:{user_id}"
+
+
+def get_unread_count(user_id: int) -> int | None:
+    """Cached unread count, or None if it has to be recomputed (also when Redis is down)."""
+    try:
+        value = cache_redis.get(_unread_key(user_id))
+    except redis.RedisError as e:
+        logger.warning("Unread count read failed for user %s: %s", user_id, e)
+        return None
+    return None if value is None else int(value)
+
+
+def seed_unread_count(user_id: int, count: int):
+    """Store a DB recount unless a counter exists already (SET NX).
+
+    A counter created meanwhile has seen every adjust_unread_count() since, so
+    it wins over a recount that may predate them.
+    """
+    try:
+        cache_redis.set(_unread_key(user_id), count, nx=True, ex=UNREAD_COUNT_TTL)
+    except redis.RedisError as e:
+        logger.warning("Failed to seed unread count for user %s: %s", user_id, e)
+
+
+def adjust_unread_count(user_id: int, delta: int):
+    """Apply delta to user_id's cached unread count (no-op when not cached)."""
+    if not delta:
+        return
+    try:
+        cache_redis.eval(_ADJUST_IF_EXISTS, 1, _unread_key(user_id), delta)
+    except redis.RedisError as e:
+        logger.warning("Failed to adjust unread count for user %s: %s", user_id, e)
+
+
+# ---------- Notification stream tickets ----------
+
+
+STREAM_TICKET_TTL = int(os.getenv("STREAM_TICKET_TTL", "30"))
+
+
+def _stream_ticket_key(ticket: str) -> str:
+    return f"stream_ticket:{ticket}"
+
+
+def issue_stream_ticket(user_id: int) -> str:
+    """Short-lived, single-use ticket for opening /notifications/stream.
+
+    EventSource can't send an Authorization header; the ticket goes in the URL
+    instead of the access token, so logs and history only ever see a value
+    that is already spent or expires within STREAM_TICKET_TTL.
+    """
+    ticket = secrets.token_urlsafe(32)
+    cache_redis.set(_stream_ticket_key(ticket), user_id, ex=STREAM_TICKET_TTL)
+    return ticket
+
+
+def redeem_stream_ticket(ticket: str) -> int | None:
+    """User id the ticket was issued to, or None; the ticket is deleted either way."""
+    value = cache_redis.getdel(_stream_ticket_key(ticket))
+    return int(value) if value is not None else None
+
+
+# ---------- Notification stream (pub/sub) ----------
+
+
+NOTIFICATION_CHANNEL_PREFIX = "notifications:"
+
+
+def notification_channel(user_id: int) -> str:
+    return f"{NOTIFICATION_CHANNEL_PREFIX}{user_id}"
+
+
+def publish_notification(user_id: int, notification: dict):
+    """Fan a new notification out to API workers streaming it to user_id."""
+    try:
+        cache_redis.publish(notification_channel(user_id), json.dumps(notification, default=str))
+    except redis.RedisError as e:
+        logger.warning("Failed to publish notification for user %s: %s", user_id, e)
@@ -0,0 +1,50 @@
+"""
+Case visibility and list filters.
+
+own_case_ids() is the "my cases" rule (requested or assigned) used for
+non-admin case lists, exports and my-progress; case_filters() builds the
+WHERE criteria shared by list_cases and export_cases.
+"""
+
+from typing import Optional
+
+from sqlalchemy import select, union
+
+from models import CaseStatus, CSCase, User, UserRole, case_assignees
+
+
+def own_case_ids(user: User):
+    """Ids of cases user requested or is assigned to.
+
+    A UNION of two index lookups (requester, case_assignees.user_id); the
+    equivalent OR over an EXISTS forces a scan of cs_cases.
+    """
+    return union(
+        select(CSCase.id).where(CSCase.requester == user.name),
+        select(case_assignees.c.case_id).where(case_assignees.c.user_id == user.id),
+    )
+
+
+def case_filters(
+    current_user: User,
+    status: Optional[CaseStatus] = None,
+    assignee_id: Optional[int] = None,
+    product_id: Optional[int] = None,
+    requester: Optional[str] = None,
+) -> list:
+    """WHERE criteria for a case list; non-admins only see their own cases."""
+    filters = []
+
+    # Non-admin: only own cases (created or assigned)
+    if current_user.role != UserRole.ADMIN:
+        filters.append(CSCase.id.in_(own_case_ids(current_user)))
+
+    if status:
+        filters.append(CSCase.status == status)
+    if assignee_id:
+        filters.append(CSCase.assignees.any(User.id == assignee_id))
+    if product_id:
+        filters.append(CSCase.product_id == product_id)
+    if requester:
+        filters.append(CSCase.requester == requester)
+    return filters
@@ -0,0 +1,83 @@
+"""
+Streaming CSV / NDJSON export.
+
+stream_export() reads the ORM rows with yield_per (a server-side cursor on
+PostgreSQL) and encodes one batch per chunk, so memory stays flat however
+many rows the query returns. Collections must be loaded with selectinload:
+joined eager loading of collections can't be combined with yield_per.
+
+CSV cells that a spreadsheet would evaluate as a formula (leading =, +, -,
+@, tab or CR) get a ' prefix; the rows include text from external intake
+(/quote-requests/collect) and case fields anyone can type. NDJSON is
+written as-is.
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Iterator, List, Tuple
+
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+EXPORT_BATCH_SIZE = 500
+
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+# (column name, value getter) pairs; the getter receives the ORM object
+Columns = List[Tuple[str, Callable[[Any], Any]]]
+
+
+def _plain(value):
+    """JSON-compatible form of a column value."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    return value
+
+
+def _csv_cell(value):
+    value = _plain(value)
+    if value is None:
+        return ""
+    if isinstance(value, list) and all(isinstance(v, (str, int)) for v in value):
+        value = ";".join(str(v) for v in value)
+    elif isinstance(value, (list, dict)):
+        value = json.dumps(value, ensure_ascii=False)
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def stream_export(db: Session, stmt: Select, columns: Columns, fmt: str) -> Iterator[str]:
+    """Yield stmt's rows encoded as CSV (with header) or NDJSON, one chunk per batch."""
+    names = [name for name, _ in columns]
+    result = db.execute(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    if fmt == "csv":
+        writer.writerow(names)
+
+    for batch in result.scalars().partitions():
+        for obj in batch:
+            if fmt == "csv":
+                writer.writerow([_csv_cell(get(obj)) for _, get in columns])
+            else:
+                row = {name: _plain(get(obj)) for name, get in columns}
+                buf.write(json.dumps(row, ensure_ascii=False) + "\n")
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+
+    if fmt == "csv" and buf.tell():
+        yield buf.getvalue()
@@ -0,0 +1,105 @@
+"""
+Notification stream fan-out: Redis pub/sub → SSE clients of this API worker.
+
+Celery tasks publish each new notification to ``notifications:{user_id}``
+(services.cache.publish_notification). Every API worker keeps a single
+pattern subscription and hands messages to the queues of its connected
+clients, so an idle stream costs no DB queries.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import AsyncIterator
+
+import redis.asyncio as aioredis
+from starlette.requests import Request
+
+from services.cache import NOTIFICATION_CHANNEL_PREFIX, REDIS_URL
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_SECONDS = 25  # keeps proxies from closing idle streams
+CLIENT_RETRY_MS = 5000
+CLIENT_QUEUE_SIZE = 100
+
+
+def _as_str(value) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class NotificationHub:
+    """Per-process registry of streaming clients, fed by one Redis subscription."""
+
+    def __init__(self, redis_url: str):
+        self._redis_url = redis_url
+        self._subscribers: dict[int, set[asyncio.Queue]] = defaultdict(set)
+        self._listener: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def subscribe(self, user_id: int) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self._subscribers[user_id].add(queue)
+        self._ensure_listener()
+        return queue
+
+    def unsubscribe(self, user_id: int, queue: asyncio.Queue):
+        queues = self._subscribers.get(user_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[user_id]
+
+    def dispatch(self, channel: str, data: str):
+        """Deliver one published message to every local client of its user."""
+        try:
+            user_id = int(channel[len(NOTIFICATION_CHANNEL_PREFIX):])
+        except ValueError:
+            return
+        for queue in self._subscribers.get(user_id, ()):
+            try:
+                queue.put_nowait(data)
+            except asyncio.QueueFull:
+                logger.warning("Notification stream queue full for user %s — dropping", user_id)
+
+    def _ensure_listener(self):
+        loop = asyncio.get_running_loop()
+        if self._listener is None or self._listener.done() or self._loop is not loop:
+            self._loop = loop
+            self._listener = loop.create_task(self._listen())
+
+    async def _listen(self):
+        while True:
+            client = aioredis.from_url(self._redis_url)
+            try:
+                async with client.pubsub() as pubsub:
+                    await pubsub.psubscribe(f"{NOTIFICATION_CHANNEL_PREFIX}*")
+                    async for message in pubsub.listen():
+                        if message["type"] == "pmessage":
+                            self.dispatch(_as_str(message["channel"]), _as_str(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Notification pub/sub connection lost: %s — reconnecting", e)
+                await asyncio.sleep(1)
+            finally:
+                await client.aclose()
+
+    async def stream(self, user_id: int, request: Request) -> AsyncIterator[str]:
+        """SSE body: one ``notification`` event per new notification, plus heartbeats."""
+        queue = self.subscribe(user_id)
+        try:
+            yield f"retry: {CLIENT_RETRY_MS}\n\n"
+            while not await request.is_disconnected():
+                try:
+                    data = await asyncio.wait_for(queue.get(), HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"event: notification\ndata: {data}\n\n"
+        finally:
+            self.unsubscribe(user_id, queue)
+
+
+hub = NotificationHub(REDIS_URL)
@@ -0,0 +1,38 @@
+"""
+Password hashing on a bounded thread pool.
+
+bcrypt costs hundreds of ms of CPU per call (but releases the GIL), so async
+endpoints hand it to a dedicated executor instead of blocking the event loop
+or occupying the shared request threadpool. BCRYPT_ROUNDS sets the work
+factor; hashes made with another cost are re-hashed on the next successful
+login (verify_and_update).
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from passlib.context import CryptContext
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+
+
+async def verify_and_update(password: str, password_hash: str) -> tuple[bool, str | None]:
+    """Verify password; also returns a replacement hash if the stored one is outdated."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, pwd_context.verify_and_update, password, password_hash)
+
+
+async def verify(password: str, password_hash: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, pwd_context.verify, password, password_hash)
+
+
+async def hash_password(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, pwd_context.hash, password)
@@ -1,13 +1,26 @@
 """
 Web Push 전송 유틸리티.
 Celery task에서 DB 알림 생성 직후 호출하여 OS 레벨 푸시를 전송한다.
+
+전송 엔진: aiohttp 세션 하나로 모든 푸시를 동시에 보내며 (동시성 상한 +
+push 서비스 origin별 커넥션 풀 재사용), VAPID 헤더는 audience별로 캐시한다.
 """
 
+import asyncio
 import json
 import logging
 import os
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import NamedTuple
+from urllib.parse import urlparse
 
-from pywebpush import WebPushException, webpush
+import aiohttp
+from py_vapid import Vapid
+from pywebpush import WebPusher
 from sqlalchemy.orm import Session
 
 from models import PushSubscription
@@ -16,66 +29,234 @@ logger = logging.getLogger(__name__)
 
 VAPID_PRIVATE_KEY = os.getenv("VAPID_PRIVATE_KEY", "")
 VAPID_CLAIMS_EMAIL = os.getenv("VAPID_CLAIMS_EMAIL", "")
+PUSH_MAX_CONCURRENCY = int(os.getenv("PUSH_MAX_CONCURRENCY", "32"))
+PUSH_MAX_PER_ORIGIN = int(os.getenv("PUSH_MAX_PER_ORIGIN", "8"))
+PUSH_TIMEOUT_SECONDS = float(os.getenv("PUSH_TIMEOUT_SECONDS", "10"))
+PUSH_TTL = 86400
 
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
 
-def send_push_to_user(
-    db: Session, user_id: int, title: str, body: str,
-    case_id: int | None = None, quote_request_id: int | None = None,
-) -> int:
-    """해당 user의 모든 PushSubscription에 Web Push를 전송한다.
+VAPID_TOKEN_LIFETIME = 12 * 3600  # pywebpush default
+VAPID_REFRESH_MARGIN = 600  # re-sign 10 minutes before expiry
 
-    Returns:
-        성공적으로 전송한 구독 수.
-    """
-    if not VAPID_PRIVATE_KEY or not VAPID_CLAIMS_EMAIL:
-        logger.debug("VAPID keys not configured — skipping push")
-        return 0
 
-    subscriptions = (
-        db.query(PushSubscription)
-        .filter(PushSubscription.user_id == user_id)
-        .all()
-    )
-    if not subscriptions:
-        return 0
+class VapidHeaderCache:
+    """Signed VAPID headers per audience (push service origin), reused until near expiry."""
+
+    def __init__(self, private_key: str, claims_email: str):
+        self.private_key = private_key
+        self.claims_email = claims_email
+        self._vapid = Vapid.from_string(private_key=private_key)
+        self._headers: dict[str, tuple[dict, int]] = {}
+        self._lock = threading.Lock()
+
+    def headers_for(self, endpoint: str) -> dict:
+        url = urlparse(endpoint)
+        aud = f"{url.scheme}://{url.netloc}"
+        now = int(time.time())
+        with self._lock:
+            cached = self._headers.get(aud)
+            if cached and cached[1] - VAPID_REFRESH_MARGIN > now:
+                return dict(cached[0])
+            exp = now + VAPID_TOKEN_LIFETIME
+            headers = self._vapid.sign({"sub": self.claims_email, "aud": aud, "exp": exp})
+            self._headers[aud] = (headers, exp)
+            return dict(headers)
+
+
+_vapid_cache: VapidHeaderCache | None = None
 
+
+def _get_vapid_cache() -> VapidHeaderCache:
+    global _vapid_cache
+    if (
+        _vapid_cache is None
+        or _vapid_cache.private_key != VAPID_PRIVATE_KEY
+        or _vapid_cache.claims_email != VAPID_CLAIMS_EMAIL
+    ):
+        _vapid_cache = VapidHeaderCache(VAPID_PRIVATE_KEY, VAPID_CLAIMS_EMAIL)
+    return _vapid_cache
+
+
+class PushResult(NamedTuple):
+    """Outcome of one push: "sent" | "expired" | "retry" | "failed"."""
+
+    subscription_id: int
+    outcome: str
+    status: int | None = None
+    retry_after: float | None = None
+    error: str | None = None
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Retry-After header → seconds (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _build_payload(
+    title: str, body: str,
+    case_id: int | None = None, quote_request_id: int | None = None,
+) -> str:
     data = {"title": title, "body": body}
     if case_id:
         data["case_id"] = case_id
     if quote_request_id:
         data["quote_request_id"] = quote_request_id
-    payload = json.dumps(data)
-    sent = 0
-    expired_ids = []
+    return json.dumps(data)
 
-    for sub in subscriptions:
+
+async def _send_one_async(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    vapid: VapidHeaderCache,
+    job: tuple[int, dict, str],
+) -> PushResult:
+    """Send a single push. Network errors and 429/5xx are reported as retryable."""
+    sub_id, subscription_info, payload = job
+    async with semaphore:
         try:
-            resp = webpush(
-                subscription_info={
-                    "endpoint": sub.endpoint,
-                    "keys": {"p256dh": sub.p256dh, "auth": sub.auth},
-                },
-                data=payload,
-                vapid_private_key=VAPID_PRIVATE_KEY,
-                vapid_claims={"sub": VAPID_CLAIMS_EMAIL},
-                ttl=86400,
+            resp = await WebPusher(subscription_info, aiohttp_session=session).send_async(
+                payload,
+                vapid.headers_for(subscription_info["endpoint"]),
+                ttl=PUSH_TTL,
+                timeout=aiohttp.ClientTimeout(total=PUSH_TIMEOUT_SECONDS),
             )
-            sent += 1
-        except WebPushException as e:
-            status_code = e.response.status_code if e.response is not None else None
-            if status_code in (404, 410):
-                expired_ids.append(sub.id)
-            else:
-                logger.error("Web push failed for subscription %s: %s", sub.id, e)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning("Push transport error for subscription %s: %s", sub_id, e)
+            return PushResult(sub_id, "retry", error=str(e) or type(e).__name__)
         except Exception as e:
-            logger.error("Unexpected push error for subscription %s: %s", sub.id, e)
+            logger.error("Unexpected push error for subscription %s: %s", sub_id, e)
+            return PushResult(sub_id, "failed", error=str(e))
+
+    if resp.status <= 202:
+        return PushResult(sub_id, "sent", resp.status)
+    if resp.status in (404, 410):
+        return PushResult(sub_id, "expired", resp.status)
+    if resp.status in RETRYABLE_STATUSES:
+        retry_after = _parse_retry_after(resp.headers.get("Retry-After"))
+        return PushResult(sub_id, "retry", resp.status, retry_after, f"HTTP {resp.status}")
+    logger.error("Web push failed for subscription %s: HTTP %s", sub_id, resp.status)
+    return PushResult(sub_id, "failed", resp.status, error=f"HTTP {resp.status}")
+
+
+async def _deliver_async(
+    jobs: list[tuple[int, dict, str]], max_concurrency: int,
+) -> list[PushResult]:
+    vapid = _get_vapid_cache()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    connector = aiohttp.TCPConnector(limit=max_concurrency, limit_per_host=PUSH_MAX_PER_ORIGIN)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        return await asyncio.gather(
+            *(_send_one_async(session, semaphore, vapid, job) for job in jobs)
+        )
+
+
+def deliver_pushes(
+    jobs: list[tuple[int, dict, str]], max_concurrency: int = PUSH_MAX_CONCURRENCY,
+) -> list[PushResult]:
+    """Send (subscription_id, subscription_info, payload) jobs concurrently.
+
+    Runs its own event loop, so call it from sync code (Celery tasks).
+    Returns one PushResult per job, in job order.
+    """
+    if not jobs:
+        return []
+    return asyncio.run(_deliver_async(jobs, max_concurrency))
+
+
+def push_enabled() -> bool:
+    """VAPID 설정 여부."""
+    if not VAPID_PRIVATE_KEY or not VAPID_CLAIMS_EMAIL:
+        logger.debug("VAPID keys not configured — skipping push")
+        return False
+    return True
+
+
+def build_push_jobs(db: Session, pushes: list[dict]) -> list[tuple[int, dict, str]]:
+    """Expand user-level pushes into per-subscription jobs (one IN query for all users).
+
+    Args:
+        pushes: {"user_id", "title", "body", "case_id"?, "quote_request_id"?} 목록.
+    """
+    if not pushes:
+        return []
 
-    # 만료/무효 구독 일괄 삭제
-    if expired_ids:
-        db.query(PushSubscription).filter(PushSubscription.id.in_(expired_ids)).delete(
-            synchronize_session=False
+    user_ids = {p["user_id"] for p in pushes}
+    subscriptions_by_user = defaultdict(list)
+    for sub in db.query(PushSubscription).filter(PushSubscription.user_id.in_(user_ids)).all():
+        subscriptions_by_user[sub.user_id].append(
+            (sub.id, {"endpoint": sub.endpoint, "keys": {"p256dh": sub.p256dh, "auth": sub.auth}})
         )
-        db.commit()
-        logger.info("Cleaned up %d expired push subscriptions", len(expired_ids))
 
-    return sent
+    jobs = []
+    for push in pushes:
+        payload = _build_payload(
+            push["title"], push["body"],
+            push.get("case_id"), push.get("quote_request_id"),
+        )
+        for sub_id, subscription_info in subscriptions_by_user.get(push["user_id"], []):
+            jobs.append((sub_id, subscription_info, payload))
+    return jobs
+
+
+def remove_expired_subscriptions(db: Session, results: list[PushResult]) -> int:
+    """만료/무효 구독 일괄 삭제. Returns number of deleted subscriptions."""
+    expired_ids = {r.subscription_id for r in results if r.outcome == "expired"}
+    if not expired_ids:
+        return 0
+    db.query(PushSubscription).filter(PushSubscription.id.in_(expired_ids)).delete(
+        synchronize_session=False
+    )
+    db.commit()
+    logger.info("Cleaned up %d expired push subscriptions", len(expired_ids))
+    return len(expired_ids)
+
+
+def send_push_batch(db: Session, pushes: list[dict]) -> int:
+    """여러 사용자에게 Web Push를 일괄 전송한다 (재시도 없음, 동기).
+
+    Celery 알림 흐름은 tasks.deliver_push_batch (push 큐, 재시도/dead-letter)를 사용한다.
+
+    Returns:
+        성공적으로 전송한 푸시 수.
+    """
+    if not push_enabled():
+        return 0
+
+    jobs = build_push_jobs(db, pushes)
+    if not jobs:
+        return 0
+
+    results = deliver_pushes(jobs)
+    remove_expired_subscriptions(db, results)
+    return sum(1 for r in results if r.outcome == "sent")
+
+
+def send_push_to_user(
+    db: Session, user_id: int, title: str, body: str,
+    case_id: int | None = None, quote_request_id: int | None = None,
+) -> int:
+    """해당 user의 모든 PushSubscription에 Web Push를 전송한다.
+
+    Returns:
+        성공적으로 전송한 구독 수.
+    """
+    return send_push_batch(db, [{
+        "user_id": user_id,
+        "title": title,
+        "body": body,
+        "case_id": case_id,
+        "quote_request_id": quote_request_id,
+    }])
@@ -3,9 +3,11 @@ Korean keyword extraction and TF-IDF similarity engine.
 Shared by tag_service (Phase 1) and similarity engine (Phase 2).
 """
 
+import heapq
 import logging
 import os
 import pickle
+from itertools import islice
 
 import numpy as np
 from kiwipiepy import Kiwi
@@ -160,6 +162,28 @@ def compute_combined_similarity(
 
 MAX_SIMILAR_RESULTS = 5
 MAX_SIMILAR_BATCH = 20
+SIMILARITY_STREAM_CHUNK = 500
+
+
+def _combined_scores(
+    engine: CaseSimilarityEngine,
+    target_title_vec,
+    target_content_vec,
+    target_tags: list[str],
+    candidates: list,
+) -> np.ndarray:
+    """Weighted tag/title/content scores of one target against a batch of candidates."""
+    all_title_vecs = engine.batch_title_vectors([c.title for c in candidates])
+    all_content_vecs = engine.batch_content_vectors([c.content or "" for c in candidates])
+
+    title_sims = engine.batch_similarities(target_title_vec, all_title_vecs)
+    content_sims = engine.batch_similarities(target_content_vec, all_content_vecs)
+
+    combined_scores = np.zeros(len(candidates))
+    for i, case in enumerate(candidates):
+        tag_sim = compute_tag_similarity(target_tags, case.tags or [])
+        combined_scores[i] = compute_combined_similarity(tag_sim, title_sims[i], content_sims[i])
+    return combined_scores
 
 
 def find_similar_cases(
@@ -187,18 +211,13 @@ def find_similar_cases(
         engine.fit(corpus_titles, corpus_contents)
         save_model_to_redis(engine)
 
-    target_title_vec = engine.get_title_vector(target_title)
-    target_content_vec = engine.get_content_vector(target_content)
-    all_title_vecs = engine.batch_title_vectors([c.title for c in all_cases])
-    all_content_vecs = engine.batch_content_vectors([c.content or "" for c in all_cases])
-
-    title_sims = engine.batch_similarities(target_title_vec, all_title_vecs)
-    content_sims = engine.batch_similarities(target_content_vec, all_content_vecs)
-
-    combined_scores = np.zeros(len(all_cases))
-    for i, case in enumerate(all_cases):
-        tag_sim = compute_tag_similarity(target_tags, case.tags or [])
-        combined_scores[i] = compute_combined_similarity(tag_sim, title_sims[i], content_sims[i])
+    combined_scores = _combined_scores(
+        engine,
+        engine.get_title_vector(target_title),
+        engine.get_content_vector(target_content),
+        target_tags,
+        all_cases,
+    )
 
     top_indices = np.argsort(combined_scores)[::-1][:top_n]
     input_tag_set = set(t.lower() for t in target_tags)
@@ -214,6 +233,47 @@ def find_similar_cases(
     return results
 
 
+def find_similar_case_ids_streaming(
+    target_title: str,
+    target_content: str,
+    target_tags: list[str],
+    rows,
+    top_n: int = MAX_SIMILAR_BATCH,
+    chunk_size: int = SIMILARITY_STREAM_CHUNK,
+) -> list[dict] | None:
+    """Top-N similar case ids, scoring rows chunk by chunk against the stored model.
+
+    rows is any iterable of objects with id/title/content/tags (e.g. a
+    yield_per column query), so only one chunk and the top-N heap are held in
+    memory. Returns [{"case_id": int, "score": float}] best first, or None if
+    no fitted model is stored yet (caller falls back to find_similar_cases).
+    """
+    engine = load_model_from_redis()
+    if engine is None or not engine._fitted:
+        return None
+
+    target_title_vec = engine.get_title_vector(target_title)
+    target_content_vec = engine.get_content_vector(target_content)
+
+    heap: list[tuple[float, int]] = []
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, chunk_size)):
+        scores = _combined_scores(engine, target_title_vec, target_content_vec, target_tags, chunk)
+        for row, score in zip(chunk, scores):
+            if score < SIMILARITY_THRESHOLD:
+                continue
+            item = (float(score), row.id)
+            if len(heap) < top_n:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+
+    return [
+        {"case_id": case_id, "score": round(score, 4)}
+        for score, case_id in sorted(heap, reverse=True)
+    ]
+
+
 # ---------- Model Serialization ----------
 
 
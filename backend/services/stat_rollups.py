@@ -0,0 +1,137 @@
+"""
+Daily statistics rollups (case_stat_daily).
+
+A case counts once, under its current status, on the rows for its created_at
+date: one row per assignee plus the ALL_ASSIGNEES row. DONE cases with a
+completed_at also add their resolution time. Case mutations take a
+case_snapshot() before and after the change and pass both to
+record_case_change() (record_case_changes() for bulk edits) in the same
+transaction, so the rollups commit or roll back together with the case.
+rebuild() recomputes everything from cs_cases (backfill, and nightly drift
+repair).
+"""
+
+from collections import defaultdict
+from typing import Iterable, Optional, Tuple
+
+from sqlalchemy import Date, and_, case as sa_case, cast, delete, func, insert, literal, select, text, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from models import CaseStatDaily, CaseStatus, CSCase, case_assignees
+
+ALL_ASSIGNEES = 0
+
+STATUS_COLUMNS = {
+    CaseStatus.OPEN: "open_count",
+    CaseStatus.IN_PROGRESS: "in_progress_count",
+    CaseStatus.DONE: "done_count",
+    CaseStatus.CANCEL: "cancel_count",
+}
+VALUE_COLUMNS = [*STATUS_COLUMNS.values(), "resolution_seconds", "resolved_count"]
+
+
+def case_snapshot(case: CSCase) -> Optional[dict]:
+    """What case currently contributes to the rollups."""
+    if case.created_at is None:
+        return None
+    status = CaseStatus(case.status)
+    resolution = None
+    if status == CaseStatus.DONE and case.completed_at is not None:
+        resolution = (case.completed_at - case.created_at).total_seconds()
+    return {
+        "day": case.created_at.date(),
+        "assignee_ids": sorted({u.id for u in case.assignees}),
+        "status": status,
+        "resolution_seconds": resolution,
+    }
+
+
+def _add(deltas: dict, snapshot: Optional[dict], sign: int):
+    if snapshot is None:
+        return
+    for assignee_id in (ALL_ASSIGNEES, *snapshot["assignee_ids"]):
+        row = deltas[(snapshot["day"], assignee_id)]
+        row[STATUS_COLUMNS[snapshot["status"]]] += sign
+        if snapshot["resolution_seconds"] is not None:
+            row["resolution_seconds"] += sign * snapshot["resolution_seconds"]
+            row["resolved_count"] += sign
+
+
+def record_case_change(db: Session, before: Optional[dict], after: Optional[dict]):
+    """Apply after - before to the rollups (before=None: created, after=None: deleted).
+
+    One INSERT .. ON CONFLICT DO UPDATE adding the deltas; rows are sorted so
+    concurrent writers lock them in the same order.
+    """
+    record_case_changes(db, [(before, after)])
+
+
+def record_case_changes(db: Session, changes: Iterable[Tuple[Optional[dict], Optional[dict]]]):
+    """record_case_change for many (before, after) pairs, merged into one upsert."""
+    deltas = defaultdict(lambda: defaultdict(float))
+    for before, after in changes:
+        _add(deltas, before, -1)
+        _add(deltas, after, 1)
+
+    rows = []
+    for (day, assignee_id), values in sorted(deltas.items()):
+        if not any(values.values()):
+            continue
+        row = {"day": day, "assignee_id": assignee_id}
+        for column in VALUE_COLUMNS:
+            value = values.get(column, 0)
+            row[column] = value if column == "resolution_seconds" else int(value)
+        rows.append(row)
+    if not rows:
+        return
+
+    stmt = pg_insert(CaseStatDaily).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CaseStatDaily.day, CaseStatDaily.assignee_id],
+        set_={column: getattr(CaseStatDaily, column) + getattr(stmt.excluded, column) for column in VALUE_COLUMNS},
+    )
+    db.execute(stmt)
+
+
+def _aggregates():
+    resolved = and_(CSCase.status == CaseStatus.DONE, CSCase.completed_at.isnot(None))
+    counts = [
+        func.sum(sa_case((CSCase.status == status, 1), else_=0)).label(column)
+        for status, column in STATUS_COLUMNS.items()
+    ]
+    return [
+        *counts,
+        func.coalesce(func.sum(sa_case(
+            (resolved, func.extract("epoch", CSCase.completed_at) - func.extract("epoch", CSCase.created_at)),
+            else_=0,
+        )), 0).label("resolution_seconds"),
+        func.sum(sa_case((resolved, 1), else_=0)).label("resolved_count"),
+    ]
+
+
+def rebuild(db: Session) -> int:
+    """Recompute every rollup row from cs_cases; returns the number of rows written.
+
+    Runs in the caller's transaction. The table lock makes concurrent case
+    writes wait for the rebuild instead of adding deltas to rows it replaces.
+    """
+    db.execute(text("LOCK TABLE case_stat_daily IN SHARE ROW EXCLUSIVE MODE"))
+    db.execute(delete(CaseStatDaily))
+
+    day = cast(CSCase.created_at, Date)
+    all_cases = (
+        select(day.label("day"), literal(ALL_ASSIGNEES).label("assignee_id"), *_aggregates())
+        .where(CSCase.created_at.isnot(None))
+        .group_by(day)
+    )
+    per_assignee = (
+        select(day.label("day"), case_assignees.c.user_id.label("assignee_id"), *_aggregates())
+        .join(case_assignees, case_assignees.c.case_id == CSCase.id)
+        .where(CSCase.created_at.isnot(None))
+        .group_by(day, case_assignees.c.user_id)
+    )
+    result = db.execute(
+        insert(CaseStatDaily).from_select(["day", "assignee_id", *VALUE_COLUMNS], union_all(all_cases, per_assignee))
+    )
+    return result.rowcount
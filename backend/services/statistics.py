@@ -1,16 +1,29 @@
 """
 통계 계산 서비스 모듈.
 cases 라우터의 statistics 엔드포인트에서 호출하는 비즈니스 로직.
+케이스 테이블 대신 일별 rollup(case_stat_daily, services.stat_rollups)을 합산한다.
+결과는 Redis에 캐시되며, 케이스 변경 시 bump_stats_version()으로 일괄 무효화된다.
 """
 
 from datetime import date, datetime, timedelta
-from typing import List, Optional
+from typing import Callable, List, Optional
 
-from sqlalchemy import case as sa_case, func
+from pydantic import TypeAdapter
+from sqlalchemy import DateTime, Interval, and_, case as sa_case, cast, func, literal, select
 from sqlalchemy.orm import Session
 
-from models import CaseStatus, CSCase, User, case_assignees
-from schemas import StatByAssignee, StatByStatus, StatByTime
+from models import CaseStatDaily, CaseStatus, CSCase, Product, User, case_assignees
+from schemas import (
+    MyProgress, StatByAssignee, StatByStatus, StatByTime, StatResolutionPercentiles, StatSeriesPoint,
+)
+from services.cache import cache_stats, get_cached_stats
+from services.case_filters import own_case_ids
+from services.stat_rollups import ALL_ASSIGNEES, STATUS_COLUMNS
+
+PERIODS = ("daily", "weekly", "monthly")
+SERIES_BUCKETS = ("day", "week", "month")
+MAX_SERIES_BUCKETS = 400
+PERCENTILE_GROUPS = ("assignee", "product", "priority")
 
 
 def _compute_date_range(
@@ -43,30 +56,35 @@ def _compute_date_range(
     return start, end
 
 
-def stat_by_assignee(
+def _rollup_rows(q, period: Optional[str], target_date: Optional[date]):
+    start, end = _compute_date_range(period, target_date)
+    if start and end:
+        q = q.filter(CaseStatDaily.day >= start.date(), CaseStatDaily.day <= end.date())
+    return q
+
+
+def _stat_by_assignee(
     db: Session,
     period: Optional[str] = None,
     target_date: Optional[date] = None,
 ) -> List[StatByAssignee]:
-    """담당자별 미처리/처리중/완료 건수 (many-to-many, single GROUP BY query)."""
+    """담당자별 미처리/처리중/완료 건수 (case_stat_daily rollup 합산)."""
+    totals = [func.sum(getattr(CaseStatDaily, column)).label(column) for column in STATUS_COLUMNS.values()]
     q = (
-        db.query(
-            User.id.label("assignee_id"),
-            User.name.label("assignee_name"),
-            func.sum(sa_case((CSCase.status == CaseStatus.OPEN, 1), else_=0)).label("open_count"),
-            func.sum(sa_case((CSCase.status == CaseStatus.IN_PROGRESS, 1), else_=0)).label("in_progress_count"),
-            func.sum(sa_case((CSCase.status == CaseStatus.DONE, 1), else_=0)).label("done_count"),
-            func.sum(sa_case((CSCase.status == CaseStatus.CANCEL, 1), else_=0)).label("cancel_count"),
-        )
-        .join(case_assignees, User.id == case_assignees.c.user_id)
-        .join(CSCase, CSCase.id == case_assignees.c.case_id)
+        db.query(User.id.label("assignee_id"), User.name.label("assignee_name"), *totals)
+        .join(CaseStatDaily, CaseStatDaily.assignee_id == User.id)
     )
+    q = _rollup_rows(q, period, target_date)
 
-    start, end = _compute_date_range(period, target_date)
-    if start and end:
-        q = q.filter(CSCase.created_at >= start, CSCase.created_at <= end)
-
-    rows = q.group_by(User.id, User.name).all()
+    # Rows can remain at zero after reassignments — skip assignees with nothing in range
+    rows = (
+        q.group_by(User.id, User.name)
+        .having(func.sum(
+            CaseStatDaily.open_count + CaseStatDaily.in_progress_count
+            + CaseStatDaily.done_count + CaseStatDaily.cancel_count
+        ) > 0)
+        .all()
+    )
     return [
         StatByAssignee(
             assignee_id=r.assignee_id,
@@ -80,44 +98,271 @@ def stat_by_assignee(
     ]
 
 
-def stat_by_status(
+def _stat_by_status(
     db: Session,
     period: Optional[str] = None,
     target_date: Optional[date] = None,
     assignee_id: Optional[int] = None,
 ) -> List[StatByStatus]:
-    """상태별 건수. Optional assignee filter via many-to-many."""
-    q = db.query(CSCase.status, func.count(CSCase.id))
-
-    start, end = _compute_date_range(period, target_date)
-    if start and end:
-        q = q.filter(CSCase.created_at >= start, CSCase.created_at <= end)
+    """상태별 건수. Optional assignee filter (rollup row of that assignee)."""
+    row = db.execute(_status_counts_stmt(period, target_date, assignee_id)).one()
+    return [
+        StatByStatus(status=status, count=count)
+        for status, count in zip(STATUS_COLUMNS, row)
+        if count
+    ]
 
-    if assignee_id:
-        q = q.filter(CSCase.assignees.any(User.id == assignee_id))
 
-    rows = q.group_by(CSCase.status).all()
-    return [StatByStatus(status=row[0], count=row[1]) for row in rows]
+def _status_counts_stmt(period: Optional[str], target_date: Optional[date], assignee_id: Optional[int]):
+    q = select(*[func.sum(getattr(CaseStatDaily, column)) for column in STATUS_COLUMNS.values()])
+    q = q.where(CaseStatDaily.assignee_id == (assignee_id or ALL_ASSIGNEES))
+    return _rollup_rows(q, period, target_date)
 
 
-def stat_by_time(db: Session) -> StatByTime:
+def _stat_by_time(db: Session) -> StatByTime:
     """평균 처리 시간 (완료된 케이스 기준)."""
     row = (
         db.query(
-            func.count(CSCase.id).label("total"),
-            func.avg(
-                func.extract("epoch", CSCase.completed_at)
-                - func.extract("epoch", CSCase.created_at)
-            ).label("avg_seconds"),
-        )
-        .filter(
-            CSCase.status == CaseStatus.DONE,
-            CSCase.completed_at.isnot(None),
+            func.sum(CaseStatDaily.resolved_count).label("total"),
+            func.sum(CaseStatDaily.resolution_seconds).label("seconds"),
         )
-        .first()
+        .filter(CaseStatDaily.assignee_id == ALL_ASSIGNEES)
+        .one()
     )
-    if not row or row.total == 0:
+    if not row.total:
         return StatByTime(avg_hours=None, total_completed=0)
 
-    avg_hours = round(row.avg_seconds / 3600, 2)
+    avg_hours = round(row.seconds / row.total / 3600, 2)
     return StatByTime(avg_hours=avg_hours, total_completed=row.total)
+
+
+def series_bucket_count(bucket: str, date_from: date, date_to: date) -> int:
+    """Number of calendar buckets (weeks start Monday) covering date_from..date_to."""
+    if bucket == "day":
+        return (date_to - date_from).days + 1
+    if bucket == "week":
+        return (date_to - date_from + timedelta(days=date_from.weekday())).days // 7 + 1
+    return (date_to.year - date_from.year) * 12 + date_to.month - date_from.month + 1
+
+
+def _stat_series(
+    db: Session,
+    bucket: str,
+    date_from: date,
+    date_to: date,
+    assignee_id: Optional[int] = None,
+) -> List[StatSeriesPoint]:
+    """Per-bucket status counts and average resolution, one query over the rollups.
+
+    generate_series yields every bucket (empty ones included); rollup days are
+    date_trunc'ed onto them. Buckets are whole calendar days/weeks/months, so
+    the first and last may extend past date_from/date_to.
+    """
+    step = cast(literal(f"1 {bucket}"), Interval)
+    first = func.date_trunc(bucket, cast(date_from, DateTime))
+    last = func.date_trunc(bucket, cast(date_to, DateTime))
+    buckets = select(func.generate_series(first, last, step).label("bucket")).subquery("buckets")
+
+    rollup_bucket = func.date_trunc(bucket, cast(CaseStatDaily.day, DateTime))
+    totals = [
+        func.coalesce(func.sum(getattr(CaseStatDaily, column)), 0).label(column)
+        for column in (*STATUS_COLUMNS.values(), "resolved_count", "resolution_seconds")
+    ]
+    rows = (
+        db.query(buckets.c.bucket, *totals)
+        .select_from(buckets)
+        .outerjoin(
+            CaseStatDaily,
+            and_(
+                rollup_bucket == buckets.c.bucket,
+                CaseStatDaily.assignee_id == (assignee_id or ALL_ASSIGNEES),
+                CaseStatDaily.day >= first,
+                CaseStatDaily.day < last + step,
+            ),
+        )
+        .group_by(buckets.c.bucket)
+        .order_by(buckets.c.bucket)
+        .all()
+    )
+    return [
+        StatSeriesPoint(
+            bucket=r.bucket.date(),
+            open_count=r.open_count,
+            in_progress_count=r.in_progress_count,
+            done_count=r.done_count,
+            cancel_count=r.cancel_count,
+            total_completed=r.resolved_count,
+            avg_hours=round(r.resolution_seconds / r.resolved_count / 3600, 2) if r.resolved_count else None,
+        )
+        for r in rows
+    ]
+
+
+def _stat_resolution_percentiles(
+    db: Session,
+    group: str,
+    period: Optional[str] = None,
+    target_date: Optional[date] = None,
+) -> List[StatResolutionPercentiles]:
+    """p50/p90/p99 resolution hours of DONE cases per group, one percentile_cont query.
+
+    Unlike the rollup-based stats, the period filter applies to completed_at:
+    these are the resolutions that happened in the period.
+    """
+    hours = (func.extract("epoch", CSCase.completed_at) - func.extract("epoch", CSCase.created_at)) / 3600.0
+    aggregates = [
+        func.count(CSCase.id).label("count"),
+        func.avg(hours).label("avg_hours"),
+        func.percentile_cont(0.5).within_group(hours).label("p50_hours"),
+        func.percentile_cont(0.9).within_group(hours).label("p90_hours"),
+        func.percentile_cont(0.99).within_group(hours).label("p99_hours"),
+    ]
+
+    if group == "assignee":
+        keys = [User.id.label("group_id"), User.name.label("group_name")]
+        q = (
+            db.query(*keys, *aggregates)
+            .join(case_assignees, case_assignees.c.case_id == CSCase.id)
+            .join(User, User.id == case_assignees.c.user_id)
+        )
+    elif group == "product":
+        keys = [CSCase.product_id.label("group_id"), Product.name.label("group_name")]
+        q = db.query(*keys, *aggregates).outerjoin(Product, Product.id == CSCase.product_id)
+    else:
+        keys = [CSCase.priority.label("group_name")]
+        q = db.query(*keys, *aggregates)
+
+    q = q.filter(CSCase.status == CaseStatus.DONE, CSCase.completed_at.isnot(None))
+    start, end = _compute_date_range(period, target_date)
+    if start and end:
+        q = q.filter(CSCase.completed_at >= start, CSCase.completed_at <= end)
+
+    rows = q.group_by(*[k.element for k in keys]).order_by(func.count(CSCase.id).desc()).all()
+    return [
+        StatResolutionPercentiles(
+            group_id=getattr(r, "group_id", None),
+            group_name=r.group_name.value if group == "priority" else r.group_name,
+            count=r.count,
+            avg_hours=round(float(r.avg_hours), 2),
+            p50_hours=round(r.p50_hours, 2),
+            p90_hours=round(r.p90_hours, 2),
+            p99_hours=round(r.p99_hours, 2),
+        )
+        for r in rows
+    ]
+
+
+def _my_progress(db: Session, user: User, target_date: Optional[date] = None) -> MyProgress:
+    """user가 요청자이거나 담당자인 케이스의 상태별 건수. No date = all-time."""
+    row = db.execute(_my_progress_stmt(user, target_date)).one()
+    return MyProgress(**{column: getattr(row, column) or 0 for column in STATUS_COLUMNS.values()})
+
+
+def _my_progress_stmt(user: User, target_date: Optional[date] = None):
+    q = select(
+        *[
+            func.sum(sa_case((CSCase.status == status, 1), else_=0)).label(column)
+            for status, column in STATUS_COLUMNS.items()
+        ]
+    ).where(CSCase.id.in_(own_case_ids(user)))
+
+    if target_date:
+        start, end = _compute_date_range("daily", target_date)
+        q = q.where(CSCase.created_at >= start, CSCase.created_at <= end)
+    return q
+
+
+# ======================== Cached entry points ========================
+
+
+def _cached(params: tuple, adapter: TypeAdapter, compute: Callable):
+    """Serve compute() from the Redis stats cache for the current stats version.
+
+    compute() must read the primary: its result is stored under the version
+    read here, which already includes every committed write.
+    """
+    version, data = get_cached_stats(params)
+    if data is not None:
+        return adapter.validate_python(data)
+    result = compute()
+    cache_stats(params, version, adapter.dump_python(result, mode="json"))
+    return result
+
+
+def _period_params(period: Optional[str], target_date: Optional[date]) -> tuple:
+    """Cache key part; resolves the default date so 'today' rolls over at midnight."""
+    if period not in PERIODS:
+        return None, None
+    return period, (target_date or date.today()).isoformat()
+
+
+_ASSIGNEE_STATS = TypeAdapter(List[StatByAssignee])
+_STATUS_STATS = TypeAdapter(List[StatByStatus])
+_TIME_STATS = TypeAdapter(StatByTime)
+_PROGRESS = TypeAdapter(MyProgress)
+_SERIES = TypeAdapter(List[StatSeriesPoint])
+_PERCENTILES = TypeAdapter(List[StatResolutionPercentiles])
+
+
+def stat_by_assignee(
+    db: Session,
+    period: Optional[str] = None,
+    target_date: Optional[date] = None,
+) -> List[StatByAssignee]:
+    return _cached(
+        ("assignee", *_period_params(period, target_date)),
+        _ASSIGNEE_STATS,
+        lambda: _stat_by_assignee(db, period, target_date),
+    )
+
+
+def stat_by_status(
+    db: Session,
+    period: Optional[str] = None,
+    target_date: Optional[date] = None,
+    assignee_id: Optional[int] = None,
+) -> List[StatByStatus]:
+    return _cached(
+        ("status", *_period_params(period, target_date), assignee_id or ALL_ASSIGNEES),
+        _STATUS_STATS,
+        lambda: _stat_by_status(db, period, target_date, assignee_id),
+    )
+
+
+def stat_by_time(db: Session) -> StatByTime:
+    return _cached(("time",), _TIME_STATS, lambda: _stat_by_time(db))
+
+
+def my_progress(db: Session, user: User, target_date: Optional[date] = None) -> MyProgress:
+    return _cached(
+        ("progress", user.id, target_date.isoformat() if target_date else None),
+        _PROGRESS,
+        lambda: _my_progress(db, user, target_date),
+    )
+
+
+def stat_series(
+    db: Session,
+    bucket: str,
+    date_from: date,
+    date_to: date,
+    assignee_id: Optional[int] = None,
+) -> List[StatSeriesPoint]:
+    return _cached(
+        ("series", bucket, date_from.isoformat(), date_to.isoformat(), assignee_id or ALL_ASSIGNEES),
+        _SERIES,
+        lambda: _stat_series(db, bucket, date_from, date_to, assignee_id),
+    )
+
+
+def stat_resolution_percentiles(
+    db: Session,
+    group: str,
+    period: Optional[str] = None,
+    target_date: Optional[date] = None,
+) -> List[StatResolutionPercentiles]:
+    return _cached(
+        ("percentiles", group, *_period_params(period, target_date)),
+        _PERCENTILES,
+        lambda: _stat_resolution_percentiles(db, group, period, target_date),
+    )
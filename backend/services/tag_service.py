@@ -3,6 +3,8 @@ Tag CRUD, keyword learning, and suggestion service.
 Uses TagMaster table and extract_keywords() from similarity module.
 """
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 
@@ -56,6 +58,43 @@ def learn_from_case(
     return len(keywords)
 
 
+def unlearn_from_case(
+    tags: list[str], title: str, content: str, db: Session
+) -> int:
+    """Subtract a previous learn_from_case() contribution.
+
+    Used before re-learning an edited case so its keywords are not counted
+    twice. Weights and usage_count never go below zero; keywords that reach
+    zero are dropped. Does not commit. Returns the number of (tag, keyword)
+    weights removed outright; merely decremented weights are not counted.
+    """
+    keywords = extract_keywords(f"{title} {content}")
+    if not keywords:
+        return 0
+
+    removed = 0
+    for tag_name in tags:
+        normalized = tag_name.strip()
+        if not normalized:
+            continue
+        tag = db.query(TagMaster).filter(TagMaster.name.ilike(normalized)).first()
+        if not tag:
+            continue
+        tag.usage_count = max((tag.usage_count or 0) - 1, 0)
+        weights = dict(tag.keyword_weights) if tag.keyword_weights else {}
+        for word in keywords:
+            remaining = weights.get(word, 0) - 1
+            if remaining > 0:
+                weights[word] = remaining
+            elif weights.pop(word, None) is not None:
+                removed += 1
+        tag.keyword_weights = weights
+        flag_modified(tag, "keyword_weights")
+
+    db.flush()
+    return removed
+
+
 def suggest_tags(
     title: str, content: str, db: Session, top_k: int = 5
 ) -> list[dict]:
@@ -85,17 +124,30 @@ def suggest_tags(
     ]
 
 
+def _tag_search_query(query: str, limit: int):
+    return (
+        select(TagMaster)
+        .where(TagMaster.name.ilike(f"{query}%"))
+        .order_by(TagMaster.usage_count.desc())
+        .limit(limit)
+    )
+
+
 def search_tags(query: str, db: Session, limit: int = 10) -> list[dict]:
     """Prefix search on TagMaster names, ordered by usage_count desc."""
     q = query.strip()
     if not q:
         return []
 
-    tags = (
-        db.query(TagMaster)
-        .filter(TagMaster.name.ilike(f"{q}%"))
-        .order_by(TagMaster.usage_count.desc())
-        .limit(limit)
-        .all()
-    )
+    tags = db.scalars(_tag_search_query(q, limit)).all()
+    return [{"name": t.name, "usage_count": t.usage_count} for t in tags]
+
+
+async def search_tags_async(query: str, db: AsyncSession, limit: int = 10) -> list[dict]:
+    """search_tags for AsyncSession."""
+    q = query.strip()
+    if not q:
+        return []
+
+    tags = (await db.scalars(_tag_search_query(q, limit))).all()
     return [{"name": t.name, "usage_count": t.usage_count} for t in tags]
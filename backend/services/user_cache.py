@@ -0,0 +1,124 @@
+"""
+Per-process cache of authenticated user snapshots for get_current_user.
+
+Snapshots hold the User columns except password_hash and live for
+AUTH_USER_CACHE_TTL seconds. Changes to a user (admin edit/deactivate,
+password reset/change) call invalidate_user(), which drops the local entry
+and broadcasts the id over Redis pub/sub so every API worker drops it too.
+If the subscription drops, the whole local cache is cleared on reconnect,
+since messages may have been missed. The TTL bounds staleness either way.
+"""
+
+import logging
+import os
+import threading
+import time
+
+import redis
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from models import User
+from services import cache
+
+logger = logging.getLogger(__name__)
+
+AUTH_USER_CACHE_TTL = float(os.getenv("AUTH_USER_CACHE_TTL", "30"))
+INVALIDATION_CHANNEL = "auth_user_invalidate"
+
+_SNAPSHOT_COLUMNS = [c.key for c in inspect(User).column_attrs if c.key != "password_hash"]
+
+_entries: dict[int, tuple[float, dict]] = {}
+_lock = threading.Lock()
+_listener: threading.Thread | None = None
+
+
+def _cached_user(user_id: int) -> User | None:
+    """Detached User built from the cached snapshot, or None on miss/expiry."""
+    if AUTH_USER_CACHE_TTL <= 0:
+        return None
+    _ensure_listener()
+    with _lock:
+        entry = _entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, snapshot = entry
+        if expires_at < time.monotonic():
+            del _entries[user_id]
+            return None
+
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return user
+
+
+def get_cached_user(db: Session, user_id: int) -> User | None:
+    """Return a session-attached User built from the cached snapshot, without a SELECT."""
+    user = _cached_user(user_id)
+    if user is None:
+        return None
+    # load=False: attach as-is; password_hash stays unloaded and loads on first access
+    return db.merge(user, load=False)
+
+
+async def get_cached_user_async(db: AsyncSession, user_id: int) -> User | None:
+    """get_cached_user for AsyncSession (password_hash must not be touched: no lazy loads)."""
+    user = _cached_user(user_id)
+    if user is None:
+        return None
+    return await db.merge(user, load=False)
+
+
+def remember_user(user: User):
+    if AUTH_USER_CACHE_TTL <= 0:
+        return
+    snapshot = {key: getattr(user, key) for key in _SNAPSHOT_COLUMNS}
+    with _lock:
+        _entries[user.id] = (time.monotonic() + AUTH_USER_CACHE_TTL, snapshot)
+
+
+def forget_user(user_id: int):
+    with _lock:
+        _entries.pop(user_id, None)
+
+
+def clear():
+    with _lock:
+        _entries.clear()
+
+
+def invalidate_user(user_id: int):
+    """Drop user_id here and in every other API worker."""
+    forget_user(user_id)
+    try:
+        cache.cache_redis.publish(INVALIDATION_CHANNEL, user_id)
+    except redis.RedisError as e:
+        logger.warning("Failed to broadcast user cache invalidation for %s: %s", user_id, e)
+
+
+def _ensure_listener():
+    global _listener
+    if _listener is not None and _listener.is_alive():
+        return
+    with _lock:
+        if _listener is None or not _listener.is_alive():
+            _listener = threading.Thread(target=_listen, name="user-cache-invalidation", daemon=True)
+            _listener.start()
+
+
+def _listen():
+    while True:
+        try:
+            pubsub = redis.from_url(cache.REDIS_URL).pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(INVALIDATION_CHANNEL)
+            clear()  # anything published while we were not subscribed is lost
+            for message in pubsub.listen():
+                try:
+                    forget_user(int(message["data"]))
+                except (TypeError, ValueError):
+                    continue
+        except redis.RedisError as e:
+            logger.warning("User cache invalidation channel lost: %s — reconnecting", e)
+            clear()
+            time.sleep(5)
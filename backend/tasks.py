@@ -3,46 +3,165 @@ Celery 비동기 태스크.
 - check_pending_cases: 24시간 미처리 CS 리마인드 알림
 - notify_comment: 댓글 등록 시 담당자 알림
 - notify_case_assigned: 케이스 배정 시 담당자 알림
+- notify_cases_assigned: 일괄 배정 시 사용자별 요약 알림 1건
 - notify_reply: 답글 등록 시 부모 댓글 작성자 알림
 - cleanup_tag_keywords: 매주 저빈도 키워드/미사용 태그 정리
+- purge_read_notifications: 매일 보존 기간이 지난 읽은 알림 배치 삭제
 - compute_case_similarity: 케이스 유사도 계산 → Redis 캐시 (배치 최적화)
+- refresh_similar_neighbours: 수정/삭제된 케이스를 참조하는 유사도 캐시만 재계산
 - rebuild_tfidf_model: 전체 TF-IDF 모델 재학습 (일배치, 배치 최적화)
+- deliver_push_batch / retry_push_jobs: Web Push 전송 (전용 push 큐, 재시도/dead-letter)
+- flush_push_digest: 사용자별 coalescing 구간에 쌓인 푸시를 요약 푸시 1건으로 전송
 """
 
 import logging
+import os
+from collections import Counter, defaultdict
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 
+from sqlalchemy import insert, select
+
 from celery_app import celery
-from database import SessionLocal
-from models import CaseStatus, CSCase, Notification, NotificationType, QuoteRequest
-from services.push import send_push_to_user
-from services.tag_service import learn_from_case
+from database import CelerySessionLocal as SessionLocal
+from models import (
+    CaseStatus, CSCase, Notification, NotificationType, PushDeadLetter, QuoteRequest, case_assignees,
+)
+from services import stat_rollups
+from services.cache import (
+    PUSH_DIGEST_WINDOW_SECONDS, adjust_unread_count, bump_stats_version, open_push_window, pop_digest_pushes,
+    publish_notification, queue_digest_push,
+)
+from services.push import build_push_jobs, deliver_pushes, push_enabled, remove_expired_subscriptions
+from services.tag_service import learn_from_case, unlearn_from_case
 
 logger = logging.getLogger(__name__)
 
 PUSH_TITLE = "CS Dashboard"
 
+PUSH_MAX_RETRIES = int(os.getenv("PUSH_MAX_RETRIES", "5"))
+PUSH_RETRY_BASE_SECONDS = int(os.getenv("PUSH_RETRY_BASE_SECONDS", "30"))
+PUSH_RETRY_MAX_SECONDS = 3600
+
+NOTIFICATION_RETENTION_DAYS = int(os.getenv("NOTIFICATION_RETENTION_DAYS", "90"))
+NOTIFICATION_PURGE_BATCH = int(os.getenv("NOTIFICATION_PURGE_BATCH", "5000"))
+
 
 def _create_and_push(db, user_ids, message, notif_type, case_id=None, quote_request_id=None):
-    """Create notifications for user_ids and send push. Returns list of notified user ids."""
-    notified = []
-    for uid in user_ids:
-        notif = Notification(
-            user_id=uid,
-            case_id=case_id,
-            quote_request_id=quote_request_id,
-            message=message,
-            type=notif_type,
-        )
-        db.add(notif)
-        notified.append(uid)
+    """Create notifications for user_ids and send push. Returns list of notified user ids.
+
+    Rows are written with a single multi-row INSERT ... RETURNING, published to
+    the recipients' notification streams, and pushes for all recipients are
+    dispatched together through _dispatch_pushes.
+    """
+    if not user_ids:
+        return []
+    rows = db.execute(
+        insert(Notification).returning(*_STREAM_COLUMNS, sort_by_parameter_order=True),
+        [
+            {
+                "user_id": uid,
+                "case_id": case_id,
+                "quote_request_id": quote_request_id,
+                "message": message,
+                "type": notif_type,
+            }
+            for uid in user_ids
+        ],
+    ).all()
     db.commit()
-    for uid in notified:
-        send_push_to_user(db, uid, PUSH_TITLE, message, case_id=case_id, quote_request_id=quote_request_id)
+
+    _announce_rows(rows)
+
+    notified = [row.user_id for row in rows]
+    _dispatch_pushes([
+        {
+            "user_id": uid,
+            "title": PUSH_TITLE,
+            "body": message,
+            "type": notif_type.value,
+            "case_id": case_id,
+            "quote_request_id": quote_request_id,
+        }
+        for uid in notified
+    ])
     return notified
 
 
+_STREAM_COLUMNS = (
+    Notification.id, Notification.user_id, Notification.case_id, Notification.quote_request_id,
+    Notification.message, Notification.type, Notification.created_at,
+)
+
+
+def _announce_rows(rows):
+    """Bump unread counters and publish fresh rows (NotificationRead shape) to their streams."""
+    for user_id, count in Counter(row.user_id for row in rows).items():
+        adjust_unread_count(user_id, count)
+    for row in rows:
+        publish_notification(row.user_id, {
+            "id": row.id,
+            "user_id": row.user_id,
+            "case_id": row.case_id,
+            "quote_request_id": row.quote_request_id,
+            "message": row.message,
+            "is_read": False,
+            "type": row.type.value,
+            "created_at": row.created_at.isoformat(),
+        })
+
+
+def _dispatch_pushes(pushes: list[dict]):
+    """Send each user's first push in the digest window now; hold the rest for a digest."""
+    if not pushes or not push_enabled():
+        return
+    if PUSH_DIGEST_WINDOW_SECONDS <= 0:
+        deliver_push_batch.delay(pushes)
+        return
+
+    immediate = []
+    for push in pushes:
+        user_id = push["user_id"]
+        if open_push_window(user_id):
+            immediate.append(push)
+        elif queue_digest_push(user_id, push):
+            flush_push_digest.apply_async((user_id,), countdown=PUSH_DIGEST_WINDOW_SECONDS)
+    if immediate:
+        deliver_push_batch.delay(immediate)
+
+
+_DIGEST_LABELS = {
+    NotificationType.COMMENT.value: "새 댓글",
+    NotificationType.ASSIGNEE.value: "새 배정",
+    NotificationType.REMINDER.value: "미처리 리마인드",
+}
+
+
+def _build_digest(user_id: int, pushes: list[dict]) -> dict:
+    """Merge held pushes into one, e.g. "새 댓글 5건 · 케이스 3건"."""
+    if len(pushes) == 1:
+        return pushes[0]
+
+    counts = Counter(p.get("type") for p in pushes)
+    parts = [f"{_DIGEST_LABELS.get(t, '새 알림')} {n}건" for t, n in counts.most_common()]
+    case_ids = {p["case_id"] for p in pushes if p.get("case_id")}
+    qr_ids = {p["quote_request_id"] for p in pushes if p.get("quote_request_id")}
+    if case_ids:
+        parts.append(f"케이스 {len(case_ids)}건")
+    if qr_ids:
+        parts.append(f"Quote Request {len(qr_ids)}건")
+
+    # Deep-link only when everything points at the same item
+    single_target = len(case_ids) + len(qr_ids) == 1
+    return {
+        "user_id": user_id,
+        "title": PUSH_TITLE,
+        "body": " · ".join(parts),
+        "case_id": next(iter(case_ids)) if single_target and case_ids else None,
+        "quote_request_id": next(iter(qr_ids)) if single_target and qr_ids else None,
+    }
+
+
 @contextmanager
 def db_session():
     """Celery 태스크용 DB 세션 컨텍스트 매니저."""
@@ -53,53 +172,63 @@ def db_session():
         db.close()
 
 
-@celery.task
-def check_pending_cases():
-    """24시간 이상 미처리 상태인 CS Case의 담당자에게 리마인드 알림을 생성한다."""
-    with db_session() as db:
-        threshold = datetime.utcnow() - timedelta(hours=24)
-        pending_cases = (
-            db.query(CSCase)
-            .filter(CSCase.status != CaseStatus.DONE, CSCase.created_at <= threshold)
-            .all()
+def _pending_reminders_stmt(threshold: datetime):
+    """(case id, title, assignee id) of not-DONE cases older than threshold, not reminded since."""
+    # 최근 24시간 내 동일 케이스 리마인드가 있으면 제외 (NOT EXISTS)
+    recently_reminded = (
+        select(Notification.id)
+        .where(
+            Notification.case_id == CSCase.id,
+            Notification.type == NotificationType.REMINDER,
+            Notification.created_at >= threshold,
+        )
+        .exists()
+    )
+    return (
+        select(CSCase.id, CSCase.title, case_assignees.c.user_id)
+        .join(case_assignees, case_assignees.c.case_id == CSCase.id)
+        .where(
+            CSCase.status != CaseStatus.DONE,
+            CSCase.created_at <= threshold,
+            ~recently_reminded,
         )
+        .order_by(CSCase.id)
+    )
 
-        created = 0
-        push_targets = []  # (user_id, message, case_id)
-        for case in pending_cases:
-            if not case.assignees:
-                continue
 
-            # 이미 동일 리마인드가 최근 24시간 내에 존재하면 중복 생성 방지
-            existing = (
-                db.query(Notification)
-                .filter(
-                    Notification.case_id == case.id,
-                    Notification.type == NotificationType.REMINDER,
-                    Notification.created_at >= threshold,
-                )
-                .first()
-            )
-            if existing:
-                continue
-
-            for assignee in case.assignees:
-                msg = f"CS Case #{case.id} 미처리 24시간 경과: {case.title[:50]}"
-                notif = Notification(
-                    user_id=assignee.id,
-                    case_id=case.id,
-                    message=msg,
-                    type=NotificationType.REMINDER,
-                )
-                db.add(notif)
-                push_targets.append((assignee.id, msg, case.id))
-                created += 1
+@celery.task
+def check_pending_cases():
+    """24시간 이상 미처리 상태인 CS Case의 담당자에게 리마인드 알림을 생성한다.
 
+    (케이스, 담당자) 쌍을 anti-join 쿼리 한 번으로 조회하고 알림은 bulk insert.
+    """
+    with db_session() as db:
+        threshold = datetime.utcnow() - timedelta(hours=24)
+        rows = db.execute(_pending_reminders_stmt(threshold)).all()
+        if not rows:
+            return {"checked": 0, "notifications_created": 0}
+
+        values = [
+            {
+                "user_id": user_id,
+                "case_id": case_id,
+                "message": f"CS Case #{case_id} 미처리 24시간 경과: {title[:50]}",
+                "type": NotificationType.REMINDER,
+            }
+            for case_id, title, user_id in rows
+        ]
+        inserted = db.execute(insert(Notification).returning(*_STREAM_COLUMNS), values).all()
         db.commit()
+        _announce_rows(inserted)
 
-        for uid, msg, cid in push_targets:
-            send_push_to_user(db, uid, PUSH_TITLE, msg, cid)
-        return {"checked": len(pending_cases), "notifications_created": created}
+        _dispatch_pushes([
+            {
+                "user_id": v["user_id"], "title": PUSH_TITLE, "body": v["message"],
+                "type": NotificationType.REMINDER.value, "case_id": v["case_id"],
+            }
+            for v in values
+        ])
+        return {"checked": len({r.id for r in rows}), "notifications_created": len(values)}
 
 
 @celery.task
@@ -132,6 +261,26 @@ def notify_case_assigned(case_id: int, assignee_ids: list):
         return {"notified": True, "notified_user_ids": notified}
 
 
+@celery.task
+def notify_cases_assigned(user_id: int, case_ids: list):
+    """일괄 배정(POST /cases/bulk) 시 사용자당 하나로 합친 배정 알림."""
+    with db_session() as db:
+        cases = db.query(CSCase.id, CSCase.title).filter(CSCase.id.in_(case_ids)).order_by(CSCase.id).all()
+        if not cases:
+            return {"notified": False, "reason": "no cases"}
+
+        if len(cases) == 1:
+            msg = f"CS Case #{cases[0].id} '{cases[0].title[:50]}' 담당으로 배정되었습니다."
+            case_id = cases[0].id
+        else:
+            ids = ", ".join(f"#{c.id}" for c in cases[:10])
+            more = f" 외 {len(cases) - 10}건" if len(cases) > 10 else ""
+            msg = f"CS Case {len(cases)}건 담당으로 배정되었습니다: {ids}{more}"
+            case_id = None
+        notified = _create_and_push(db, [user_id], msg, NotificationType.ASSIGNEE, case_id=case_id)
+        return {"notified": bool(notified), "case_ids": [c.id for c in cases]}
+
+
 @celery.task
 def notify_reply(case_id: int, parent_author_id: int, replier_name: str, replier_id: int):
     """답글 작성 시 부모 댓글 작성자에게 비동기 알림을 생성한다."""
@@ -176,24 +325,61 @@ def notify_quote_request_comment(qr_id: int, comment_author_id: int, content: st
 
 
 @celery.task
-def learn_tags_from_case(case_id: int):
-    """Learn keyword weights for tags attached to a case (async)."""
+def learn_tags_from_case(case_id: int, previous: dict | None = None, current: dict | None = None):
+    """Learn keyword weights for tags attached to a case (async).
+
+    previous / current: {"title", "content", "tags"} snapshots taken before and
+    after the edit that dispatched this task. previous is subtracted and current
+    learned, so queued tasks for quick successive edits each apply their own
+    change. Without current the case row is read when the task runs.
+    """
     with db_session() as db:
+        return _learn_case(db, case_id, previous, current)
+
+
+@celery.task
+def learn_tags_from_cases(changes: list):
+    """Batched learn_tags_from_case for bulk edits.
+
+    changes: [{"case_id", "previous", "current"}], as in learn_tags_from_case.
+    """
+    with db_session() as db:
+        results = [_learn_case(db, c["case_id"], c.get("previous"), c.get("current")) for c in changes]
+    return {"cases": len(results), "learned": sum(1 for r in results if r["learned"])}
+
+
+def _learn_case(db, case_id: int, previous: dict | None, current: dict | None = None) -> dict:
+    if current is None:
         case = db.query(CSCase).filter(CSCase.id == case_id).first()
-        if not case or not case.tags:
+        if not case:
             return {"learned": False, "reason": "no case or no tags"}
-
-        keywords_count = learn_from_case(
-            tags=case.tags,
-            title=case.title,
-            content=case.content or "",
+        current = {"title": case.title, "content": case.content, "tags": case.tags}
+
+    unlearned_count = 0
+    if previous and previous.get("tags"):
+        unlearned_count = unlearn_from_case(
+            tags=previous["tags"],
+            title=previous.get("title") or "",
+            content=previous.get("content") or "",
             db=db,
         )
-        return {
-            "learned": True,
-            "tags": case.tags,
-            "keywords_count": keywords_count,
-        }
+
+    if not current.get("tags"):
+        db.commit()
+        return {"learned": False, "reason": "no case or no tags", "unlearned_count": unlearned_count}
+
+    keywords_count = learn_from_case(
+        tags=current["tags"],
+        title=current.get("title") or "",
+        content=current.get("content") or "",
+        db=db,
+    )
+    return {
+        "learned": True,
+        "tags": current["tags"],
+        "keywords_count": keywords_count,
+        "unlearned_count": unlearned_count,
+    }
 
 
 @celery.task
@@ -240,45 +426,241 @@ def cleanup_tag_keywords():
 
 
 @celery.task
-def compute_case_similarity(case_id: int):
-    """Compute similar cases for a given case and cache results in Redis."""
-    from services.cache import cache_similar_cases
-    from services.similarity import MAX_SIMILAR_BATCH, find_similar_cases
+def purge_read_notifications(
+    retention_days: int = NOTIFICATION_RETENTION_DAYS, batch_size: int = NOTIFICATION_PURGE_BATCH,
+):
+    """Daily: delete read notifications older than retention_days.
+
+    Deletes in id batches with a commit per batch, so locks stay short and the
+    WAL/replication stream is not flooded by one huge DELETE. Unread rows are
+    kept regardless of age.
+    """
+    threshold = datetime.utcnow() - timedelta(days=retention_days)
+    deleted = 0
+    with db_session() as db:
+        while True:
+            batch = (
+                db.query(Notification.id)
+                .filter(Notification.is_read == True, Notification.created_at < threshold)  # noqa: E712
+                .order_by(Notification.id)
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            removed = (
+                db.query(Notification)
+                .filter(Notification.id.in_(batch))
+                .delete(synchronize_session=False)
+            )
+            db.commit()
+            deleted += removed
+            if removed < batch_size:
+                break
+
+    logger.info("Notification purge: deleted=%d (older than %d days)", deleted, retention_days)
+    return {"deleted": deleted}
+
+
+@celery.task
+def rebuild_case_stat_rollups():
+    """Backfill / nightly repair: recompute case_stat_daily from cs_cases."""
+    with db_session() as db:
+        rows = stat_rollups.rebuild(db)
+        db.commit()
+    bump_stats_version()
+    logger.info("Case stat rollups rebuilt: %d rows", rows)
+    return {"rows": rows}
+
+
+def schedule_case_similarity(case_id: int):
+    """Debounced dispatch of compute_case_similarity.
+
+    Each call claims a fresh token and delays the task by the debounce window;
+    earlier pending tasks for the same case see a stale token and exit early.
+    """
+    from services.cache import SIMILARITY_DEBOUNCE_SECONDS, claim_similarity_token
+
+    token = claim_similarity_token(case_id)
+    compute_case_similarity.apply_async((case_id, token), countdown=SIMILARITY_DEBOUNCE_SECONDS)
+
+
+def schedule_neighbour_refresh(case_ids: list):
+    """Debounced dispatch of refresh_similar_neighbours, MAX_SIMILAR_BATCH ids per task.
+
+    Claims the same per-case tokens as schedule_case_similarity, so a burst of
+    edits queues refreshes that all but the last skip, and a pending
+    compute_case_similarity for one of these cases is superseded rather than
+    run twice.
+    """
+    from services.cache import SIMILARITY_DEBOUNCE_SECONDS, claim_similarity_tokens
+    from services.similarity import MAX_SIMILAR_BATCH
+
+    case_ids = list(dict.fromkeys(case_ids))
+    tokens = claim_similarity_tokens(case_ids) if case_ids else []
+    for i in range(0, len(case_ids), MAX_SIMILAR_BATCH):
+        refresh_similar_neighbours.apply_async(
+            (case_ids[i:i + MAX_SIMILAR_BATCH], tokens[i:i + MAX_SIMILAR_BATCH]),
+            countdown=SIMILARITY_DEBOUNCE_SECONDS,
+        )
+
+
+@celery.task
+def compute_case_similarity(case_id: int, token: str | None = None):
+    """Compute similar cases for a given case and cache results in Redis.
+
+    When dispatched via schedule_case_similarity (token given), the task is
+    skipped if a newer dispatch superseded it or if title/content/tags are
+    unchanged since the cached result was computed.
+    """
+    from services.cache import (
+        cache_similar_cases,
+        get_cached_similar_cases,
+        get_similarity_fingerprint,
+        is_latest_similarity_token,
+        set_similarity_fingerprint,
+        similarity_fingerprint,
+    )
+    from services.similarity import (
+        MAX_SIMILAR_BATCH,
+        SIMILARITY_STREAM_CHUNK,
+        find_similar_case_ids_streaming,
+        find_similar_cases,
+    )
+
+    if token is not None and not is_latest_similarity_token(case_id, token):
+        return {"case_id": case_id, "similar_count": 0, "skipped": True, "reason": "superseded"}
 
     with db_session() as db:
-        target = db.query(CSCase).filter(CSCase.id == case_id).first()
+        target = (
+            db.query(CSCase.id, CSCase.title, CSCase.content, CSCase.tags)
+            .filter(CSCase.id == case_id)
+            .first()
+        )
         if not target:
             return {"case_id": case_id, "similar_count": 0, "reason": "case not found"}
 
-        all_cases = db.query(CSCase).filter(CSCase.id != case_id).all()
-        if not all_cases:
-            return {"case_id": case_id, "similar_count": 0}
-
-        matches = find_similar_cases(
+        fingerprint = similarity_fingerprint(target.title, target.content or "", target.tags or [])
+        if (
+            token is not None
+            and get_similarity_fingerprint(case_id) == fingerprint
+            and get_cached_similar_cases(case_id) is not None
+        ):
+            return {"case_id": case_id, "similar_count": 0, "skipped": True, "reason": "unchanged"}
+
+        # Column tuples streamed with a server-side cursor (no ORM objects)
+        candidates = (
+            db.query(CSCase.id, CSCase.title, CSCase.content, CSCase.tags)
+            .filter(CSCase.id != case_id)
+            .yield_per(SIMILARITY_STREAM_CHUNK)
+        )
+        top = find_similar_case_ids_streaming(
             target.title, target.content or "", target.tags or [],
-            all_cases, top_n=MAX_SIMILAR_BATCH,
+            candidates, top_n=MAX_SIMILAR_BATCH,
         )
-        top = [{"case_id": m["case"].id, "score": m["score"]} for m in matches]
+        if top is None:
+            # No stored model yet: fit on the corpus once (bounded in find_similar_cases)
+            all_cases = candidates.all()
+            if not all_cases:
+                return {"case_id": case_id, "similar_count": 0}
+            matches = find_similar_cases(
+                target.title, target.content or "", target.tags or [],
+                all_cases, top_n=MAX_SIMILAR_BATCH,
+            )
+            top = [{"case_id": m["case"].id, "score": m["score"]} for m in matches]
+
         cache_similar_cases(case_id, top)
+        set_similarity_fingerprint(case_id, fingerprint)
         return {"case_id": case_id, "similar_count": len(top)}
 
 
-@celery.task
-def rebuild_tfidf_model():
-    """Rebuild TF-IDF model from all cases and recompute similarity caches."""
+def _top_similar(all_cases: list, i: int, title_sims, content_sims, top_n: int) -> list[dict]:
+    """Top-N neighbours of all_cases[i] from its row of the title/content similarity matrices."""
     import numpy as np
+
+    from services.similarity import SIMILARITY_THRESHOLD, compute_tag_similarity
+
+    target_tags = all_cases[i].tags or []
+    tag_sims = np.array([compute_tag_similarity(target_tags, c.tags or []) for c in all_cases])
+    combined_scores = tag_sims * 0.5 + title_sims * 0.3 + content_sims * 0.2
+
+    # Exclude self at index i
+    combined_scores[i] = -1.0
+    top_indices = np.argsort(combined_scores)[::-1][:top_n]
+    return [
+        {"case_id": all_cases[j].id, "score": round(float(combined_scores[j]), 4)}
+        for j in top_indices
+        if combined_scores[j] >= SIMILARITY_THRESHOLD
+    ]
+
+
+@celery.task
+def refresh_similar_neighbours(case_ids: list, tokens: list | None = None):
+    """Recompute cached similar lists of the given cases in one batch.
+
+    Dispatched when a case is edited or deleted so that entries referencing it
+    (found via the reverse-neighbour index) are refreshed before the nightly rebuild.
+    The corpus is vectorized once and every target scored against that matrix.
+    With tokens (from schedule_neighbour_refresh), superseded ids are skipped.
+    """
     from sklearn.metrics.pairwise import cosine_similarity as sk_cosine
 
-    from services.cache import cache_similar_cases
+    from services.cache import cache_similar_cases_many, invalidate_similar_cache, latest_similarity_ids
     from services.similarity import (
-        SIMILARITY_THRESHOLD,
+        MAX_SIMILAR_BATCH,
         CaseSimilarityEngine,
-        compute_tag_similarity,
+        load_model_from_redis,
         save_model_to_redis,
     )
 
+    requested = len(case_ids)
+    if tokens is not None:
+        case_ids = latest_similarity_ids(case_ids, tokens)
+        if not case_ids:
+            return {"requested": requested, "refreshed": 0, "skipped": True, "reason": "superseded"}
+
     with db_session() as db:
-        all_cases = db.query(CSCase).all()
+        all_cases = db.query(CSCase.id, CSCase.title, CSCase.content, CSCase.tags).all()
+
+    positions = {c.id: i for i, c in enumerate(all_cases)}
+    targets = []
+    for cid in dict.fromkeys(case_ids):
+        if cid in positions:
+            targets.append(positions[cid])
+        else:
+            invalidate_similar_cache(cid)
+    if not targets:
+        return {"requested": requested, "refreshed": 0}
+
+    titles = [c.title for c in all_cases]
+    contents = [c.content or "" for c in all_cases]
+    engine = load_model_from_redis()
+    if engine is None or not engine._fitted:
+        engine = CaseSimilarityEngine()
+        engine.fit(titles, contents)
+        save_model_to_redis(engine)
+
+    title_vecs = engine.batch_title_vectors(titles)
+    content_vecs = engine.batch_content_vectors(contents)
+    # One row per target against the whole corpus (len(targets) x n)
+    title_sims = sk_cosine(title_vecs[targets], title_vecs)
+    content_sims = sk_cosine(content_vecs[targets], content_vecs)
+
+    cache_similar_cases_many({
+        all_cases[i].id: _top_similar(all_cases, i, title_sims[row], content_sims[row], MAX_SIMILAR_BATCH)
+        for row, i in enumerate(targets)
+    })
+    return {"requested": requested, "refreshed": len(targets)}
+
+
+@celery.task
+def rebuild_tfidf_model():
+    """Rebuild TF-IDF model from all cases and recompute similarity caches."""
+    from sklearn.metrics.pairwise import cosine_similarity as sk_cosine
+
+    from services.cache import cache_similar_cases_many
+    from services.similarity import MAX_SIMILAR_BATCH, CaseSimilarityEngine, save_model_to_redis
+
+    with db_session() as db:
+        all_cases = db.query(CSCase.id, CSCase.title, CSCase.content, CSCase.tags).all()
         n = len(all_cases)
         if n < 2:
             return {"cases_count": n, "model_saved": False, "reason": "not enough cases"}
@@ -298,27 +680,101 @@ def rebuild_tfidf_model():
         title_sim_matrix = sk_cosine(title_vecs)
         content_sim_matrix = sk_cosine(content_vecs)
 
-        # Recompute similarity cache for every case
-        for i, target in enumerate(all_cases):
-            target_tags = target.tags or []
-            combined_scores = np.zeros(n)
-            for j, other in enumerate(all_cases):
-                if i == j:
-                    continue
-                tag_sim = compute_tag_similarity(target_tags, other.tags or [])
-                combined_scores[j] = (
-                    tag_sim * 0.5 + title_sim_matrix[i, j] * 0.3 + content_sim_matrix[i, j] * 0.2
-                )
-
-            # Top 20 via argsort (exclude self at index i)
-            combined_scores[i] = -1.0
-            top_indices = np.argsort(combined_scores)[::-1][:20]
-            scored = [
-                {"case_id": all_cases[j].id, "score": round(float(combined_scores[j]), 4)}
-                for j in top_indices
-                if combined_scores[j] >= SIMILARITY_THRESHOLD
-            ]
-            cache_similar_cases(target.id, scored)
+        # Recompute similarity cache for every case (one MGET + one pipeline)
+        cache_similar_cases_many({
+            target.id: _top_similar(all_cases, i, title_sim_matrix[i], content_sim_matrix[i], MAX_SIMILAR_BATCH)
+            for i, target in enumerate(all_cases)
+        })
 
         logger.info("TF-IDF model rebuilt for %d cases", n)
         return {"cases_count": n, "model_saved": True}
+
+
+# ---------------------------------------------------------------------------
+# Web Push delivery (queue: push)
+# ---------------------------------------------------------------------------
+
+
+def _retry_countdown(attempt: int, retry_after: float | None) -> int:
+    """Exponential backoff, never earlier than the push service's Retry-After.
+
+    PUSH_RETRY_MAX_SECONDS caps only the backoff; a longer Retry-After wins.
+    """
+    backoff = min(PUSH_RETRY_BASE_SECONDS * (2 ** attempt), PUSH_RETRY_MAX_SECONDS)
+    return int(max(backoff, retry_after or 0))
+
+
+def _handle_push_results(db, jobs, results, attempt: int) -> dict:
+    """만료 구독 삭제, 재시도 예약, 재시도 소진 시 dead-letter 기록."""
+    remove_expired_subscriptions(db, results)
+
+    retry_groups = defaultdict(list)
+    dead = []
+    for job, result in zip(jobs, results):
+        if result.outcome != "retry":
+            continue
+        if attempt + 1 >= PUSH_MAX_RETRIES:
+            dead.append((job, result))
+        else:
+            retry_groups[_retry_countdown(attempt, result.retry_after)].append(job)
+
+    if dead:
+        db.execute(insert(PushDeadLetter), [
+            {
+                "subscription_id": job[0],
+                "endpoint": job[1]["endpoint"],
+                "payload": job[2],
+                "last_status": result.status,
+                "error": result.error,
+                "attempts": attempt + 1,
+            }
+            for job, result in dead
+        ])
+        db.commit()
+        logger.warning("Dead-lettered %d pushes after %d attempts", len(dead), attempt + 1)
+
+    for countdown, retry_jobs in retry_groups.items():
+        retry_push_jobs.apply_async(
+            ([list(job) for job in retry_jobs], attempt + 1), countdown=countdown,
+        )
+
+    return {
+        "sent": sum(1 for r in results if r.outcome == "sent"),
+        "expired": sum(1 for r in results if r.outcome == "expired"),
+        "retrying": sum(len(j) for j in retry_groups.values()),
+        "dead_lettered": len(dead),
+    }
+
+
+@celery.task
+def deliver_push_batch(pushes: list):
+    """사용자 단위 푸시 목록을 구독별로 전개해 전송한다.
+
+    Args:
+        pushes: {"user_id", "title", "body", "case_id"?, "quote_request_id"?} 목록.
+    """
+    if not pushes or not push_enabled():
+        return {"sent": 0, "expired": 0, "retrying": 0, "dead_lettered": 0}
+    with db_session() as db:
+        jobs = build_push_jobs(db, pushes)
+        return _handle_push_results(db, jobs, deliver_pushes(jobs), attempt=0)
+
+
+@celery.task
+def flush_push_digest(user_id: int):
+    """coalescing 구간이 끝나면 보류된 푸시를 요약 1건으로 push 큐에 넘긴다."""
+    pushes = pop_digest_pushes(user_id)
+    if not pushes:
+        return {"flushed": 0}
+    deliver_push_batch.delay([_build_digest(user_id, pushes)])
+    return {"flushed": len(pushes)}
+
+
+@celery.task
+def retry_push_jobs(jobs: list, attempt: int):
+    """재시도 대상 구독별 푸시 재전송 (jobs: [subscription_id, subscription_info, payload])."""
+    if not jobs or not push_enabled():
+        return {"sent": 0, "expired": 0, "retrying": 0, "dead_lettered": 0}
+    jobs = [tuple(job) for job in jobs]
+    with db_session() as db:
+        return _handle_push_results(db, jobs, deliver_pushes(jobs), attempt)
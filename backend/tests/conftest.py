@@ -2,7 +2,8 @@
 공통 테스트 Fixture.
 - PostgreSQL 테스트 DB 사용 (ARRAY 타입 호환)
 - 테스트마다 테이블 truncate + 시퀀스 리셋으로 격리
-- get_current_user를 오버라이드하여 인증 자동 적용
+- get_current_user(_async)를 오버라이드하여 인증 자동 적용
+- async 엔드포인트는 같은 테스트 DB에 asyncpg(NullPool)로 접속
 - Celery task_always_eager로 비동기 태스크 동기 실행
 """
 
@@ -10,14 +11,16 @@ import os
 
 import pytest
 from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from fastapi.testclient import TestClient
 from unittest.mock import patch
 
-from database import Base, get_db
+from database import Base, async_url, get_async_db, get_async_read_db, get_db, get_read_db
 from main import app
 from models import User, UserRole
-from routers.auth import pwd_context, create_access_token, get_current_user
+from routers.auth import pwd_context, create_access_token, get_current_user, get_current_user_async
 
 TEST_DB_URL = os.getenv(
     "TEST_DATABASE_URL",
@@ -27,6 +30,16 @@ TEST_DB_URL = os.getenv(
 engine = create_engine(TEST_DB_URL)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# TestClient runs each `with` block on its own event loop — NullPool keeps
+# asyncpg connections from outliving the loop that opened them.
+async_engine = create_async_engine(async_url(TEST_DB_URL), poolclass=NullPool)
+AsyncTestingSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+async def _override_async_db():
+    async with AsyncTestingSessionLocal() as db:
+        yield db
+
 
 # ---- session-scoped: 테이블 생성/삭제 ----
 
@@ -88,7 +101,11 @@ def client(db_session, test_user):
         return test_user
 
     app.dependency_overrides[get_db] = _override_db
+    app.dependency_overrides[get_read_db] = _override_db
+    app.dependency_overrides[get_async_db] = _override_async_db
+    app.dependency_overrides[get_async_read_db] = _override_async_db
     app.dependency_overrides[get_current_user] = _override_user
+    app.dependency_overrides[get_current_user_async] = _override_user
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
@@ -104,6 +121,9 @@ def unauth_client(db_session):
             pass
 
     app.dependency_overrides[get_db] = _override_db
+    app.dependency_overrides[get_read_db] = _override_db
+    app.dependency_overrides[get_async_db] = _override_async_db
+    app.dependency_overrides[get_async_read_db] = _override_async_db
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
@@ -130,6 +150,35 @@ def auth_headers(test_user):
     return {"Authorization": f"Bearer {token}"}
 
 
+# ---- 인증 사용자 캐시: 테스트 간 id 재사용으로 인한 오염 방지 ----
+
+@pytest.fixture(autouse=True)
+def user_cache_isolation():
+    from services import user_cache
+    user_cache.clear()
+    with patch("services.user_cache._ensure_listener"):
+        yield
+    user_cache.clear()
+
+
+class _FakePipeline:
+    """Queues commands and replays them on the faked client at execute()."""
+
+    def __init__(self, client):
+        self._client = client
+        self._calls = []
+
+    def __getattr__(self, name):
+        def _queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+            return self
+        return _queue
+
+    def execute(self):
+        calls, self._calls = self._calls, []
+        return [getattr(self._client, name)(*args, **kwargs) for name, args, kwargs in calls]
+
+
 # ---- Celery eager mode: 비동기 태스크를 동기 실행 ----
 
 @pytest.fixture(autouse=True)
@@ -144,20 +193,72 @@ def celery_eager(db_session):
     # In-memory cache store to avoid real Redis in tests
     _fake_cache = {}
 
-    def _fake_set(key, value, ex=None):
+    def _fake_set(key, value, ex=None, nx=False):
+        if nx and key in _fake_cache:
+            return None
         _fake_cache[key] = value
+        return True
 
     def _fake_get(key):
         return _fake_cache.get(key)
 
+    def _fake_mget(keys, *args):
+        keys = (list(keys) if isinstance(keys, (list, tuple)) else [keys]) + list(args)
+        return [_fake_cache.get(k) for k in keys]
+
+    def _fake_incr(key):
+        _fake_cache[key] = int(_fake_cache.get(key, 0)) + 1
+        return _fake_cache[key]
+
+    def _fake_getdel(key):
+        return _fake_cache.pop(key, None)
+
     def _fake_delete(key):
         _fake_cache.pop(key, None)
 
+    def _fake_sadd(key, *members):
+        _fake_cache.setdefault(key, set()).update(members)
+
+    def _fake_srem(key, *members):
+        _fake_cache.get(key, set()).difference_update(members)
+
+    def _fake_smembers(key):
+        return set(_fake_cache.get(key, set()))
+
+    def _fake_eval(script, numkeys, key, delta):
+        # Mirrors services.cache._ADJUST_IF_EXISTS
+        if key not in _fake_cache:
+            return None
+        _fake_cache[key] = max(int(_fake_cache[key]) + int(delta), 0)
+        return _fake_cache[key]
+
+    def _fake_rpush(key, *values):
+        _fake_cache.setdefault(key, []).extend(values)
+
+    def _fake_lrange(key, start, end):
+        items = _fake_cache.get(key, [])
+        return list(items[start:] if end == -1 else items[start:end + 1])
+
+    def _fake_ltrim(key, start, end):
+        items = _fake_cache.get(key, [])
+        _fake_cache[key] = items[start:] if end == -1 else items[start:end + 1]
+
     with patch("tasks.SessionLocal", return_value=db_session), \
          patch("services.cache.cache_redis") as mock_redis:
         mock_redis.set = _fake_set
         mock_redis.get = _fake_get
+        mock_redis.mget = _fake_mget
+        mock_redis.incr = _fake_incr
+        mock_redis.getdel = _fake_getdel
         mock_redis.delete = _fake_delete
+        mock_redis.sadd = _fake_sadd
+        mock_redis.srem = _fake_srem
+        mock_redis.smembers = _fake_smembers
+        mock_redis.eval = _fake_eval
+        mock_redis.rpush = _fake_rpush
+        mock_redis.lrange = _fake_lrange
+        mock_redis.ltrim = _fake_ltrim
+        mock_redis.pipeline = lambda transaction=True: _FakePipeline(mock_redis)
         yield
     db_session.close = original_close
     celery_app.conf.task_always_eager = False
@@ -44,3 +44,71 @@ def test_get_me_no_token(unauth_client):
 def test_get_me_invalid_token(unauth_client):
     resp = unauth_client.get("/auth/me", headers={"Authorization": "Bearer invalid.token.here"})
     assert resp.status_code == 401
+
+
+# ========== Authenticated user cache ==========
+
+
+def test_get_me_served_from_user_cache(unauth_client, db_session, test_user, auth_headers):
+    """Repeat requests with the same token skip the users SELECT."""
+    from sqlalchemy import event
+
+    from tests.conftest import async_engine
+
+    engine = async_engine.sync_engine  # /auth/me runs on the async stack
+    user_selects = []
+
+    def _count(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM users" in statement:
+            user_selects.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        assert unauth_client.get("/auth/me", headers=auth_headers).status_code == 200
+        first = len(user_selects)
+        resp = unauth_client.get("/auth/me", headers=auth_headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert resp.status_code == 200
+    assert resp.json()["email"] == "author@test.com"
+    assert len(user_selects) == first
+
+
+def test_admin_user_update_invalidates_cache(unauth_client, test_user, assignee_user, auth_headers):
+    from unittest.mock import patch
+
+    with patch("services.user_cache.invalidate_user") as mock_invalidate:
+        resp = unauth_client.put(
+            f"/admin/users/{assignee_user.id}", json={"role": "CS"}, headers=auth_headers,
+        )
+    assert resp.status_code == 200
+    mock_invalidate.assert_called_once_with(assignee_user.id)
+
+
+def test_invalidate_user_drops_snapshot(db_session, test_user):
+    from services import user_cache
+
+    user_cache.remember_user(test_user)
+    assert user_cache.get_cached_user(db_session, test_user.id) is not None
+    user_cache.invalidate_user(test_user.id)
+    assert user_cache.get_cached_user(db_session, test_user.id) is None
+
+
+def test_login_rehashes_outdated_bcrypt_cost(unauth_client, db_session, test_user):
+    """A hash made with a different BCRYPT_ROUNDS is upgraded on successful login."""
+    from services.passwords import BCRYPT_ROUNDS, pwd_context
+
+    cheap_rounds = 4 if BCRYPT_ROUNDS != 4 else 5
+    test_user.password_hash = pwd_context.hash("testpass123", rounds=cheap_rounds)
+    db_session.commit()
+
+    resp = unauth_client.post("/auth/login", json={
+        "email": "author@test.com",
+        "password": "testpass123",
+    })
+    assert resp.status_code == 200
+
+    db_session.refresh(test_user)
+    assert test_user.password_hash.startswith(f"$2b${BCRYPT_ROUNDS:02d}$")
+    assert pwd_context.verify("testpass123", test_user.password_hash)
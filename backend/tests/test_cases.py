@@ -247,3 +247,232 @@ def test_case_similar_auth_required(unauth_client):
     """Similar cases endpoint requires authentication."""
     resp = unauth_client.get("/cases/1/similar")
     assert resp.status_code == 401
+
+
+# ========== Reverse-neighbour cache invalidation ==========
+
+
+def test_update_case_refreshes_reverse_neighbours(client, sample_cases_for_similarity):
+    """Editing a case re-schedules the cached lists that reference it."""
+    from unittest.mock import patch
+
+    from services.cache import cache_similar_cases, get_reverse_neighbours
+
+    a, b, _ = sample_cases_for_similarity
+    cache_similar_cases(b["id"], [{"case_id": a["id"], "score": 0.9}])
+    assert b["id"] in get_reverse_neighbours(a["id"])
+
+    with patch("tasks.refresh_similar_neighbours") as mock_refresh:
+        resp = client.put(f"/cases/{a['id']}", json={"title": "완전히 다른 제목"})
+    assert resp.status_code == 200
+    mock_refresh.apply_async.assert_called_once()
+    assert mock_refresh.apply_async.call_args.args[0][0] == [b["id"]]
+    assert mock_refresh.apply_async.call_args.kwargs["countdown"] > 0
+
+
+def test_quick_edits_debounce_reverse_neighbour_refresh(client, sample_cases_for_similarity):
+    """Only the last of several queued reverse-neighbour refreshes does the work."""
+    from unittest.mock import patch
+
+    from services.cache import cache_similar_cases
+    from tasks import refresh_similar_neighbours
+
+    a, b, _ = sample_cases_for_similarity
+    cache_similar_cases(b["id"], [{"case_id": a["id"], "score": 0.9}])
+
+    # Hold the queued refreshes until both edits are saved
+    with patch("tasks.refresh_similar_neighbours") as mock_refresh:
+        client.put(f"/cases/{a['id']}", json={"title": "첫 번째 수정"})
+        client.put(f"/cases/{a['id']}", json={"title": "두 번째 수정"})
+    queued = [call.args[0] for call in mock_refresh.apply_async.call_args_list]
+    assert len(queued) == 2
+
+    results = [refresh_similar_neighbours(*args) for args in queued]
+    assert results[0]["skipped"] is True
+    assert results[1]["refreshed"] == 1
+
+
+def test_delete_case_refreshes_reverse_neighbours(client, sample_cases_for_similarity):
+    """Deleting a case drops it from other cases' cached similar lists."""
+    from services.cache import cache_similar_cases, get_cached_similar_cases, get_reverse_neighbours
+
+    a, b, _ = sample_cases_for_similarity
+    cache_similar_cases(b["id"], [{"case_id": a["id"], "score": 0.9}])
+
+    resp = client.delete(f"/cases/{a['id']}")
+    assert resp.status_code == 204
+
+    cached = get_cached_similar_cases(b["id"])
+    assert cached is not None
+    assert all(item["case_id"] != a["id"] for item in cached)
+    assert get_reverse_neighbours(a["id"]) == []
+
+
+# ========== Export ==========
+
+
+def test_export_cases_csv(client, sample_case, assignee_user):
+    import csv
+    import io
+
+    client.post("/cases/", json={"title": "Other", "content": "C", "requester": "Customer B"})
+
+    resp = client.get("/cases/export", params={"requester": "Customer A"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert "attachment" in resp.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert len(rows) == 1
+    assert rows[0]["id"] == str(sample_case["id"])
+    assert rows[0]["assignee_names"] == assignee_user.name
+    assert rows[0]["tags"] == "test;integration"
+
+
+def test_export_cases_csv_neutralises_formulas(client):
+    import csv
+    import io
+    import json
+
+    title = '=HYPERLINK("http://evil.example","click")'
+    client.post("/cases/", json={"title": title, "content": "-1+1", "requester": "@cust", "tags": ["+x"]})
+
+    row = next(csv.DictReader(io.StringIO(client.get("/cases/export").text)))
+    assert row["title"] == "'" + title
+    assert row["content"] == "'-1+1"
+    assert row["requester"] == "'@cust"
+    assert row["tags"] == "'+x"
+
+    ndjson = json.loads(client.get("/cases/export", params={"format": "ndjson"}).text.splitlines()[0])
+    assert ndjson["title"] == title
+
+
+def test_export_cases_ndjson_spans_batches(client):
+    import json
+    from unittest.mock import patch
+
+    for i in range(5):
+        client.post("/cases/", json={"title": f"Case {i}", "content": "C", "requester": "Cust"})
+
+    with patch("services.export.EXPORT_BATCH_SIZE", 2):
+        resp = client.get("/cases/export", params={"format": "ndjson", "status": "OPEN"})
+    assert resp.status_code == 200
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert sorted(r["title"] for r in rows) == [f"Case {i}" for i in range(5)]
+    assert rows[0]["status"] == "OPEN"
+
+
+def test_export_cases_non_admin_sees_only_own(client, sample_case, assignee_user):
+    import json
+
+    from main import app
+    from routers.auth import get_current_user
+
+    client.post("/cases/", json={"title": "Not mine", "content": "C", "requester": "Cust"})
+    app.dependency_overrides[get_current_user] = lambda: assignee_user
+    resp = client.get("/cases/export", params={"format": "ndjson"})
+    assert [json.loads(line)["id"] for line in resp.text.splitlines()] == [sample_case["id"]]
+
+
+def test_export_cases_invalid_format(client):
+    assert client.get("/cases/export", params={"format": "xlsx"}).status_code == 400
+
+
+# ========== Bulk operations ==========
+
+
+def _new_cases(client, n, **fields):
+    return [
+        client.post("/cases/", json={"title": f"Bulk {i}", "content": "C", "requester": "Cust", **fields}).json()["id"]
+        for i in range(n)
+    ]
+
+
+def test_bulk_status_update(client):
+    ids = _new_cases(client, 3)
+
+    resp = client.post("/cases/bulk", json={"case_ids": ids, "status": "DONE"})
+    assert resp.status_code == 200
+    assert resp.json()["updated_ids"] == ids
+    for cid in ids:
+        case = client.get(f"/cases/{cid}").json()
+        assert case["status"] == "DONE"
+        assert case["completed_at"] is not None
+
+    stats = client.get("/cases/statistics/", params={"by": "status"}).json()
+    assert stats == [{"status": "DONE", "count": 3}]
+
+
+def test_bulk_assign_notifies_each_user_once(client, db_session, assignee_user):
+    from unittest.mock import patch
+
+    from models import Notification, NotificationType
+
+    ids = _new_cases(client, 3)
+    with patch("routers.cases.notify_cases_assigned") as mock_notify:
+        resp = client.post("/cases/bulk", json={"case_ids": ids, "assignee_ids": [assignee_user.id]})
+    assert resp.status_code == 200
+    mock_notify.delay.assert_called_once_with(assignee_user.id, ids)
+    assert all(client.get(f"/cases/{cid}").json()["assignee_ids"] == [assignee_user.id] for cid in ids)
+
+    # Re-assigning the same user to one more case only notifies about that case (eager mode)
+    extra = _new_cases(client, 1)
+    client.post("/cases/bulk", json={"case_ids": ids + extra, "assignee_ids": [assignee_user.id]})
+    notifs = (
+        db_session.query(Notification)
+        .filter(Notification.user_id == assignee_user.id, Notification.type == NotificationType.ASSIGNEE)
+        .all()
+    )
+    assert [n.case_id for n in notifs] == extra
+
+
+def test_bulk_tags_single_learning_and_similarity_dispatch(client):
+    from unittest.mock import patch
+
+    ids = _new_cases(client, 2, tags=["old", "keep"])
+    with patch("routers.cases.learn_tags_from_cases") as mock_learn, \
+            patch("tasks.refresh_similar_neighbours") as mock_refresh:
+        resp = client.post("/cases/bulk", json={
+            "case_ids": ids, "add_tags": ["new", "keep"], "remove_tags": ["old"],
+        })
+    assert resp.status_code == 200
+    assert [client.get(f"/cases/{cid}").json()["tags"] for cid in ids] == [["keep", "new"]] * 2
+    mock_learn.delay.assert_called_once()
+    assert [c["case_id"] for c in mock_learn.delay.call_args.args[0]] == ids
+    mock_refresh.apply_async.assert_called_once()
+    assert set(ids) <= set(mock_refresh.apply_async.call_args.args[0][0])
+    assert mock_refresh.apply_async.call_args.kwargs["countdown"] > 0
+
+
+def test_bulk_similarity_refresh_is_chunked(client):
+    from unittest.mock import patch
+
+    from services.similarity import MAX_SIMILAR_BATCH
+
+    ids = _new_cases(client, MAX_SIMILAR_BATCH + 1)
+    with patch("tasks.refresh_similar_neighbours") as mock_refresh:
+        client.post("/cases/bulk", json={"case_ids": ids, "add_tags": ["chunk"]})
+    chunks = [call.args[0][0] for call in mock_refresh.apply_async.call_args_list]
+    assert [len(c) for c in chunks] == [MAX_SIMILAR_BATCH, 1]
+    assert [cid for c in chunks for cid in c] == ids
+
+
+def test_bulk_validation(client):
+    ids = _new_cases(client, 1)
+    assert client.post("/cases/bulk", json={"case_ids": [], "status": "DONE"}).status_code == 400
+    assert client.post("/cases/bulk", json={"case_ids": ids}).status_code == 400
+    missing = client.post("/cases/bulk", json={"case_ids": ids + [99999], "status": "DONE"})
+    assert missing.status_code == 404
+    assert client.get(f"/cases/{ids[0]}").json()["status"] == "OPEN"
+
+
+def test_bulk_status_requires_assignee(client, assignee_user):
+    from main import app
+    from routers.auth import get_current_user
+
+    mine = _new_cases(client, 1, assignee_ids=[assignee_user.id])
+    other = _new_cases(client, 1)
+    app.dependency_overrides[get_current_user] = lambda: assignee_user
+
+    resp = client.post("/cases/bulk", json={"case_ids": mine + other, "status": "DONE"})
+    assert resp.status_code == 403
+    assert client.post("/cases/bulk", json={"case_ids": mine, "status": "DONE"}).status_code == 200
@@ -134,6 +134,29 @@ def test_check_pending_dedup(db_session):
     assert result["notifications_created"] == 0
 
 
+def test_check_pending_batches_multiple_cases(db_session):
+    """Several pending cases/assignees → one bulk insert and one batched push call."""
+    u1 = _make_user(db_session, name="U1", email="u1@t.com")
+    u2 = _make_user(db_session, name="U2", email="u2@t.com")
+    old_time = datetime.utcnow() - timedelta(hours=25)
+    _make_case(db_session, assignees=[u1, u2], created_at=old_time)
+    _make_case(db_session, assignees=[u2], created_at=old_time)
+
+    with patch("tasks.SessionLocal", return_value=db_session), \
+         patch.object(db_session, "close"), \
+         patch("tasks._dispatch_pushes") as mock_push:
+        from tasks import check_pending_cases
+        result = check_pending_cases()
+
+    assert result["checked"] == 2
+    assert result["notifications_created"] == 3
+    mock_push.assert_called_once()
+    assert len(mock_push.call_args[0][0]) == 3
+    assert db_session.query(Notification).filter(
+        Notification.type == NotificationType.REMINDER,
+    ).count() == 3
+
+
 # ========== notify_comment ==========
 
 
@@ -189,6 +212,42 @@ def test_notify_comment_skips_self(db_session):
     assert result["notified"] is False
 
 
+def test_notify_cases_assigned_coalesces_cases(db_session):
+    user = _make_user(db_session)
+    cases = [_make_case(db_session, assignees=[user]) for _ in range(3)]
+
+    with patch("tasks.SessionLocal", return_value=db_session):
+        with patch.object(db_session, "close"):
+            from tasks import notify_cases_assigned
+            result = notify_cases_assigned(user.id, [c.id for c in cases])
+
+    assert result["notified"] is True
+    notifs = db_session.query(Notification).filter(Notification.user_id == user.id).all()
+    assert len(notifs) == 1
+    assert notifs[0].case_id is None
+    assert notifs[0].message.startswith("CS Case 3건")
+
+
+# ========== _create_and_push ==========
+
+
+def test_create_and_push_bulk_inserts_and_batches_push(db_session):
+    """All recipients are written in one INSERT and pushed via a single batch call."""
+    users = [_make_user(db_session, name=f"U{i}", email=f"bulk{i}@t.com") for i in range(3)]
+    case = _make_case(db_session)
+
+    with patch("tasks._dispatch_pushes") as mock_push:
+        from tasks import _create_and_push
+        notified = _create_and_push(
+            db_session, [u.id for u in users], "msg", NotificationType.ASSIGNEE, case_id=case.id,
+        )
+
+    assert notified == [u.id for u in users]
+    mock_push.assert_called_once()
+    assert [p["user_id"] for p in mock_push.call_args[0][0]] == notified
+    assert db_session.query(Notification).filter(Notification.case_id == case.id).count() == 3
+
+
 # ========== notify_reply ==========
 
 
@@ -293,6 +352,42 @@ def test_compute_case_similarity_task(db_session):
     assert result["case_id"] == case1.id
 
 
+def test_compute_case_similarity_skips_superseded_token(db_session):
+    """Only the latest scheduled computation per case runs."""
+    from services.cache import claim_similarity_token, get_cached_similar_cases
+
+    case = _make_case(db_session)
+    stale = claim_similarity_token(case.id)
+    claim_similarity_token(case.id)
+
+    with patch("tasks.SessionLocal", return_value=db_session), \
+         patch.object(db_session, "close"):
+        from tasks import compute_case_similarity
+        result = compute_case_similarity(case.id, stale)
+
+    assert result["skipped"] is True
+    assert result["reason"] == "superseded"
+    assert get_cached_similar_cases(case.id) is None
+
+
+def test_compute_case_similarity_skips_unchanged_text(db_session):
+    """A scheduled run is skipped when title/content/tags match the cached fingerprint."""
+    case1 = _make_case(db_session)
+    _make_case(db_session)
+
+    with patch("tasks.SessionLocal", return_value=db_session), \
+         patch.object(db_session, "close"):
+        from services.cache import claim_similarity_token
+        from tasks import compute_case_similarity
+
+        first = compute_case_similarity(case1.id, claim_similarity_token(case1.id))
+        second = compute_case_similarity(case1.id, claim_similarity_token(case1.id))
+
+    assert "skipped" not in first
+    assert second["skipped"] is True
+    assert second["reason"] == "unchanged"
+
+
 # ========== rebuild_tfidf_model ==========
 
 
@@ -331,6 +426,28 @@ def test_rebuild_tfidf_model_task(db_session):
     assert "tfidf_model" in _cache
 
 
+def test_refresh_similar_neighbours_vectorizes_corpus_once(db_session):
+    """Several neighbours are scored against one corpus transform."""
+    from services.cache import get_cached_similar_cases, get_reverse_neighbours
+    from services.similarity import CaseSimilarityEngine
+    from tasks import refresh_similar_neighbours
+
+    cases = [_make_case(db_session) for _ in range(3)]
+    ids = [c.id for c in cases]
+
+    with patch.object(
+        CaseSimilarityEngine, "batch_title_vectors", autospec=True,
+        side_effect=CaseSimilarityEngine.batch_title_vectors,
+    ) as spy:
+        result = refresh_similar_neighbours(ids[:2] + [99999])
+
+    assert result == {"requested": 3, "refreshed": 2}
+    assert spy.call_count == 1
+    # Identical text and no tags: each refreshed case lists the other two
+    assert {item["case_id"] for item in get_cached_similar_cases(ids[0])} == {ids[1], ids[2]}
+    assert get_reverse_neighbours(ids[2]) == ids[:2]
+
+
 # ========== cleanup_tag_keywords ==========
 
 
@@ -375,3 +492,152 @@ def test_cleanup_tag_keywords_task(db_session):
 
     # Verify seed tag preserved
     assert db_session.query(TagMaster).filter(TagMaster.name == "시드태그").first() is not None
+
+
+# ========== purge_read_notifications ==========
+
+
+def test_purge_read_notifications_in_batches(db_session):
+    """Old read rows go (across several batches); unread and recent rows stay."""
+    user = _make_user(db_session)
+    old = datetime.utcnow() - timedelta(days=100)
+    recent = datetime.utcnow() - timedelta(days=1)
+    rows = (
+        [Notification(user_id=user.id, message="old read", type=NotificationType.COMMENT,
+                      is_read=True, created_at=old) for _ in range(5)]
+        + [Notification(user_id=user.id, message="old unread", type=NotificationType.REMINDER,
+                        is_read=False, created_at=old),
+           Notification(user_id=user.id, message="recent read", type=NotificationType.COMMENT,
+                        is_read=True, created_at=recent)]
+    )
+    db_session.add_all(rows)
+    db_session.commit()
+
+    with patch("tasks.SessionLocal", return_value=db_session), \
+         patch.object(db_session, "close"):
+        from tasks import purge_read_notifications
+        result = purge_read_notifications(retention_days=90, batch_size=2)
+
+    assert result["deleted"] == 5
+    remaining = {n.message for n in db_session.query(Notification).all()}
+    assert remaining == {"old unread", "recent read"}
+
+
+# ========== push digest ==========
+
+
+def test_dispatch_pushes_coalesces_into_digest():
+    """First push in the window goes out at once; the rest merge into one digest."""
+    pushes = [
+        {"user_id": 1, "title": "T", "body": f"c{i}", "type": "COMMENT", "case_id": case_id}
+        for i, case_id in enumerate([10, 10, 11, 12, 12])
+    ]
+    with patch("tasks.push_enabled", return_value=True), \
+         patch("tasks.deliver_push_batch") as mock_deliver, \
+         patch("tasks.flush_push_digest.apply_async") as mock_flush:
+        from tasks import PUSH_DIGEST_WINDOW_SECONDS, _dispatch_pushes, flush_push_digest
+        _dispatch_pushes(pushes)
+
+        mock_deliver.delay.assert_called_once_with([pushes[0]])
+        mock_flush.assert_called_once_with((1,), countdown=PUSH_DIGEST_WINDOW_SECONDS)
+
+        result = flush_push_digest(1)
+
+    assert result == {"flushed": 4}
+    digest = mock_deliver.delay.call_args[0][0]
+    assert len(digest) == 1
+    assert digest[0]["body"] == "새 댓글 4건 · 케이스 3건"
+    assert digest[0]["case_id"] is None
+
+
+def test_build_digest_single_target_keeps_link():
+    from tasks import _build_digest
+
+    pushes = [
+        {"user_id": 1, "title": "T", "body": "a", "type": "COMMENT", "case_id": 5},
+        {"user_id": 1, "title": "T", "body": "b", "type": "ASSIGNEE", "case_id": 5},
+    ]
+    digest = _build_digest(1, pushes)
+    assert digest["case_id"] == 5
+    assert "새 댓글 1건" in digest["body"] and "새 배정 1건" in digest["body"]
+
+
+# ========== deliver_push_batch / retry_push_jobs ==========
+
+
+def _push_results(outcome, status=None, retry_after=None):
+    from services.push import PushResult
+
+    return lambda jobs: [
+        PushResult(job[0], outcome, status, retry_after, f"HTTP {status}" if status else None)
+        for job in jobs
+    ]
+
+
+def _subscribe(db, user):
+    from models import PushSubscription
+
+    sub = PushSubscription(user_id=user.id, endpoint=f"https://push.example.com/{user.id}",
+                           p256dh="k", auth="a")
+    db.add(sub)
+    db.commit()
+    return sub
+
+
+def test_deliver_push_batch_schedules_retry_with_backoff(db_session):
+    """Retryable failures are re-queued, honouring Retry-After over the backoff."""
+    user = _make_user(db_session)
+    _subscribe(db_session, user)
+
+    with patch("tasks.SessionLocal", return_value=db_session), \
+         patch.object(db_session, "close"), \
+         patch("tasks.push_enabled", return_value=True), \
+         patch("tasks.deliver_pushes", side_effect=_push_results("retry", 429, 600)), \
+         patch("tasks.retry_push_jobs") as mock_retry:
+        from tasks import deliver_push_batch
+        result = deliver_push_batch([{"user_id": user.id, "title": "T", "body": "B"}])
+
+    assert result["retrying"] == 1
+    mock_retry.apply_async.assert_called_once()
+    (jobs, attempt), = [mock_retry.apply_async.call_args[0][0]]
+    assert attempt == 1
+    assert jobs[0][1]["endpoint"] == f"https://push.example.com/{user.id}"
+    assert mock_retry.apply_async.call_args[1]["countdown"] == 600
+
+
+def test_retry_push_jobs_dead_letters_after_max_attempts(db_session):
+    """The last failed attempt lands in push_dead_letters instead of retrying."""
+    from models import PushDeadLetter
+    from tasks import PUSH_MAX_RETRIES
+
+    job = [7, {"endpoint": "https://push.example.com/x", "keys": {}}, '{"title": "T"}']
+    with patch("tasks.SessionLocal", return_value=db_session), \
+         patch.object(db_session, "close"), \
+         patch("tasks.push_enabled", return_value=True), \
+         patch("tasks.deliver_pushes", side_effect=_push_results("retry", 503)), \
+         patch("tasks.retry_push_jobs.apply_async") as mock_retry:
+        from tasks import retry_push_jobs
+        result = retry_push_jobs([job], PUSH_MAX_RETRIES - 1)
+
+    assert result["dead_lettered"] == 1
+    mock_retry.assert_not_called()
+    dead = db_session.query(PushDeadLetter).one()
+    assert dead.subscription_id == 7
+    assert dead.last_status == 503
+    assert dead.attempts == PUSH_MAX_RETRIES
+
+
+def test_retry_countdown_is_exponential_and_capped():
+    from tasks import PUSH_RETRY_BASE_SECONDS, PUSH_RETRY_MAX_SECONDS, _retry_countdown
+
+    assert _retry_countdown(0, None) == PUSH_RETRY_BASE_SECONDS
+    assert _retry_countdown(2, None) == PUSH_RETRY_BASE_SECONDS * 4
+    assert _retry_countdown(0, 999) == 999
+    assert _retry_countdown(20, None) == PUSH_RETRY_MAX_SECONDS
+
+
+def test_retry_countdown_honours_retry_after_beyond_cap():
+    from tasks import PUSH_RETRY_MAX_SECONDS, _retry_countdown
+
+    assert _retry_countdown(0, PUSH_RETRY_MAX_SECONDS * 2) == PUSH_RETRY_MAX_SECONDS * 2
+    assert _retry_countdown(20, PUSH_RETRY_MAX_SECONDS + 1) == PUSH_RETRY_MAX_SECONDS + 1
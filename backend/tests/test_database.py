@@ -0,0 +1,179 @@
+"""Engine factory / pool instrumentation 테스트."""
+
+import threading
+
+import pytest
+from sqlalchemy import exc as sa_exc
+from sqlalchemy import text
+
+from database import make_engine
+
+
+def test_make_engine_reads_role_overrides(monkeypatch, tmp_path):
+    monkeypatch.setenv("DB_POOL_SIZE", "3")
+    monkeypatch.setenv("DB_CELERY_POOL_SIZE", "1")
+    monkeypatch.setenv("DB_CELERY_MAX_OVERFLOW", "0")
+
+    api = make_engine(f"sqlite:///{tmp_path}/a.db", "API")
+    celery = make_engine(f"sqlite:///{tmp_path}/a.db", "CELERY")
+
+    assert api.pool.size() == 3
+    assert celery.pool.size() == 1
+    assert celery.pool._max_overflow == 0
+
+
+def test_pool_stats_record_waits_and_timeouts(monkeypatch, tmp_path):
+    monkeypatch.setenv("DB_TEST_POOL_SIZE", "1")
+    monkeypatch.setenv("DB_TEST_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("DB_TEST_POOL_TIMEOUT", "0.2")
+    eng = make_engine(f"sqlite:///{tmp_path}/b.db", "TEST")
+
+    held = eng.connect()
+    released = threading.Timer(0.1, held.close)
+    released.start()
+    with eng.connect() as conn:  # waits until the timer returns the only connection
+        conn.execute(text("SELECT 1"))
+    released.join()
+
+    held = eng.connect()
+    with pytest.raises(sa_exc.TimeoutError):
+        eng.connect()
+    held.close()
+
+    stats = eng.pool.stats()
+    assert stats["checkouts"] >= 3
+    assert stats["timeouts"] == 1
+    assert stats["wait_ms_max"] >= 50
+    assert stats["checked_out"] == 0
+
+
+def test_db_pool_endpoint(client):
+    resp = client.get("/admin/db-pool")
+    assert resp.status_code == 200
+    assert {"checked_out", "overflow", "wait_ms_avg"} <= set(resp.json()["api"])
+    assert "celery" not in resp.json()
+
+
+# ========== Read replica routing ==========
+
+
+def _routed_factory(monkeypatch, wrote_recently):
+    """Run get_read_db with stand-in session factories; return which one it used."""
+    import database
+
+    monkeypatch.setattr(database, "read_engine", object())  # replica configured
+    monkeypatch.setattr(database, "SessionLocal", lambda: _Marker("primary"))
+    monkeypatch.setattr(database, "ReadSessionLocal", lambda: _Marker("replica"))
+    monkeypatch.setattr(database, "_wrote_recently", lambda request: wrote_recently)
+
+    gen = database.get_read_db(request=None)
+    db = next(gen)
+    gen.close()
+    return db.name
+
+
+class _Marker:
+    def __init__(self, name):
+        self.name = name
+
+    def close(self):
+        pass
+
+
+def test_get_read_db_uses_replica(monkeypatch):
+    assert _routed_factory(monkeypatch, wrote_recently=False) == "replica"
+
+
+def test_get_read_db_reads_own_writes_from_primary(monkeypatch):
+    assert _routed_factory(monkeypatch, wrote_recently=True) == "primary"
+
+
+def test_write_marks_user_for_primary_reads(unauth_client, test_user, auth_headers, monkeypatch):
+    """A successful mutation pins that user's reads to the primary."""
+    import main
+    from services.cache import has_recent_write
+
+    monkeypatch.setattr(main, "replica_enabled", lambda: True)
+    assert not has_recent_write(test_user.id)
+
+    resp = unauth_client.post("/products/", json={"name": "RYW"}, headers=auth_headers)
+    assert resp.status_code in (200, 201)
+    assert has_recent_write(test_user.id)
+
+
+def test_write_marker_runs_off_event_loop(unauth_client, auth_headers, monkeypatch):
+    """JWT decoding and the sync Redis call must not block the event loop."""
+    import asyncio
+
+    import main
+
+    threads = []
+
+    def _record(user_id, ttl):
+        try:
+            asyncio.get_running_loop()
+            threads.append("event loop")
+        except RuntimeError:
+            threads.append("worker")
+
+    monkeypatch.setattr(main, "replica_enabled", lambda: True)
+    monkeypatch.setattr(main, "mark_recent_write", _record)
+    unauth_client.post("/products/", json={"name": "Off loop"}, headers=auth_headers)
+    assert threads == ["worker"]
+
+
+class _AsyncMarker(_Marker):
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _routed_async_factory(monkeypatch, wrote_recently):
+    """get_async_read_db counterpart of _routed_factory."""
+    import asyncio
+
+    import database
+
+    monkeypatch.setattr(database, "read_engine", object())
+    monkeypatch.setattr(database, "AsyncSessionLocal", lambda: _AsyncMarker("primary"))
+    monkeypatch.setattr(database, "AsyncReadSessionLocal", lambda: _AsyncMarker("replica"))
+    monkeypatch.setattr(database, "_wrote_recently", lambda request: wrote_recently)
+
+    async def _first():
+        gen = database.get_async_read_db(request=None)
+        db = await gen.__anext__()
+        await gen.aclose()
+        return db.name
+
+    return asyncio.run(_first())
+
+
+def test_get_async_read_db_routing(monkeypatch):
+    assert _routed_async_factory(monkeypatch, wrote_recently=False) == "replica"
+    assert _routed_async_factory(monkeypatch, wrote_recently=True) == "primary"
+
+
+def test_cached_stats_endpoints_compute_on_primary():
+    """Stats are cached under the current version, so a cache miss must not read a lagging replica."""
+    import database
+    from routers.cases import router
+
+    stats_routes = [
+        route for route in router.routes
+        if route.path.startswith(("/cases/statistics", "/cases/my-progress"))
+    ]
+    assert len(stats_routes) == 4
+    for route in stats_routes:
+        calls = {dep.call for dep in route.dependant.dependencies}
+        assert database.get_db in calls
+        assert database.get_read_db not in calls
+
+
+def test_async_url_uses_asyncpg():
+    from database import async_url
+
+    assert async_url("postgresql://u@db/app").drivername == "postgresql+asyncpg"
+    assert async_url("postgresql+psycopg2://u@db/app").drivername == "postgresql+asyncpg"
+    assert async_url("sqlite:///x.db").drivername == "sqlite"
@@ -0,0 +1,139 @@
+"""EXPLAIN 기반 인덱스 회귀 테스트.
+
+시드 데이터에서 enable_seqscan=off로 각 쿼리의 실행 계획을 확인한다.
+쿼리는 앱 코드(case_filters, _my_progress_stmt, _pending_reminders_stmt 등)로
+만들어 postgresql dialect로 컴파일하므로, 앱 쿼리가 바뀌면 테스트도 따라간다.
+사용할 인덱스가 없으면 플래너는 여전히 Seq Scan을 선택하므로 테스트가 실패한다.
+"""
+
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import insert, select, text
+from sqlalchemy.dialects import postgresql
+
+from models import CaseStatus, CSCase, Notification, NotificationType, Product, User, UserRole, case_assignees
+from services import stat_rollups
+from services.case_filters import case_filters
+from services.statistics import _my_progress_stmt, _status_counts_stmt
+from tasks import _pending_reminders_stmt
+
+
+def _case_list(user, **filters):
+    """list_cases' item query (first page)."""
+    return (
+        select(CSCase)
+        .where(*case_filters(user, **filters))
+        .order_by(CSCase.created_at.desc())
+        .limit(20)
+    )
+
+
+# (name, tables that must not be seq-scanned, statement builder taking the seed)
+QUERIES = [
+    (
+        "check_pending_cases",
+        {"cs_cases", "notifications"},
+        lambda seed: _pending_reminders_stmt(datetime.utcnow() - timedelta(hours=24)),
+    ),
+    (
+        "list_cases by status",
+        {"cs_cases"},
+        lambda seed: _case_list(seed.admin, status=CaseStatus.OPEN),
+    ),
+    (
+        "list_cases by product",
+        {"cs_cases"},
+        lambda seed: _case_list(seed.admin, product_id=seed.product.id),
+    ),
+    (
+        "list_cases by requester",
+        {"cs_cases"},
+        lambda seed: _case_list(seed.admin, requester="Cust 3"),
+    ),
+    (
+        "list_cases by assignee",
+        {"cs_cases", "case_assignees", "users"},
+        lambda seed: _case_list(seed.admin, assignee_id=seed.users[1].id),
+    ),
+    (
+        "list_cases non-admin (own cases)",
+        {"cs_cases", "case_assignees"},
+        lambda seed: _case_list(seed.users[3]),
+    ),
+    (
+        "my-progress (own cases, one day)",
+        {"cs_cases", "case_assignees"},
+        lambda seed: _my_progress_stmt(seed.users[3], date.today()),
+    ),
+    (
+        "stat_by_status for an assignee",
+        {"case_stat_daily"},
+        lambda seed: _status_counts_stmt("monthly", None, seed.users[1].id),
+    ),
+]
+
+
+@pytest.fixture()
+def seeded_cases(db_session):
+    # Names match requesters so own_case_ids' requester branch has rows to find
+    users = [
+        User(name=f"Cust {i}", email=f"u{i}@test.com", password_hash="x", role=UserRole.ENGINEER)
+        for i in range(6)
+    ]
+    product = Product(name="Indexed")
+    db_session.add_all([*users, product])
+    db_session.flush()
+
+    now = datetime.utcnow()
+    statuses = list(CaseStatus)
+    case_ids = db_session.execute(
+        insert(CSCase).returning(CSCase.id),
+        [
+            {
+                "title": f"Case {i}",
+                "content": "C",
+                "requester": f"Cust {i % 20}",
+                "product_id": product.id if i % 10 == 0 else None,
+                "status": statuses[i % len(statuses)],
+                "created_at": now - timedelta(hours=i * 3),
+            }
+            for i in range(600)
+        ],
+    ).scalars().all()
+    db_session.execute(
+        insert(case_assignees),
+        [{"case_id": cid, "user_id": users[cid % len(users)].id} for cid in case_ids],
+    )
+    db_session.execute(
+        insert(Notification),
+        [
+            {"user_id": users[0].id, "case_id": cid, "message": "m", "type": NotificationType.REMINDER,
+             "created_at": now - timedelta(hours=cid % 48)}
+            for cid in case_ids[::3]
+        ],
+    )
+    stat_rollups.rebuild(db_session)
+    db_session.commit()
+    for table in ("cs_cases", "case_assignees", "notifications", "case_stat_daily", "users"):
+        db_session.execute(text(f"ANALYZE {table}"))
+    db_session.commit()
+    return SimpleNamespace(admin=SimpleNamespace(role=UserRole.ADMIN), users=users, product=product)
+
+
+def _seq_scans(plan: dict) -> set[str]:
+    found = {plan["Relation Name"]} if plan.get("Node Type") == "Seq Scan" else set()
+    for child in plan.get("Plans", []):
+        found |= _seq_scans(child)
+    return found
+
+
+@pytest.mark.parametrize("name,tables,build", QUERIES, ids=[q[0] for q in QUERIES])
+def test_query_uses_indexes(db_session, seeded_cases, name, tables, build):
+    sql = str(build(seeded_cases).compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = db_session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()[0]["Plan"]
+    db_session.rollback()
+
+    assert not (_seq_scans(plan) & tables), f"{name} falls back to a seq scan:\n{plan}"
@@ -78,3 +78,193 @@ def test_notification_badge_count(client, assignee_user):
         params={"user_id": assignee_user.id, "unread_only": True},
     ).json()
     assert len(unread) == 3
+
+
+# ========== Pagination / unread counter ==========
+
+
+def _make_notifications(db_session, user, n):
+    rows = [
+        Notification(user_id=user.id, message=f"m{i}", type=NotificationType.COMMENT)
+        for i in range(n)
+    ]
+    db_session.add_all(rows)
+    db_session.commit()
+    return [r.id for r in rows]
+
+
+def test_list_notifications_paginates(client, db_session, test_user):
+    ids = _make_notifications(db_session, test_user, 5)
+
+    page1 = client.get("/notifications/", params={"limit": 2}).json()
+    assert [n["id"] for n in page1] == ids[::-1][:2]
+
+    page2 = client.get("/notifications/", params={"limit": 2, "before_id": page1[-1]["id"]}).json()
+    assert [n["id"] for n in page2] == ids[::-1][2:4]
+
+    newer = client.get("/notifications/", params={"since_id": ids[2]}).json()
+    assert {n["id"] for n in newer} == set(ids[3:])
+
+
+def test_pagination_follows_id_when_created_at_disagrees(client, db_session, test_user):
+    """Pages neither skip nor repeat rows whose created_at order differs from id order."""
+    from datetime import datetime, timedelta
+
+    now = datetime.utcnow()
+    rows = [
+        Notification(user_id=test_user.id, message=f"m{i}", type=NotificationType.COMMENT,
+                     created_at=now - timedelta(minutes=(i % 3) * 10))
+        for i in range(7)
+    ]
+    db_session.add_all(rows)
+    db_session.commit()
+    ids = [r.id for r in rows]
+
+    seen, before_id = [], None
+    while True:
+        params = {"limit": 2} if before_id is None else {"limit": 2, "before_id": before_id}
+        page = client.get("/notifications/", params=params).json()
+        if not page:
+            break
+        seen += [n["id"] for n in page]
+        before_id = page[-1]["id"]
+    assert seen == ids[::-1]
+
+
+def test_unread_count_tracks_new_and_read(client, assignee_user, sample_product):
+    """Counter is seeded from the DB, then kept current by tasks and mark_as_read."""
+    def count():
+        return client.get("/notifications/unread-count", params={"user_id": assignee_user.id}).json()["count"]
+
+    assert count() == 0
+    for i in range(2):
+        client.post("/cases/", json={
+            "title": f"Count {i}", "content": "C", "requester": "Cust",
+            "assignee_ids": [assignee_user.id], "product_id": sample_product["id"],
+        })
+    assert count() == 2
+
+    nid = client.get("/notifications/", params={"user_id": assignee_user.id}).json()[0]["id"]
+    client.patch(f"/notifications/{nid}/read")
+    client.patch(f"/notifications/{nid}/read")  # already read: no double decrement
+    assert count() == 1
+
+
+def test_unread_count_falls_back_to_db_when_redis_down(client, assignee_user, sample_product):
+    from unittest.mock import patch
+
+    import redis
+
+    client.post("/cases/", json={
+        "title": "Down", "content": "C", "requester": "Cust",
+        "assignee_ids": [assignee_user.id], "product_id": sample_product["id"],
+    })
+    with patch("services.cache.cache_redis.get", side_effect=redis.ConnectionError), \
+         patch("services.cache.cache_redis.set", side_effect=redis.ConnectionError):
+        resp = client.get("/notifications/unread-count", params={"user_id": assignee_user.id})
+    assert resp.status_code == 200
+    assert resp.json()["count"] == 1
+
+
+def test_seed_unread_count_keeps_existing_counter():
+    """A DB recount never overwrites a counter that adjust_unread_count already moved."""
+    from services.cache import adjust_unread_count, get_unread_count, seed_unread_count
+
+    seed_unread_count(4242, 3)
+    adjust_unread_count(4242, 1)
+    seed_unread_count(4242, 3)
+    assert get_unread_count(4242) == 4
+
+
+# ========== Notification stream (SSE) ==========
+
+
+def test_notification_published_to_stream(client, assignee_user, sample_product):
+    """New notifications are published on the recipient's pub/sub channel."""
+    from unittest.mock import patch
+
+    with patch("tasks.publish_notification") as mock_publish:
+        client.post("/cases/", json={
+            "title": "Stream Test",
+            "content": "Content",
+            "requester": "Cust",
+            "assignee_ids": [assignee_user.id],
+            "product_id": sample_product["id"],
+        })
+
+    mock_publish.assert_called_once()
+    user_id, payload = mock_publish.call_args[0]
+    assert user_id == assignee_user.id
+    assert payload["type"] == "ASSIGNEE"
+    assert payload["is_read"] is False
+
+
+def test_stream_rejects_invalid_ticket(unauth_client, auth_headers):
+    resp = unauth_client.get("/notifications/stream", params={"ticket": "not-a-ticket"})
+    assert resp.status_code == 401
+    # The access token itself is not accepted in the URL
+    token = auth_headers["Authorization"].split()[1]
+    resp = unauth_client.get("/notifications/stream", params={"ticket": token})
+    assert resp.status_code == 401
+
+
+def test_stream_ticket_is_single_use(client, test_user):
+    from services.cache import redeem_stream_ticket
+
+    resp = client.post("/notifications/stream-ticket")
+    assert resp.status_code == 200
+    ticket = resp.json()["ticket"]
+    assert redeem_stream_ticket(ticket) == test_user.id
+    assert redeem_stream_ticket(ticket) is None
+
+
+def test_stream_ticket_requires_auth(unauth_client):
+    assert unauth_client.post("/notifications/stream-ticket").status_code == 401
+
+
+def test_hub_dispatches_only_to_target_user():
+    import asyncio
+
+    from services.notification_stream import NotificationHub
+
+    async def scenario():
+        hub = NotificationHub("redis://unused")
+        hub._ensure_listener = lambda: None  # no Redis in tests
+        mine, other = hub.subscribe(1), hub.subscribe(2)
+        hub.dispatch("notifications:1", '{"id": 10}')
+        assert mine.get_nowait() == '{"id": 10}'
+        assert other.empty()
+        hub.unsubscribe(1, mine)
+        hub.dispatch("notifications:1", '{"id": 11}')
+        assert mine.empty()
+
+    asyncio.run(scenario())
+
+
+# ========== Bulk mark-as-read ==========
+
+
+def test_mark_many_as_read_by_ids(client, db_session, test_user):
+    ids = _make_notifications(db_session, test_user, 3)
+
+    resp = client.patch("/notifications/read", json={"ids": ids[:2]})
+    assert resp.status_code == 200
+    assert resp.json()["updated"] == 2
+
+    unread = client.get("/notifications/", params={"unread_only": True}).json()
+    assert [n["id"] for n in unread] == [ids[2]]
+
+
+def test_mark_many_as_read_up_to_id(client, db_session, test_user, assignee_user):
+    ids = _make_notifications(db_session, test_user, 3)
+    other = _make_notifications(db_session, assignee_user, 1)
+
+    resp = client.patch("/notifications/read", json={"up_to_id": other[0]})
+    assert resp.json()["updated"] == 3  # only the caller's own rows
+    assert client.get("/notifications/unread-count").json()["count"] == 0
+    assert client.patch("/notifications/read", json={"up_to_id": ids[-1]}).json()["updated"] == 0
+
+
+def test_mark_many_as_read_requires_one_selector(client):
+    assert client.patch("/notifications/read", json={}).status_code == 400
+    assert client.patch("/notifications/read", json={"ids": [1], "up_to_id": 1}).status_code == 400
@@ -1,8 +1,15 @@
 """
 Web Push 구독 API + send_push_to_user 유틸리티 테스트.
+전송 엔진은 로컬 stand-in push 서비스로 동시성/처리량을 검증한다.
 """
 
-from unittest.mock import MagicMock, patch
+import base64
+import os
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
 
 import pytest
 
@@ -101,35 +108,40 @@ def _create_subscription(db_session, user_id, endpoint="https://push.example.com
     return sub
 
 
+def _outcomes(outcome):
+    """deliver_pushes side_effect: every job gets the same outcome."""
+    from services.push import PushResult
+
+    return lambda jobs: [PushResult(sub_id, outcome) for sub_id, _, _ in jobs]
+
+
 @patch("services.push.VAPID_PRIVATE_KEY", "fake-private-key")
 @patch("services.push.VAPID_CLAIMS_EMAIL", "mailto:test@example.com")
-@patch("services.push.webpush")
-def test_send_push_success(mock_webpush, db_session, test_user):
+@patch("services.push.deliver_pushes")
+def test_send_push_success(mock_deliver, db_session, test_user):
     """send_push_to_user — 정상 전송."""
     from services.push import send_push_to_user
 
+    mock_deliver.side_effect = _outcomes("sent")
     _create_subscription(db_session, test_user.id)
     _create_subscription(db_session, test_user.id, "https://push.example.com/sub2")
 
     sent = send_push_to_user(db_session, test_user.id, "Title", "Body", 42)
     assert sent == 2
-    assert mock_webpush.call_count == 2
+    mock_deliver.assert_called_once()
+    assert len(mock_deliver.call_args[0][0]) == 2
 
 
 @patch("services.push.VAPID_PRIVATE_KEY", "fake-private-key")
 @patch("services.push.VAPID_CLAIMS_EMAIL", "mailto:test@example.com")
-@patch("services.push.webpush")
-def test_send_push_expired_cleanup(mock_webpush, db_session, test_user):
+@patch("services.push.deliver_pushes")
+def test_send_push_expired_cleanup(mock_deliver, db_session, test_user):
     """send_push_to_user — 410 응답 시 만료 구독 자동 삭제."""
-    from pywebpush import WebPushException
     from services.push import send_push_to_user
 
+    mock_deliver.side_effect = _outcomes("expired")
     _create_subscription(db_session, test_user.id)
 
-    mock_response = MagicMock()
-    mock_response.status_code = 410
-    mock_webpush.side_effect = WebPushException("Gone", response=mock_response)
-
     sent = send_push_to_user(db_session, test_user.id, "Title", "Body", 1)
     assert sent == 0
 
@@ -155,3 +167,194 @@ def test_send_push_no_subscriptions(db_session, test_user):
          patch("services.push.VAPID_CLAIMS_EMAIL", "mailto:t@t.com"):
         sent = send_push_to_user(db_session, test_user.id, "Title", "Body")
     assert sent == 0
+
+
+@patch("services.push.VAPID_PRIVATE_KEY", "fake-private-key")
+@patch("services.push.VAPID_CLAIMS_EMAIL", "mailto:test@example.com")
+@patch("services.push.deliver_pushes")
+def test_send_push_batch_multiple_users(mock_deliver, db_session, test_user, assignee_user):
+    """send_push_batch — 여러 사용자 구독을 한 번에 조회해 전송."""
+    from services.push import send_push_batch
+
+    mock_deliver.side_effect = _outcomes("sent")
+    _create_subscription(db_session, test_user.id)
+    _create_subscription(db_session, assignee_user.id, "https://push.example.com/sub2")
+
+    sent = send_push_batch(db_session, [
+        {"user_id": test_user.id, "title": "T", "body": "B1", "case_id": 1},
+        {"user_id": assignee_user.id, "title": "T", "body": "B2", "case_id": 2},
+    ])
+    assert sent == 2
+    mock_deliver.assert_called_once()
+
+
+# --------------- Delivery engine vs. local stand-in push service ---------------
+
+
+def _b64url(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _vapid_private_key() -> str:
+    from py_vapid import Vapid
+
+    vapid = Vapid()
+    vapid.generate_keys()
+    return _b64url(vapid.private_key.private_numbers().private_value.to_bytes(32, "big"))
+
+
+def _subscription_info(endpoint: str) -> dict:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    public = key.public_key().public_bytes(
+        serialization.Encoding.X962, serialization.PublicFormat.UncompressedPoint,
+    )
+    return {"endpoint": endpoint, "keys": {"p256dh": _b64url(public), "auth": _b64url(os.urandom(16))}}
+
+
+class _StandInPushService(ThreadingHTTPServer):
+    """Records concurrency and client connections; /gone/* answers 410, /busy/* 503."""
+
+    daemon_threads = True
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.received = 0
+        self.client_ports = set()
+        self.authorizations = set()
+        super().__init__(("127.0.0.1", 0), _StandInHandler)
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            server.client_ports.add(self.client_address[1])
+            server.authorizations.add(self.headers.get("Authorization"))
+        time.sleep(server.delay)
+        with server.lock:
+            server.in_flight -= 1
+            server.received += 1
+        if self.path.startswith("/gone"):
+            self.send_response(410)
+        elif self.path.startswith("/busy"):
+            self.send_response(503)
+            self.send_header("Retry-After", "120")
+        else:
+            self.send_response(201)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def push_service():
+    server = _StandInPushService(delay=0.05)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_deliver_pushes_concurrent_with_connection_reuse(push_service):
+    """Pushes run concurrently up to the bound and reuse pooled connections."""
+    from services import push
+
+    base = f"http://127.0.0.1:{push_service.server_port}"
+    jobs = [(i, _subscription_info(f"{base}/sub/{i}"), '{"title": "T"}') for i in range(40)]
+
+    with patch.object(push, "VAPID_PRIVATE_KEY", _vapid_private_key()), \
+         patch.object(push, "VAPID_CLAIMS_EMAIL", "mailto:test@example.com"), \
+         patch.object(push, "PUSH_MAX_PER_ORIGIN", 4):
+        started = time.monotonic()
+        results = push.deliver_pushes(jobs, max_concurrency=8)
+        elapsed = time.monotonic() - started
+
+    assert [(r.subscription_id, r.outcome) for r in results] == [(i, "sent") for i in range(40)]
+    assert push_service.received == 40
+    # Bounded by the per-origin pool, but clearly parallel
+    assert 1 < push_service.max_in_flight <= 4
+    assert elapsed < 40 * push_service.delay / 2
+    # Connections are reused rather than opened per push
+    assert len(push_service.client_ports) <= 4
+    # One signed VAPID header for the single audience
+    assert len(push_service.authorizations) == 1
+
+
+def test_deliver_pushes_reports_expired_and_retryable(push_service):
+    """410 is reported as expired; 503 as retryable with its Retry-After."""
+    from services import push
+
+    base = f"http://127.0.0.1:{push_service.server_port}"
+    jobs = [
+        (1, _subscription_info(f"{base}/sub/1"), "{}"),
+        (2, _subscription_info(f"{base}/gone/2"), "{}"),
+        (3, _subscription_info(f"{base}/busy/3"), "{}"),
+    ]
+    with patch.object(push, "VAPID_PRIVATE_KEY", _vapid_private_key()), \
+         patch.object(push, "VAPID_CLAIMS_EMAIL", "mailto:test@example.com"):
+        results = push.deliver_pushes(jobs)
+
+    assert [(r.subscription_id, r.outcome) for r in results] == [
+        (1, "sent"), (2, "expired"), (3, "retry"),
+    ]
+    assert results[2].status == 503
+    assert results[2].retry_after == 120
+
+
+def test_deliver_pushes_connection_error_is_retryable():
+    """Unreachable push service → retry, not a permanent failure."""
+    from services import push
+
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    jobs = [(1, _subscription_info(f"http://127.0.0.1:{port}/sub/1"), "{}")]
+    with patch.object(push, "VAPID_PRIVATE_KEY", _vapid_private_key()), \
+         patch.object(push, "VAPID_CLAIMS_EMAIL", "mailto:test@example.com"):
+        [result] = push.deliver_pushes(jobs)
+
+    assert result.outcome == "retry"
+    assert result.error
+
+
+def test_parse_retry_after():
+    """Retry-After accepts delta-seconds and HTTP-dates."""
+    from datetime import datetime, timedelta, timezone
+    from email.utils import format_datetime
+
+    from services.push import _parse_retry_after
+
+    assert _parse_retry_after("30") == 30
+    assert _parse_retry_after(None) is None
+    assert _parse_retry_after("garbage") is None
+    when = datetime.now(timezone.utc) + timedelta(seconds=90)
+    assert 80 <= _parse_retry_after(format_datetime(when, usegmt=True)) <= 90
+
+
+def test_vapid_headers_cached_per_audience():
+    """VAPID headers are signed once per audience and reused."""
+    from services.push import VapidHeaderCache
+
+    cache = VapidHeaderCache(_vapid_private_key(), "mailto:test@example.com")
+    with patch.object(cache._vapid, "sign", wraps=cache._vapid.sign) as mock_sign:
+        a1 = cache.headers_for("https://fcm.googleapis.com/fcm/send/a")
+        a2 = cache.headers_for("https://fcm.googleapis.com/fcm/send/b")
+        b1 = cache.headers_for("https://updates.push.services.mozilla.com/wpush/v2/c")
+
+    assert a1 == a2
+    assert a1 != b1
+    assert mock_sign.call_count == 2
@@ -171,6 +171,37 @@ class TestList:
         assert resp.status_code == 200
         assert resp.json()["total"] == 1
 
+    def test_export_csv(self, client, sample_qr):
+        import csv
+        import io
+
+        resp = client.get("/quote-requests/export", params={"search": "Test Org"})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(resp.text)))
+        assert [r["id"] for r in rows] == [str(sample_qr)]
+        assert rows[0]["failed_products"].startswith('[{"user_input"')
+
+    def test_export_ndjson_non_admin_sees_only_assigned(self, client, sample_qr, cs_user, db_session):
+        import json
+
+        from routers.auth import get_current_user
+        from main import app
+
+        app.dependency_overrides[get_current_user] = lambda: cs_user
+        resp = client.get("/quote-requests/export", params={"format": "ndjson"})
+        assert resp.status_code == 200
+        assert resp.text == ""
+
+        qr = db_session.query(QuoteRequest).filter(QuoteRequest.id == sample_qr).first()
+        qr.assignees = [cs_user]
+        db_session.commit()
+
+        resp = client.get("/quote-requests/export", params={"format": "ndjson"})
+        rows = [json.loads(line) for line in resp.text.splitlines()]
+        assert [r["id"] for r in rows] == [sample_qr]
+        assert rows[0]["assignee_names"] == ["CS Staff"]
+
 
 # ---- Detail ----
 
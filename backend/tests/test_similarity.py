@@ -114,3 +114,28 @@ def test_combined_similarity():
     )
     expected = 1.0 * 0.5 + 0.5 * 0.3 + 0.3 * 0.2  # = 0.71
     assert abs(result - expected) < 0.001
+
+
+# ========== Streaming top-N ==========
+
+
+def test_streaming_matches_batch_ranking():
+    """Chunked scoring returns the same top-N as the in-memory path."""
+    from collections import namedtuple
+
+    from services.similarity import find_similar_case_ids_streaming, find_similar_cases
+
+    Row = namedtuple("Row", "id title content tags")
+    rows = [
+        Row(1, "결제 오류 발생", "카드 결제 안됨", ["결제"]),
+        Row(2, "결제 취소 문의", "결제 취소", ["결제", "환불"]),
+        Row(3, "로그인 불가", "비밀번호 오류", ["로그인"]),
+        Row(4, "결제 오류 문의", "결제 오류가 납니다", ["결제", "오류"]),
+    ]
+
+    # No stored model yet → caller must fall back
+    assert find_similar_case_ids_streaming("결제 오류", "카드 결제", ["결제"], rows) is None
+
+    batch = find_similar_cases("결제 오류", "카드 결제", ["결제"], rows, top_n=3)
+    streamed = find_similar_case_ids_streaming("결제 오류", "카드 결제", ["결제"], rows, top_n=3, chunk_size=1)
+    assert [r["case_id"] for r in streamed] == [m["case"].id for m in batch]
@@ -70,3 +70,194 @@ def test_stat_by_time_no_completed(client):
 def test_stat_invalid_by(client):
     resp = client.get("/cases/statistics/", params={"by": "invalid"})
     assert resp.status_code == 400
+
+
+# ========== case_stat_daily rollups ==========
+
+
+def _rollup_rows(db_session):
+    from models import CaseStatDaily
+
+    db_session.expire_all()
+    rows = db_session.query(CaseStatDaily).all()
+    return sorted(
+        (r.day, r.assignee_id, r.open_count, r.in_progress_count, r.done_count, r.cancel_count, r.resolved_count)
+        for r in rows
+        if r.open_count or r.in_progress_count or r.done_count or r.cancel_count
+    )
+
+
+def test_incremental_rollups_match_rebuild(client, db_session, test_user, assignee_user):
+    """±1 maintenance on create/update/status/delete ends where a full rebuild does."""
+    from tasks import rebuild_case_stat_rollups
+
+    a = client.post("/cases/", json={
+        "title": "A", "content": "C", "requester": "Cust", "assignee_ids": [assignee_user.id],
+    }).json()
+    b = client.post("/cases/", json={"title": "B", "content": "C", "requester": "Cust"}).json()
+    c = client.post("/cases/", json={"title": "C", "content": "C", "requester": "Cust"}).json()
+
+    client.patch(f"/cases/{a['id']}/status", json={"status": "DONE"})
+    client.put(f"/cases/{b['id']}", json={"assignee_ids": [assignee_user.id, test_user.id]})
+    client.patch(f"/cases/{b['id']}/status", json={"status": "IN_PROGRESS"})
+    client.put(f"/cases/{b['id']}", json={"assignee_ids": [test_user.id]})
+    assert client.delete(f"/cases/{c['id']}").status_code == 204
+
+    incremental = _rollup_rows(db_session)
+    assert rebuild_case_stat_rollups()["rows"] >= 3
+    assert _rollup_rows(db_session) == incremental
+
+
+def test_stat_period_uses_created_day(client, db_session):
+    from datetime import date, datetime, timedelta
+
+    from models import CSCase
+    from tasks import rebuild_case_stat_rollups
+
+    case_id = client.post("/cases/", json={"title": "Old", "content": "C", "requester": "Cust"}).json()["id"]
+    old_day = date.today() - timedelta(days=40)
+    db_session.query(CSCase).filter(CSCase.id == case_id).update(
+        {CSCase.created_at: datetime(old_day.year, old_day.month, old_day.day, 12, 0)}
+    )
+    db_session.commit()
+    rebuild_case_stat_rollups()
+
+    this_month = client.get("/cases/statistics/", params={"by": "status", "period": "monthly"})
+    assert this_month.json() == []
+    that_day = client.get("/cases/statistics/", params={
+        "by": "status", "period": "daily", "target_date": old_day.isoformat(),
+    })
+    assert that_day.json() == [{"status": "OPEN", "count": 1}]
+
+
+# ========== Redis stats cache ==========
+
+
+def test_statistics_served_from_cache_until_case_change(client, sample_product):
+    from unittest.mock import patch
+
+    client.post("/cases/", json={"title": "S1", "content": "C", "requester": "Cust"})
+    first = client.get("/cases/statistics/", params={"by": "status"}).json()
+
+    with patch("services.statistics._stat_by_status") as mock_compute:
+        assert client.get("/cases/statistics/", params={"by": "status"}).json() == first
+    mock_compute.assert_not_called()
+
+    client.post("/cases/", json={"title": "S2", "content": "C", "requester": "Cust"})
+    after = client.get("/cases/statistics/", params={"by": "status"}).json()
+    assert next(s for s in after if s["status"] == "OPEN")["count"] == 2
+
+
+def test_stats_cache_keys_include_filters(client, assignee_user):
+    client.post("/cases/", json={
+        "title": "A", "content": "C", "requester": "Cust", "assignee_ids": [assignee_user.id],
+    })
+    client.post("/cases/", json={"title": "B", "content": "C", "requester": "Cust"})
+
+    everyone = client.get("/cases/statistics/", params={"by": "status"}).json()
+    mine = client.get("/cases/statistics/", params={"by": "status", "assignee_id": assignee_user.id}).json()
+    assert everyone == [{"status": "OPEN", "count": 2}]
+    assert mine == [{"status": "OPEN", "count": 1}]
+
+
+# ========== /cases/statistics/series ==========
+
+
+def test_stat_series_daily_buckets(client):
+    from datetime import date, timedelta
+
+    client.post("/cases/", json={"title": "Open", "content": "C", "requester": "Cust"})
+    done = client.post("/cases/", json={"title": "Done", "content": "C", "requester": "Cust"}).json()
+    client.patch(f"/cases/{done['id']}/status", json={"status": "DONE"})
+
+    today = date.today()
+    resp = client.get("/cases/statistics/series", params={
+        "bucket": "day", "from": (today - timedelta(days=2)).isoformat(), "to": today.isoformat(),
+    })
+    assert resp.status_code == 200
+    points = resp.json()
+    assert [p["bucket"] for p in points] == [(today - timedelta(days=d)).isoformat() for d in (2, 1, 0)]
+    assert points[0]["open_count"] == 0 and points[0]["avg_hours"] is None
+    assert points[-1]["open_count"] == 1
+    assert points[-1]["done_count"] == 1
+    assert points[-1]["total_completed"] == 1
+    assert points[-1]["avg_hours"] is not None
+
+
+def test_stat_series_month_bucket_starts_on_first(client):
+    resp = client.get("/cases/statistics/series", params={"bucket": "month", "from": "2026-01-15", "to": "2026-03-02"})
+    assert resp.status_code == 200
+    assert [p["bucket"] for p in resp.json()] == ["2026-01-01", "2026-02-01", "2026-03-01"]
+
+
+def test_stat_series_validation(client):
+    bad_bucket = client.get("/cases/statistics/series", params={"bucket": "hour", "from": "2026-01-01", "to": "2026-01-02"})
+    assert bad_bucket.status_code == 400
+    reversed_range = client.get("/cases/statistics/series", params={"from": "2026-01-02", "to": "2026-01-01"})
+    assert reversed_range.status_code == 400
+    too_many = client.get("/cases/statistics/series", params={"from": "2020-01-01", "to": "2026-01-01"})
+    assert too_many.status_code == 400
+
+
+# ========== /cases/statistics/resolution ==========
+
+
+def _complete_case_after(client, db_session, hours, **fields):
+    from datetime import datetime, timedelta
+
+    from models import CSCase
+
+    case_id = client.post("/cases/", json={"title": "R", "content": "C", "requester": "Cust", **fields}).json()["id"]
+    client.patch(f"/cases/{case_id}/status", json={"status": "DONE"})
+    completed = datetime.utcnow()
+    db_session.query(CSCase).filter(CSCase.id == case_id).update(
+        {CSCase.created_at: completed - timedelta(hours=hours), CSCase.completed_at: completed}
+    )
+    db_session.commit()
+
+
+def test_stat_resolution_percentiles_by_priority(client, db_session):
+    for hours in (1, 2, 3, 4, 100):
+        _complete_case_after(client, db_session, hours, priority="HIGH")
+    _complete_case_after(client, db_session, 10, priority="LOW")
+    client.post("/cases/", json={"title": "Open", "content": "C", "requester": "Cust", "priority": "LOW"})
+
+    resp = client.get("/cases/statistics/resolution", params={"group": "priority"})
+    assert resp.status_code == 200
+    high, low = resp.json()
+    assert high["group_name"] == "HIGH" and high["count"] == 5
+    assert high["p50_hours"] == 3.0
+    assert high["p90_hours"] == 61.6
+    assert high["avg_hours"] == 22.0
+    assert low["count"] == 1 and low["p99_hours"] == 10.0
+
+
+def test_stat_resolution_percentiles_by_assignee_and_product(client, db_session, assignee_user, sample_product):
+    _complete_case_after(client, db_session, 5, assignee_ids=[assignee_user.id], product_id=sample_product["id"])
+    _complete_case_after(client, db_session, 7)
+
+    by_assignee = client.get("/cases/statistics/resolution", params={"group": "assignee"}).json()
+    assert [(s["group_id"], s["count"], s["p50_hours"]) for s in by_assignee] == [(assignee_user.id, 1, 5.0)]
+
+    by_product = client.get("/cases/statistics/resolution", params={"group": "product"}).json()
+    assert {(s["group_id"], s["group_name"]) for s in by_product} == {
+        (sample_product["id"], sample_product["name"]),
+        (None, None),
+    }
+
+
+def test_stat_resolution_period_uses_completion_day(client, db_session):
+    from datetime import date, timedelta
+
+    _complete_case_after(client, db_session, 2)
+    today = client.get("/cases/statistics/resolution", params={"group": "priority", "period": "daily"}).json()
+    assert [s["count"] for s in today] == [1]
+    yesterday = client.get("/cases/statistics/resolution", params={
+        "group": "priority", "period": "daily", "target_date": (date.today() - timedelta(days=1)).isoformat(),
+    }).json()
+    assert yesterday == []
+
+
+def test_stat_resolution_invalid_group(client):
+    resp = client.get("/cases/statistics/resolution", params={"group": "status"})
+    assert resp.status_code == 400
@@ -103,3 +103,84 @@ def test_learn_creates_new_tag(client, db_session):
     assert tag is not None
     assert tag.created_by == "user"
     assert tag.usage_count >= 1
+
+
+def test_relearn_on_edit_replaces_contribution(client, db_session):
+    """Editing a case's text re-learns without double counting usage."""
+    resp = client.post("/cases/", json={
+        "title": "결제 오류 발생 문의",
+        "content": "신용카드 결제가 안됩니다",
+        "requester": "Customer",
+        "tags": ["재학습"],
+    })
+    case_id = resp.json()["id"]
+
+    client.put(f"/cases/{case_id}", json={"title": "로그인 오류 문의", "content": "비밀번호 인증 실패"})
+
+    tag = db_session.query(TagMaster).filter(TagMaster.name == "재학습").first()
+    db_session.refresh(tag)
+    assert tag.usage_count == 1
+    assert "카드" not in tag.keyword_weights
+    assert "인증" in tag.keyword_weights
+
+
+def test_relearn_two_quick_edits_applies_each_snapshot(client, db_session):
+    """Tasks queued by back-to-back edits learn their own edit, not the final row."""
+    from unittest.mock import patch
+
+    from tasks import learn_tags_from_case
+
+    resp = client.post("/cases/", json={
+        "title": "결제 오류 발생 문의",
+        "content": "신용카드 결제가 안됩니다",
+        "requester": "Customer",
+        "tags": ["연속수정"],
+    })
+    case_id = resp.json()["id"]
+
+    # Hold both tasks until after the second edit, as a busy worker would
+    with patch("routers.cases.learn_tags_from_case") as mock_learn:
+        client.put(f"/cases/{case_id}", json={"title": "배송 지연 문의", "content": "택배 도착 안함"})
+        client.put(f"/cases/{case_id}", json={"title": "로그인 오류 문의", "content": "비밀번호 인증 실패"})
+    for call in mock_learn.delay.call_args_list:
+        learn_tags_from_case(*call.args)
+
+    tag = db_session.query(TagMaster).filter(TagMaster.name == "연속수정").first()
+    db_session.refresh(tag)
+    assert tag.usage_count == 1
+    assert "카드" not in tag.keyword_weights
+    assert "택배" not in tag.keyword_weights
+    assert tag.keyword_weights["인증"] == 1
+
+
+def test_status_only_edit_skips_learning(client, db_session):
+    """Updating non-text fields does not touch TagMaster."""
+    resp = client.post("/cases/", json={
+        "title": "결제 오류 발생 문의",
+        "content": "신용카드 결제가 안됩니다",
+        "requester": "Customer",
+        "tags": ["우선순위만"],
+    })
+    case_id = resp.json()["id"]
+
+    client.put(f"/cases/{case_id}", json={"priority": "HIGH"})
+
+    tag = db_session.query(TagMaster).filter(TagMaster.name == "우선순위만").first()
+    db_session.refresh(tag)
+    assert tag.usage_count == 1
+
+
+def test_unlearn_counts_only_removed_weights(db_session):
+    """unlearn_from_case reports weights dropped, not keywords extracted."""
+    from services.tag_service import extract_keywords, learn_from_case, unlearn_from_case
+
+    learn_from_case(["언런"], "결제 오류", "", db_session)
+    learn_from_case(["언런"], "결제 문의", "", db_session)
+    dropped = set(extract_keywords("결제 오류")) - set(extract_keywords("결제 문의"))
+
+    removed = unlearn_from_case(["언런"], "결제 오류", "", db_session)
+    assert removed == len(dropped)
+
+    tag = db_session.query(TagMaster).filter(TagMaster.name == "언런").first()
+    assert tag.keyword_weights.get("결제") == 1
+    assert unlearn_from_case(["없는태그"], "결제 오류", "", db_session) == 0
@@ -6,6 +6,14 @@ export const getCases = (params = {}) => {
   return client.get('/cases', { params: { page, page_size, ...filters } });
 };
 
+/** CS Case 내보내기 (format: csv | ndjson, 목록과 같은 필터) — Blob 응답 */
+export const exportCases = ({ format = 'csv', ...filters } = {}) =>
+  client.get('/cases/export', { params: { format, ...filters }, responseType: 'blob' });
+
+/** CS Case 일괄 변경 ({ case_ids, status?, assignee_ids?, add_tags?, remove_tags? }) */
+export const bulkUpdateCases = (data) =>
+  client.post('/cases/bulk', data);
+
 /** CS Case 단건 조회 */
 export const getCase = (id) =>
   client.get(`/cases/${id}`);
@@ -62,6 +70,16 @@ export const updateChecklist = (checklistId, is_done) =>
 export const getStatistics = (by, { period, targetDate, assigneeId } = {}) =>
   client.get('/cases/statistics', { params: { by, period: period || undefined, target_date: targetDate || undefined, assignee_id: assigneeId || undefined } });
 
+/** 기간별 통계 시계열 (bucket: day | week | month, from/to: YYYY-MM-DD) — 차트 1회 요청 */
+export const getStatisticsSeries = ({ bucket = 'day', from, to, assigneeId } = {}) =>
+  client.get('/cases/statistics/series', { params: { bucket, from, to, assignee_id: assigneeId || undefined } });
+
+/** 처리시간 백분위수 (group: assignee | product | priority) */
+export const getResolutionPercentiles = ({ group, period, targetDate } = {}) =>
+  client.get('/cases/statistics/resolution', {
+    params: { group, period: period || undefined, target_date: targetDate || undefined },
+  });
+
 /** 현재 사용자의 상태별 케이스 수 조회 (날짜별) */
 export const getMyProgress = (targetDate) =>
   client.get('/cases/my-progress', { params: { target_date: targetDate || undefined } });
@@ -1,9 +1,29 @@
-import client from './client';
+import client, { API_BASE } from './client';
 
-/** 알림 목록 조회 (user_id, unread_only 필터 지원) */
+/** 알림 목록 조회 (user_id, unread_only, limit, before_id, since_id 지원) */
 export const getNotifications = (params = {}) =>
   client.get('/notifications', { params });
 
+/** 미읽음 알림 개수 */
+export const getUnreadCount = () =>
+  client.get('/notifications/unread-count');
+
 /** 알림 읽음 처리 */
 export const markAsRead = (notificationId) =>
   client.patch(`/notifications/${notificationId}/read`);
+
+/** 여러 알림 일괄 읽음 처리 ({ ids } 또는 { up_to_id }) */
+export const markManyAsRead = (body) =>
+  client.patch('/notifications/read', body);
+
+/**
+ * 새 알림 SSE 스트림 연결.
+ * EventSource는 헤더를 보낼 수 없으므로 1회용 단기 티켓을 발급받아 쿼리로 전달한다
+ * (액세스 토큰은 URL에 넣지 않음). 티켓은 재사용할 수 없어 재연결 시 새로 발급해야 한다.
+ */
+export const openNotificationStream = async () => {
+  const { data } = await client.post('/notifications/stream-ticket');
+  return new EventSource(
+    `${API_BASE}/notifications/stream?ticket=${encodeURIComponent(data.ticket)}`
+  );
+};
@@ -6,6 +6,10 @@ export const getQuoteRequests = (params = {}) => {
   return client.get('/quote-requests/', { params: { page, page_size, ...filters } });
 };
 
+/** Quote Request 내보내기 (format: csv | ndjson, filters: status, search) — Blob 응답 */
+export const exportQuoteRequests = ({ format = 'csv', ...filters } = {}) =>
+  client.get('/quote-requests/export', { params: { format, ...filters }, responseType: 'blob' });
+
 /** Quote Request 단건 조회 */
 export const getQuoteRequest = (id) =>
   client.get(`/quote-requests/${id}`);
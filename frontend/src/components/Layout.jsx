@@ -1,15 +1,17 @@
 import { useEffect, useState, useRef, useCallback } from 'react';
 import { NavLink, Outlet, useNavigate } from 'react-router-dom';
 import { useAuth } from '../contexts/AuthContext';
-import { getNotifications, markAsRead } from '../api/notifications';
+import {
+  getNotifications, getUnreadCount, markAsRead, markManyAsRead, openNotificationStream,
+} from '../api/notifications';
 import { subscribePush, unsubscribePush, getPushSubscription } from '../api/push';
 import { ROLES } from '../constants/roles';
 import './Layout.css';
 
-const POLL_INTERVAL = 30_000; // 30초 주기 fetch
 const NOTIFICATION_TITLE = 'CS Dashboard';
+const STREAM_RETRY_MS = 5000;
 
-/** 폴링으로 감지한 새 알림을 OS 알림으로 표시 (FCM 미전달 대비 fallback) */
+/** 스트림으로 받은 새 알림을 OS 알림으로 표시 (FCM 미전달 대비 fallback) */
 function showOSNotification(notification) {
   if (!('Notification' in window) || Notification.permission !== 'granted') return;
 
@@ -53,6 +55,7 @@ export default function Layout() {
   const navigate = useNavigate();
   const { user, logout } = useAuth();
   const [notifications, setNotifications] = useState([]);
+  const [unreadCount, setUnreadCount] = useState(0);
   const [panelOpen, setPanelOpen] = useState(false);
   const [pushEnabled, setPushEnabled] = useState(false);
   const [pushPermission, setPushPermission] = useState(
@@ -64,7 +67,10 @@ export default function Layout() {
   const fetchNotifications = useCallback(async () => {
     if (!user?.id) return;
     try {
-      const res = await getNotifications({ user_id: user.id, unread_only: false });
+      const [res, countRes] = await Promise.all([
+        getNotifications({ user_id: user.id, unread_only: false }),
+        getUnreadCount(),
+      ]);
       const data = res.data;
 
       // 첫 로드 시 기존 ID를 모두 seen 처리 (페이지 새로고침 시 중복 알림 방지)
@@ -81,8 +87,9 @@ export default function Layout() {
       }
 
       setNotifications(data);
+      setUnreadCount(countRes.data.count);
     } catch {
-      // 실패 시 무시 — 백그라운드 폴링이므로
+      // 실패 시 무시 — 스트림 재연결 시 다시 동기화
     }
   }, [user?.id]);
 
@@ -109,14 +116,57 @@ export default function Layout() {
     }
   }, [pushEnabled]);
 
-  // 초기 로드 + 주기적 폴링
+  // 초기 로드 + SSE 스트림으로 새 알림 수신
   useEffect(() => {
-    fetchNotifications();
-    const timer = setInterval(fetchNotifications, POLL_INTERVAL);
-    return () => clearInterval(timer);
-  }, [fetchNotifications]);
+    if (!user?.id) return undefined;
+    let source = null;
+    let retryTimer = null;
+    let closed = false;
 
-  const unreadCount = notifications.filter((n) => !n.is_read).length;
+    // 티켓은 1회용이라 EventSource 자동 재연결 대신 새 티켓으로 직접 재연결
+    const reconnect = () => {
+      source?.close();
+      if (!closed) retryTimer = setTimeout(connect, STREAM_RETRY_MS);
+    };
+
+    const connect = async () => {
+      try {
+        source = await openNotificationStream();
+      } catch {
+        reconnect();
+        return;
+      }
+      if (closed) {
+        source.close();
+        return;
+      }
+      // (재)연결 시 한 번 동기화 — 끊겨 있던 동안 놓친 알림 보정
+      source.onopen = () => fetchNotifications();
+      source.onerror = reconnect;
+      source.addEventListener('notification', handleStreamEvent);
+    };
+
+    const handleStreamEvent = (event) => {
+      let notification;
+      try {
+        notification = JSON.parse(event.data);
+      } catch {
+        return;
+      }
+      if (seenIdsRef.current.has(notification.id)) return;
+      seenIdsRef.current.add(notification.id);
+      showOSNotification(notification);
+      setNotifications((prev) => [notification, ...prev]);
+      setUnreadCount((c) => c + 1);
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      clearTimeout(retryTimer);
+      source?.close();
+    };
+  }, [user?.id, fetchNotifications]);
 
   const handleMarkRead = async (notification) => {
     if (notification.is_read) return;
@@ -125,6 +175,7 @@ export default function Layout() {
       setNotifications((prev) =>
         prev.map((n) => (n.id === notification.id ? { ...n, is_read: true } : n))
       );
+      setUnreadCount((c) => Math.max(c - 1, 0));
     } catch {
       // 무시
     }
@@ -142,10 +193,12 @@ export default function Layout() {
   };
 
   const handleMarkAllRead = async () => {
-    const unread = notifications.filter((n) => !n.is_read);
+    if (notifications.length === 0) return;
+    const upToId = Math.max(...notifications.map((n) => n.id));
     try {
-      await Promise.all(unread.map((n) => markAsRead(n.id)));
+      await markManyAsRead({ up_to_id: upToId });
       setNotifications((prev) => prev.map((n) => ({ ...n, is_read: true })));
+      setUnreadCount(0);
     } catch {
       // 무시
     }